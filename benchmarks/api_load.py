@@ -0,0 +1,372 @@
+"""
+Load test of the /api/cards routes with a configurable read/write mix.
+
+Starts `app.main:app` under uvicorn against a fresh database seeded with cards in
+every category, drives a weighted mix of requests over every cards route for a
+fixed duration and reports throughput plus p50/p95/p99 latency per operation.
+The results can be written to a JSON baseline and compared with an earlier one.
+
+Usage:
+    PYTHONPATH=src python benchmarks/api_load.py --json baseline.json
+    PYTHONPATH=src python benchmarks/api_load.py --baseline baseline.json
+    PYTHONPATH=src python benchmarks/api_load.py --postgres --mix read_category=80,create=20
+    PYTHONPATH=src python benchmarks/api_load.py --db-url postgresql://...
+    PYTHONPATH=src python benchmarks/api_load.py --postgres --workers 4
+
+Without --db-url or --postgres a temporary SQLite database is used. --postgres
+starts a throwaway PostgreSQL container (needs docker). The tables of --db-url are
+dropped and re-created. With --baseline the run exits with status 1 when an
+operation lost more throughput or gained more p95 latency than --tolerance.
+--workers N serves through the production launcher with N worker processes, to
+compare throughput across core counts.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from harness import (
+    CATEGORIES,
+    app_server,
+    ephemeral_postgres,
+    free_port,
+    percentile,
+    seed,
+    sqlite_database,
+)
+
+DEFAULT_MIX = {
+    "read_category": 50,
+    "read_all": 10,
+    "read_page": 10,
+    "sample": 5,
+    "read_ndjson": 5,
+    "create": 8,
+    "edit": 7,
+    "delete": 3,
+    "bulk": 2,
+}
+BULK_SIZE = 50
+
+
+class Workload:
+    """
+    Issues one request per operation of the mix.
+
+    Edits target the lower half of the seeded ids; deletes consume the upper half,
+    so neither runs into cards removed earlier in the run.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        seeded: int,
+        rng: random.Random,
+        counter: itertools.count,
+        deletable: list[int],
+    ):
+        self.client = client
+        self.seeded = seeded
+        self.rng = rng
+        self.counter = counter
+        self.deletable = deletable
+
+    def new_card(self) -> dict:
+        n = next(self.counter)
+        return {
+            "front_text": f"Bench question {n}?",
+            "back_text": f"Bench answer {n}",
+            "category": self.rng.choice(CATEGORIES),
+        }
+
+    async def read_category(self) -> httpx.Response:
+        return await self.client.get(f"/api/cards/{self.rng.choice(CATEGORIES)}")
+
+    async def read_all(self) -> httpx.Response:
+        return await self.client.get("/api/cards/")
+
+    async def read_page(self) -> httpx.Response:
+        after = self.rng.randrange(self.seeded)
+        category = self.rng.choice(CATEGORIES)
+        return await self.client.get(
+            f"/api/cards/{category}", params={"limit": 100, "after": after}
+        )
+
+    async def read_ndjson(self) -> httpx.Response:
+        return await self.client.get(
+            f"/api/cards/{self.rng.choice(CATEGORIES)}",
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+    async def sample(self) -> httpx.Response:
+        return await self.client.get(
+            f"/api/cards/{self.rng.choice(CATEGORIES)}/sample", params={"n": 20}
+        )
+
+    async def create(self) -> httpx.Response:
+        return await self.client.post("/api/cards/", json=self.new_card())
+
+    async def edit(self) -> httpx.Response:
+        card_id = self.rng.randint(1, self.seeded // 2)
+        return await self.client.patch(
+            f"/api/cards/{card_id}",
+            json={"back_text": f"Edited answer {next(self.counter)}"},
+        )
+
+    async def delete(self) -> httpx.Response:
+        if not self.deletable:
+            return await self.create()
+        card_id = self.deletable.pop()
+        return await self.client.delete(f"/api/cards/{card_id}")
+
+    async def bulk(self) -> httpx.Response:
+        cards = [self.new_card() for _ in range(BULK_SIZE)]
+        return await self.client.post("/api/cards/bulk", json=cards)
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(
+                f"unknown operation {name!r}, expected one of {', '.join(DEFAULT_MIX)}"
+            )
+        mix[name] = int(weight)
+    return mix
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000 if latencies else None,
+        "p95_ms": percentile(latencies, 95) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 99) * 1000 if latencies else None,
+    }
+
+
+async def drive(
+    base_url: str,
+    seeded: int,
+    mix: dict[str, int],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed_value: int,
+) -> dict:
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    latencies = {name: [] for name in names}
+    errors = dict.fromkeys(names, 0)
+    limits = httpx.Limits(max_connections=concurrency)
+    # Shared by all users so every created card has a unique front_text.
+    counter = itertools.count()
+    deletable = list(range(seeded // 2 + 1, seeded + 1))
+    random.Random(seed_value).shuffle(deletable)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+
+        async def user(worker: int, until: float, record: bool) -> None:
+            rng = random.Random(seed_value * 1000 + worker)
+            workload = Workload(client, seeded, rng, counter, deletable)
+            while time.monotonic() < until:
+                name = rng.choices(names, weights)[0]
+                started = time.perf_counter()
+                try:
+                    response = await getattr(workload, name)()
+                    failed = response.is_error
+                except httpx.HTTPError:
+                    failed = True
+                if not record:
+                    continue
+                if failed:
+                    errors[name] += 1
+                else:
+                    latencies[name].append(time.perf_counter() - started)
+
+        if warmup:
+            until = time.monotonic() + warmup
+            await asyncio.gather(*(user(w, until, False) for w in range(concurrency)))
+
+        started = time.perf_counter()
+        until = time.monotonic() + duration
+        await asyncio.gather(*(user(w, until, True) for w in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    operations = {
+        name: summarize(latencies[name], errors[name], elapsed) for name in names
+    }
+    overall = summarize(
+        [sample for samples in latencies.values() for sample in samples],
+        sum(errors.values()),
+        elapsed,
+    )
+    return {"overall": overall, "operations": operations}
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Returns a line for every operation that regressed beyond the tolerance."""
+    regressions = []
+    rows = {"overall": current["overall"], **current["operations"]}
+    baseline_rows = {"overall": baseline["overall"], **baseline["operations"]}
+    for name, row in rows.items():
+        before = baseline_rows.get(name)
+        if not before or not before["requests"] or not row["requests"]:
+            continue
+        if row["throughput_rps"] < before["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {before['throughput_rps']:.1f} -> "
+                f"{row['throughput_rps']:.1f} req/s"
+            )
+        if row["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {before['p95_ms']:.2f} -> {row['p95_ms']:.2f} ms"
+            )
+    return regressions
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    database = parser.add_mutually_exclusive_group()
+    database.add_argument(
+        "--db-url", help="Database to benchmark; its tables are dropped."
+    )
+    database.add_argument(
+        "--postgres", action="store_true", help="Use a throwaway PostgreSQL container."
+    )
+    parser.add_argument("--cards-per-category", type=int, default=1000)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Weights per operation, e.g. read_category=80,create=20.",
+    )
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--warmup", type=float, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--async-db", action="store_true", help="Serve the routes with DB_ASYNC=true."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Serve with `python -m app.server` and this many worker processes.",
+    )
+    parser.add_argument("--json", help="Write the results to this file as JSON.")
+    parser.add_argument("--baseline", help="Compare with results from an earlier run.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="Allowed relative loss of throughput or gain of p95 latency.",
+    )
+    args = parser.parse_args()
+
+    if args.db_url:
+        database_context = contextlib.nullcontext(args.db_url)
+    elif args.postgres:
+        database_context = ephemeral_postgres()
+    else:
+        database_context = sqlite_database()
+
+    log_path = os.path.join(tempfile.gettempdir(), "flipcards-bench-server.log")
+    with database_context as db_url:
+        seeded = seed(db_url, args.cards_per_category)
+        env = {
+            "DATABASE_URL": db_url,
+            "DB_ASYNC": "true" if args.async_db else "false",
+            "AWS_EC2_METADATA_DISABLED": "true",
+        }
+        with app_server(free_port(), env, log_path, workers=args.workers) as base_url:
+            result = asyncio.run(
+                drive(
+                    base_url,
+                    seeded,
+                    args.mix,
+                    args.concurrency,
+                    args.duration,
+                    args.warmup,
+                    args.seed,
+                )
+            )
+        backend = db_url.split(":", 1)[0]
+
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "config": {
+            "database": backend,
+            "async_db": args.async_db,
+            "workers": args.workers,
+            "cards": seeded,
+            "mix": args.mix,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "seed": args.seed,
+        },
+        **result,
+    }
+
+    print(
+        f"{'operation':<14} {'requests':>9} {'errors':>7} {'req/s':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    for name, row in {"overall": results["overall"], **results["operations"]}.items():
+        if not row["requests"]:
+            print(f"{name:<14} {0:>9} {row['errors']:>7}")
+            continue
+        print(
+            f"{name:<14} {row['requests']:>9} {row['errors']:>7} "
+            f"{row['throughput_rps']:>9.1f} {row['p50_ms']:>9.2f} "
+            f"{row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("config") != results["config"]:
+            print("\nNote: the baseline was recorded with a different configuration.")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\nRegressions against {baseline.get('commit') or args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {baseline.get('commit') or args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Compares seeding a deck card by card through `create_card` with `import_cards`.
+
+`create_card` runs a duplicate check, an INSERT, a commit and a refresh per card;
+`import_cards` validates once, checks duplicates per chunk and inserts in chunks
+inside a single transaction.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bulk_import.py
+    PYTHONPATH=src python benchmarks/bulk_import.py --sizes 1000 10000 --db-url postgresql://...
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.crud import create_card, import_cards
+from app.models import Base
+from app.schemas import FlipCardCreate
+from app.utils.s3_logger import s3_logger
+from harness import NullS3Client
+
+
+def make_cards(size: int) -> list[FlipCardCreate]:
+    categories = ["OOP", "DSA", "WEB", "DOCKER", "LINUX"]
+    return [
+        FlipCardCreate(
+            front_text=f"Question {i}?",
+            back_text=f"Answer number {i}",
+            category=categories[i % len(categories)],
+        )
+        for i in range(size)
+    ]
+
+
+def loop_import(db, cards: list[FlipCardCreate]) -> None:
+    for card in cards:
+        create_card(db=db, card_data=card)
+
+
+def bulk_import(db, cards: list[FlipCardCreate]) -> None:
+    result = import_cards(db=db, cards=cards)
+    assert result.created == len(cards)
+
+
+def measure(fn, db_url: str, cards: list[FlipCardCreate]) -> float:
+    engine = create_engine(db_url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autoflush=False, bind=engine)()
+    try:
+        started = time.perf_counter()
+        fn(db, cards)
+        return time.perf_counter() - started
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument(
+        "--db-url",
+        default="sqlite:///"
+        + os.path.join(tempfile.gettempdir(), "flipcards_bulk_import.db"),
+        help="Database to benchmark against; its tables are dropped.",
+    )
+    parser.add_argument("--json", help="Write the results to this file as JSON.")
+    args = parser.parse_args()
+
+    s3_logger.s3_client = NullS3Client()
+    results = []
+    for size in args.sizes:
+        cards = make_cards(size)
+        for name, fn in (
+            ("create_card loop", loop_import),
+            ("import_cards", bulk_import),
+        ):
+            elapsed = measure(fn, args.db_url, cards)
+            results.append(
+                {
+                    "cards": size,
+                    "path": name,
+                    "seconds": elapsed,
+                    "cards_per_second": size / elapsed,
+                }
+            )
+    s3_logger.close()
+
+    print(f"{'cards':>8} {'path':<18} {'seconds':>10} {'cards/s':>12}")
+    for row in results:
+        print(
+            f"{row['cards']:>8} {row['path']:<18} {row['seconds']:>10.3f} "
+            f"{row['cards_per_second']:>12.1f}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
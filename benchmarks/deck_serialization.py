@@ -0,0 +1,137 @@
+"""
+Compares the ORM + Pydantic deck path with the pre-encoded JSON fast path.
+
+The legacy path mirrors what FastAPI does for a `response_model` route: load
+ORM rows, build FlipCardResponse models, re-validate them against the response
+model and encode the result. The fast path selects only the response columns
+and encodes them straight to bytes; the cached variant serves the bytes from
+the deck cache.
+
+Usage:
+    PYTHONPATH=src python benchmarks/deck_serialization.py
+    PYTHONPATH=src python benchmarks/deck_serialization.py --sizes 100 10000 --repeat 50
+"""
+
+import argparse
+import json
+import math
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.crud import get_all_cards_from_category, get_deck_json, load_deck_json
+from app.models import Base, FlipCard
+from app.schemas import FlipCardResponse
+from app.utils.deck_cache import deck_cache
+
+CATEGORY = "OOP"
+response_adapter = TypeAdapter(list[FlipCardResponse])
+
+
+def legacy_path(db) -> bytes:
+    cards = get_all_cards_from_category(db=db, category=CATEGORY)
+    validated = response_adapter.validate_python(cards, from_attributes=True)
+    content = response_adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def fast_path(db) -> bytes:
+    return load_deck_json(db=db, category=CATEGORY).body
+
+
+def cached_fast_path(db) -> bytes:
+    return get_deck_json(db=db, category=CATEGORY).body
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(fn, db, repeat: int) -> dict:
+    fn(db)  # warm up
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(repeat):
+        call_started = time.perf_counter()
+        fn(db)
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "throughput_rps": repeat / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def seed(db, size: int) -> None:
+    rows = [
+        {
+            "front_text": f"Question {i}?",
+            "back_text": f"Answer number {i}",
+            "category": CATEGORY,
+        }
+        for i in range(size)
+    ]
+    db.execute(insert(FlipCard), rows)
+    db.commit()
+
+
+def run(sizes: list[int], repeat: int) -> list[dict]:
+    results = []
+    for size in sizes:
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        seed(db, size)
+        deck_cache.clear()
+
+        assert json.loads(legacy_path(db)) == json.loads(fast_path(db))
+
+        # Keep the slow path from dominating the run on large decks.
+        size_repeat = max(3, min(repeat, 2_000_000 // size))
+        for name, fn in (
+            ("legacy", legacy_path),
+            ("fast", fast_path),
+            ("fast_cached", cached_fast_path),
+        ):
+            result = measure(fn, db, size_repeat)
+            results.append({"deck_size": size, "path": name, **result})
+
+        db.close()
+        engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--json", help="Write the results to this file as JSON.")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+
+    print(f"{'deck':>8} {'path':<12} {'req/s':>12} {'p50 ms':>10} {'p99 ms':>10}")
+    for row in results:
+        print(
+            f"{row['deck_size']:>8} {row['path']:<12} {row['throughput_rps']:>12.1f} "
+            f"{row['p50_ms']:>10.3f} {row['p99_ms']:>10.3f}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measures image processing throughput inline and in the worker process pool.
+
+A set of synthetic photos is processed once inline (in the calling process,
+like the old S3Service.process_image) and then through ImageProcessor with a
+growing number of worker processes. Throughput is reported as images/second,
+so the scaling across cores is visible.
+
+Usage:
+    PYTHONPATH=src python benchmarks/image_processing.py
+    PYTHONPATH=src python benchmarks/image_processing.py --workers 1 2 4 8 --size 4000x3000
+"""
+
+import argparse
+import io
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from app.utils.image_processing import ImageProcessor, transform_image
+
+
+def make_photo(width: int, height: int, seed: int) -> bytes:
+    noise = Image.effect_noise((width, height), 40 + seed % 20)
+    gradient = Image.linear_gradient("L").resize((width, height))
+    photo = Image.merge(
+        "RGB", (noise, gradient, gradient.transpose(Image.FLIP_LEFT_RIGHT))
+    )
+    output = io.BytesIO()
+    photo.save(output, format="JPEG", quality=92)
+    return output.getvalue()
+
+
+def run_inline(images: list[bytes]) -> float:
+    started = time.perf_counter()
+    for image in images:
+        transform_image(image)
+    return time.perf_counter() - started
+
+
+def run_pool(images: list[bytes], workers: int) -> float:
+    processor = ImageProcessor(
+        max_workers=workers, max_pending=len(images), timeout=300
+    )
+    try:
+        # Start the worker processes before timing.
+        with ThreadPoolExecutor(max_workers=workers) as warmup:
+            list(warmup.map(processor.process, images[:workers]))
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers * 2) as callers:
+            list(callers.map(processor.process, images))
+        return time.perf_counter() - started
+    finally:
+        processor.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--images", type=int, default=40)
+    parser.add_argument(
+        "--size", default="3000x2000", help="WIDTHxHEIGHT of the photos"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+    )
+    parser.add_argument("--json", help="Write the results to this file as JSON.")
+    args = parser.parse_args()
+
+    width, height = (int(value) for value in args.size.lower().split("x"))
+    images = [make_photo(width, height, seed) for seed in range(args.images)]
+
+    results = [{"mode": "inline", "workers": 0, "seconds": run_inline(images)}]
+    for workers in args.workers:
+        results.append(
+            {"mode": "pool", "workers": workers, "seconds": run_pool(images, workers)}
+        )
+    for row in results:
+        row["images"] = args.images
+        row["images_per_second"] = args.images / row["seconds"]
+
+    print(f"{args.images} photos of {width}x{height}, {os.cpu_count()} cores")
+    print(f"{'mode':<8} {'workers':>8} {'seconds':>10} {'images/s':>10}")
+    for row in results:
+        print(
+            f"{row['mode']:<8} {row['workers']:>8} {row['seconds']:>10.3f} "
+            f"{row['images_per_second']:>10.1f}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
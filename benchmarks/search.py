@@ -0,0 +1,180 @@
+"""
+Measures card search latency on a large synthetic corpus.
+
+Seeds a database with cards whose words follow a Zipf distribution over a
+generated vocabulary, then times `crud.search_cards` for several kinds of
+queries: a rare word, a common word, a rare and a common word together, a
+misspelled word and a rare word within one category. On SQLite the in-process
+inverted index is used (its build time is reported separately); on PostgreSQL
+the tsvector GIN and pg_trgm indexes of migration v0004.
+
+Usage:
+    PYTHONPATH=src python benchmarks/search.py --cards 100000
+    PYTHONPATH=src python benchmarks/search.py --postgres --json search.json
+    PYTHONPATH=src python benchmarks/search.py --db-url postgresql://... --target-ms 10
+
+The tables of --db-url are dropped and re-created.
+"""
+
+import argparse
+import contextlib
+import json
+import random
+import string
+import time
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.crud import search_cards
+from app.migrations.runner import run_migrations
+from app.models import Base, FlipCard
+from harness import CATEGORIES, ephemeral_postgres, percentile, sqlite_database
+
+VOCABULARY_SIZE = 50000
+INSERT_CHUNK = 10000
+
+
+def make_vocabulary(rng: random.Random, size: int) -> list[str]:
+    words = set()
+    while len(words) < size:
+        length = rng.randint(4, 11)
+        words.add("".join(rng.choices(string.ascii_lowercase, k=length)))
+    return sorted(words, key=lambda _: rng.random())
+
+
+def make_rows(rng: random.Random, vocabulary: list[str], cards: int):
+    # Zipf-like weights: the first words are by far the most common.
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    for start in range(0, cards, INSERT_CHUNK):
+        count = min(INSERT_CHUNK, cards - start)
+        words = rng.choices(vocabulary, weights, k=count * 20)
+        yield [
+            {
+                "front_text": f"{' '.join(words[i * 20 : i * 20 + 7])} {start + i}?",
+                "back_text": " ".join(words[i * 20 + 7 : i * 20 + 20]),
+                "category": CATEGORIES[(start + i) % len(CATEGORIES)],
+            }
+            for i in range(count)
+        ]
+
+
+def make_queries(rng: random.Random, vocabulary: list[str], count: int) -> dict:
+    common = vocabulary[:20]
+    # Words ranked a few thousand down: in a few hundred cards each.
+    rare = vocabulary[2000:20000]
+
+    def misspell(word: str) -> str:
+        position = rng.randrange(1, len(word) - 1)
+        return word[:position] + word[position + 1 :]
+
+    long_rare = [word for word in rare if len(word) >= 7]
+    return {
+        "rare": [(rng.choice(rare), None) for _ in range(count)],
+        "common": [(rng.choice(common), None) for _ in range(count)],
+        "rare_and_common": [
+            (f"{rng.choice(rare)} {rng.choice(common)}", None) for _ in range(count)
+        ],
+        "typo": [(misspell(rng.choice(long_rare)), None) for _ in range(count)],
+        "rare_in_category": [
+            (rng.choice(rare), rng.choice(CATEGORIES)) for _ in range(count)
+        ],
+    }
+
+
+def seed(db_url: str, cards: int, rng: random.Random, vocabulary: list[str]) -> None:
+    engine = create_engine(db_url)
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS schema_migrations"))
+    run_migrations(engine)
+    for rows in make_rows(rng, vocabulary, cards):
+        with engine.begin() as connection:
+            connection.execute(insert(FlipCard), rows)
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM ANALYZE flipcards"))
+    engine.dispose()
+
+
+def measure(db, queries: list[tuple[str, str | None]], limit: int) -> dict:
+    latencies = []
+    hits = 0
+    for q, category in queries:
+        started = time.perf_counter()
+        page = search_cards(db=db, q=q, category=category, limit=limit)
+        latencies.append(time.perf_counter() - started)
+        hits += len(page.results)
+    return {
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_hits": hits / len(queries),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=200, help="Per query kind.")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--target-ms", type=float, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--postgres", action="store_true")
+    parser.add_argument("--db-url")
+    parser.add_argument("--json", help="Write the results to this file as JSON.")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = make_vocabulary(rng, VOCABULARY_SIZE)
+
+    with contextlib.ExitStack() as stack:
+        if args.db_url:
+            db_url = args.db_url
+        elif args.postgres:
+            db_url = stack.enter_context(ephemeral_postgres())
+        else:
+            db_url = stack.enter_context(sqlite_database())
+
+        started = time.perf_counter()
+        seed(db_url, args.cards, rng, vocabulary)
+        print(f"seeded {args.cards} cards in {time.perf_counter() - started:.1f}s")
+
+        engine = create_engine(db_url)
+        with sessionmaker(bind=engine)() as db:
+            # Builds the in-process index on SQLite; warms the cache on PostgreSQL.
+            started = time.perf_counter()
+            search_cards(db=db, q=vocabulary[0], limit=args.limit)
+            warmup_seconds = time.perf_counter() - started
+
+            results = {
+                kind: measure(db, queries, args.limit)
+                for kind, queries in make_queries(rng, vocabulary, args.queries).items()
+            }
+        backend = engine.dialect.name
+        engine.dispose()
+
+    print(f"{backend}, first query (index build / warm-up): {warmup_seconds:.2f}s")
+    print(f"{'query':<18} {'p50 ms':>8} {'p99 ms':>8} {'hits':>6}")
+    for kind, row in results.items():
+        flag = "" if row["p99_ms"] <= args.target_ms else "  over target"
+        print(
+            f"{kind:<18} {row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+            f"{row['mean_hits']:>6.1f}{flag}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(
+                {
+                    "backend": backend,
+                    "cards": args.cards,
+                    "warmup_seconds": warmup_seconds,
+                    "queries": results,
+                },
+                output,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Measures the cold-start import time of `app.main` with `python -X importtime`.
+
+Each run imports the app in a fresh interpreter and records the total import
+time of `app.main`, the wall time of the process and the heaviest imports by
+cumulative time. The median over all runs is reported; --json saves it as a
+baseline and --baseline flags a regression beyond --tolerance.
+
+Usage:
+    PYTHONPATH=src python benchmarks/startup_time.py
+    PYTHONPATH=src python benchmarks/startup_time.py --runs 20 --json startup.json
+    PYTHONPATH=src python benchmarks/startup_time.py --baseline startup.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"
+)
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+# Modules whose presence after startup means an eager import crept back in.
+WATCHED_MODULES = ("boto3", "botocore", "PIL")
+
+
+def import_once(module: str, env: dict) -> dict:
+    probe = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {WATCHED_MODULES!r} if m in sys.modules))"
+    )
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - started
+
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            name = match.group(4)
+            cumulative[name] = max(cumulative.get(name, 0), int(match.group(2)))
+
+    return {
+        "wall_ms": wall * 1000,
+        "import_ms": cumulative.get(module, 0) / 1000,
+        "cumulative_us": cumulative,
+        "loaded": [name for name in completed.stdout.strip().split(",") if name],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", help="Write the results to this file as JSON.")
+    parser.add_argument("--baseline", help="Compare with results from an earlier run.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="Allowed relative growth of the median import time.",
+    )
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.gettempdir(), "flipcards_startup.db")
+    env = dict(
+        os.environ,
+        PYTHONPATH=SRC_DIR,
+        DATABASE_URL=os.getenv("DATABASE_URL", f"sqlite:///{database}"),
+    )
+
+    # The first import warms the bytecode cache and is not counted.
+    import_once(args.module, env)
+    runs = [import_once(args.module, env) for _ in range(args.runs)]
+
+    last = runs[-1]["cumulative_us"]
+    heaviest = sorted(
+        (name for name in last if name != args.module),
+        key=lambda name: last[name],
+        reverse=True,
+    )
+    top_level = [name for name in heaviest if "." not in name][: args.top]
+
+    results = {
+        "module": args.module,
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "import_ms_median": statistics.median(run["import_ms"] for run in runs),
+        "wall_ms_median": statistics.median(run["wall_ms"] for run in runs),
+        "eagerly_loaded": runs[-1]["loaded"],
+        "heaviest_imports_ms": {name: last[name] / 1000 for name in top_level},
+    }
+
+    print(
+        f"{args.module}: median import {results['import_ms_median']:.1f} ms, "
+        f"median process wall time {results['wall_ms_median']:.1f} ms"
+    )
+    print(f"eagerly loaded: {', '.join(results['eagerly_loaded']) or 'none'}")
+    print(f"\n{'package':<30} {'cumulative ms':>14}")
+    for name, ms in results["heaviest_imports_ms"].items():
+        print(f"{name:<30} {ms:>14.1f}")
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        before = baseline["import_ms_median"]
+        now = results["import_ms_median"]
+        if now > before * (1 + args.tolerance):
+            print(f"\nRegression: median import {before:.1f} -> {now:.1f} ms")
+            sys.exit(1)
+        print(f"\nNo regression: median import {before:.1f} -> {now:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
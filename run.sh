@@ -6,8 +6,8 @@ cd /home/ec2-user/python-flipcards-learner
 # Activate Poetry environment - this is critical
 source $(poetry env info --path)/bin/activate
 
-# Start backend server with correct Python path
-PYTHONPATH=/home/ec2-user/python-flipcards-learner/src python -m src.app.main --host 0.0.0.0 --port 8000 > backend.log 2>&1 &
+# Start the backend workers (see SERVER_* in .env); the PID is the master's
+PYTHONPATH=/home/ec2-user/python-flipcards-learner/src python -m app.server > backend.log 2>&1 &
 BACKEND_PID=$!
 echo $BACKEND_PID > backend.pid
 
@@ -22,8 +22,8 @@ if [ -f frontend/flip-cards-learner/frontend.pid ]; then
     rm frontend/flip-cards-learner/frontend.pid
 fi
 
-# Start backend server with correct Python path
-PYTHONPATH=/home/ec2-user/python-flipcards-learner/src python -m src.app.main --host 0.0.0.0 --port 8000 > backend.log 2>&1 &
+# Start the backend workers (see SERVER_* in .env); the PID is the master's
+PYTHONPATH=/home/ec2-user/python-flipcards-learner/src python -m app.server > backend.log 2>&1 &
 BACKEND_PID=$!
 echo $BACKEND_PID > backend.pid
 
@@ -16,3 +16,108 @@ AWS_BUCKET_NAME = os.getenv("AWS_BUCKET_NAME")
 AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY")
 AWS_SECRET_KEY = os.getenv("AWS_SECRET_KEY")
 AWS_REGION = os.getenv("AWS_REGION")
+
+# Background shipping of audit logs to S3
+S3_LOG_QUEUE_SIZE = int(os.getenv("S3_LOG_QUEUE_SIZE", "10000"))
+S3_LOG_BATCH_SIZE = int(os.getenv("S3_LOG_BATCH_SIZE", "500"))
+S3_LOG_FLUSH_INTERVAL = float(os.getenv("S3_LOG_FLUSH_INTERVAL", "5"))
+# Directory for the durable on-disk log spool; empty keeps records in memory only
+S3_LOG_SPOOL_DIR = os.getenv("S3_LOG_SPOOL_DIR", "")
+
+# In-process cache of serialized decks
+DECK_CACHE_TTL = float(os.getenv("DECK_CACHE_TTL", "300"))
+DECK_CACHE_MAX_ENTRIES = int(os.getenv("DECK_CACHE_MAX_ENTRIES", "64"))
+
+# Bulk card import
+BULK_IMPORT_MAX_ROWS = int(os.getenv("BULK_IMPORT_MAX_ROWS", "100000"))
+BULK_IMPORT_MAX_BYTES = int(os.getenv("BULK_IMPORT_MAX_BYTES", str(50 * 1024 * 1024)))
+BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "1000"))
+
+# Opt-in async database path; needs asyncpg (Postgres) or aiosqlite (SQLite)
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+
+# Database connection pool, per engine and per worker process
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Seconds before a connection is replaced; -1 keeps connections forever
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+# Checkouts waiting longer than this are counted and reported as slow
+DB_SLOW_CHECKOUT_MS = float(os.getenv("DB_SLOW_CHECKOUT_MS", "100"))
+
+# Shared boto3 S3 client
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+S3_MAX_ATTEMPTS = int(os.getenv("S3_MAX_ATTEMPTS", "5"))
+S3_CONNECT_TIMEOUT = float(os.getenv("S3_CONNECT_TIMEOUT", "5"))
+S3_READ_TIMEOUT = float(os.getenv("S3_READ_TIMEOUT", "30"))
+
+# Image processing worker processes
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", str(min(os.cpu_count() or 1, 4))))
+IMAGE_MAX_PENDING = int(os.getenv("IMAGE_MAX_PENDING", "32"))
+IMAGE_TIMEOUT = float(os.getenv("IMAGE_TIMEOUT", "15"))
+# Decompression-bomb guard: larger images are rejected before decoding
+IMAGE_MAX_PIXELS = int(os.getenv("IMAGE_MAX_PIXELS", "40000000"))
+
+# Uploads to S3
+UPLOAD_MAX_SIZE = int(os.getenv("UPLOAD_MAX_SIZE", str(2 * 1024 * 1024)))
+S3_MULTIPART_THRESHOLD = int(os.getenv("S3_MULTIPART_THRESHOLD", str(8 * 1024 * 1024)))
+S3_UPLOAD_PART_SIZE = int(os.getenv("S3_UPLOAD_PART_SIZE", str(8 * 1024 * 1024)))
+S3_UPLOAD_CONCURRENCY = int(os.getenv("S3_UPLOAD_CONCURRENCY", "4"))
+# Custom endpoint, e.g. a local MinIO or LocalStack; empty uses AWS
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL", "")
+
+# Presigned S3 URLs for direct uploads and downloads
+PRESIGN_DOWNLOAD_EXPIRES = int(os.getenv("PRESIGN_DOWNLOAD_EXPIRES", "3600"))
+PRESIGN_UPLOAD_EXPIRES = int(os.getenv("PRESIGN_UPLOAD_EXPIRES", "600"))
+# Cached download URLs are re-signed this many seconds before they expire
+PRESIGN_REFRESH_MARGIN = int(os.getenv("PRESIGN_REFRESH_MARGIN", "300"))
+PRESIGN_CACHE_MAX_ENTRIES = int(os.getenv("PRESIGN_CACHE_MAX_ENTRIES", "1024"))
+# Top-level folders clients may read from and upload to
+ASSET_FOLDERS = tuple(
+    folder.strip()
+    for folder in os.getenv("ASSET_FOLDERS", "icons,images").split(",")
+    if folder.strip()
+)
+
+# Offline deck bundles; empty stores them in src/app/static/bundles
+BUNDLE_DIR = os.getenv("BUNDLE_DIR", "")
+# Superseded bundles kept per deck for clients holding an older manifest
+BUNDLE_KEEP = int(os.getenv("BUNDLE_KEEP", "3"))
+
+# Server-Sent Events change feed
+# Events buffered per client; slower clients are sent a reset and disconnected
+CHANGE_FEED_QUEUE_SIZE = int(os.getenv("CHANGE_FEED_QUEUE_SIZE", "256"))
+# Seconds between keepalive comments on idle streams
+CHANGE_FEED_HEARTBEAT = float(os.getenv("CHANGE_FEED_HEARTBEAT", "15"))
+# Relays events between workers and nodes through PostgreSQL LISTEN/NOTIFY
+CHANGE_FEED_PG_BRIDGE = os.getenv("CHANGE_FEED_PG_BRIDGE", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Production server (python -m app.server)
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8000"))
+# Worker processes; 0 starts one per CPU core
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "0"))
+# Seconds in-flight requests get to finish when a worker is restarted or stopped
+SERVER_GRACEFUL_TIMEOUT = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))
+# Seconds an idle keep-alive connection stays open; keep it above the proxy's
+SERVER_KEEPALIVE = int(os.getenv("SERVER_KEEPALIVE", "5"))
+# Workers are replaced after this many requests (plus jitter); 0 never replaces them
+SERVER_MAX_REQUESTS = int(os.getenv("SERVER_MAX_REQUESTS", "0"))
+SERVER_MAX_REQUESTS_JITTER = int(os.getenv("SERVER_MAX_REQUESTS_JITTER", "0"))
+# Apply pending migrations once, before the workers start
+SERVER_RUN_MIGRATIONS = os.getenv("SERVER_RUN_MIGRATIONS", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Fill the connection pool and the deck cache before a worker accepts requests
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
@@ -1,15 +1,72 @@
+import json
+import random
+from array import array
+from collections.abc import Iterator
+from datetime import datetime, timezone
 from typing import Literal
 
 from fastapi import HTTPException
+from sqlalchemy import (
+    Select,
+    cast,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import REGCONFIG
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.enums import Categories
-from app.models import FlipCard
-from app.schemas import CardEdit, FlipCardCreate, FlipCardResponse
+from app.config import BULK_IMPORT_CHUNK_SIZE
+from app.models import CardChange, DeckVersion, FlipCard
+from app.schemas import (
+    BulkImportResult,
+    BulkImportRowResult,
+    CardChangeEntry,
+    ChangesPage,
+    CardEdit,
+    FlipCardCreate,
+    FlipCardResponse,
+    ReviewCard,
+    SearchHit,
+    SearchPage,
+)
+from app.utils.change_feed import (
+    CARD_CREATED,
+    CARD_DELETED,
+    CARD_UPDATED,
+    card_event,
+    emit_change,
+    reset_event,
+)
+from app.utils.deck_cache import (
+    ALL_CARDS_KEY,
+    CardIds,
+    DeckPayload,
+    card_ids_cache,
+    deck_cache,
+)
 from app.utils.s3_logger import s3_logger
+from app.utils.single_flight import single_flight
+from app.utils.scheduler import ReviewState, next_review
+from app.utils.search_index import (
+    SEARCH_CONFIG,
+    InvertedIndex,
+    search_index_cache,
+)
+from app.utils.telemetry import span
 from app.enums import LogAction
 
+# Arbitrary key for the Postgres advisory lock that orders change log writers.
+CHANGE_LOG_LOCK_KEY = 7316_0022
+
 
 def create_card(db: Session, card_data: FlipCardCreate) -> FlipCardResponse:
     """
@@ -59,8 +116,13 @@ def create_card(db: Session, card_data: FlipCardCreate) -> FlipCardResponse:
         )
 
         db.add(card)
+        db.flush()
+        seq = record_changes(db, (card.id, card.category))[-1]
+        emit_change(db, card_event(CARD_CREATED, seq, card))
+        bump_deck_versions(db, card.category)
         db.commit()
         db.refresh(card)
+        deck_cache.invalidate(card.category, ALL_CARDS_KEY)
 
         s3_logger.log_action(
             LogAction.CARD_CREATED.value,
@@ -84,6 +146,154 @@ def create_card(db: Session, card_data: FlipCardCreate) -> FlipCardResponse:
         ) from e
 
 
+def import_cards(
+    db: Session,
+    cards: list[FlipCardCreate | str],
+    chunk_size: int = BULK_IMPORT_CHUNK_SIZE,
+) -> BulkImportResult:
+    """
+    This function imports many cards in a single transaction.
+
+    Categories are validated once against `Categories`, duplicates inside the
+    payload are detected in memory and duplicates in the database with one
+    set-based query per chunk. Rows are inserted with ON CONFLICT DO NOTHING on
+    the unique front_text, so cards created concurrently are reported as
+    duplicates instead of failing the import.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        cards (list[FlipCardCreate | str]): The parsed rows; a string is the reason
+                                            the row could not be parsed.
+        chunk_size (int): The number of rows checked and inserted per statement.
+
+    Raises:
+        HTTPException: If a database error occurs; nothing is imported then.
+
+    Returns:
+        BulkImportResult: The counts and the per-row outcome, in payload order.
+    """
+    results: list[BulkImportRowResult] = []
+    pending: list[tuple[int, FlipCardCreate]] = []
+    seen_front_texts = set()
+
+    for row, card in enumerate(cards, start=1):
+        if isinstance(card, str):
+            results.append(BulkImportRowResult(row=row, status="invalid", detail=card))
+        elif card.category not in Categories.__members__:
+            results.append(
+                BulkImportRowResult(
+                    row=row,
+                    status="invalid",
+                    front_text=card.front_text,
+                    detail=f"Category '{card.category}' is not a valid category!",
+                )
+            )
+        elif card.front_text in seen_front_texts:
+            results.append(
+                BulkImportRowResult(
+                    row=row,
+                    status="duplicate",
+                    front_text=card.front_text,
+                    detail="Duplicate of an earlier row in this import.",
+                )
+            )
+        else:
+            seen_front_texts.add(card.front_text)
+            pending.append((row, card))
+
+    dialect_insert = _dialect_insert(db)
+    touched_categories = set()
+
+    try:
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start : start + chunk_size]
+            existing = set(
+                db.scalars(
+                    select(FlipCard.front_text).where(
+                        FlipCard.front_text.in_([card.front_text for _, card in chunk])
+                    )
+                )
+            )
+
+            new_rows = [
+                (row, card) for row, card in chunk if card.front_text not in existing
+            ]
+            inserted = set()
+            if new_rows:
+                statement = (
+                    dialect_insert(FlipCard)
+                    .values(
+                        [
+                            {
+                                "front_text": card.front_text,
+                                "back_text": card.back_text,
+                                "category": card.category,
+                            }
+                            for _, card in new_rows
+                        ]
+                    )
+                    .on_conflict_do_nothing(index_elements=[FlipCard.front_text])
+                    .returning(FlipCard.id, FlipCard.front_text, FlipCard.category)
+                )
+                created = db.execute(statement).all()
+                inserted = {card.front_text for card in created}
+                record_changes(db, *((card.id, card.category) for card in created))
+
+            for row, card in chunk:
+                if card.front_text in inserted:
+                    touched_categories.add(card.category)
+                    results.append(
+                        BulkImportRowResult(
+                            row=row, status="created", front_text=card.front_text
+                        )
+                    )
+                else:
+                    results.append(
+                        BulkImportRowResult(
+                            row=row,
+                            status="duplicate",
+                            front_text=card.front_text,
+                            detail="This card already exists!",
+                        )
+                    )
+
+        if touched_categories:
+            bump_deck_versions(db, *touched_categories)
+            emit_change(db, reset_event(touched_categories, "bulk_import"))
+        db.commit()
+
+    except SQLAlchemyError as e:
+        s3_logger.log_action(
+            LogAction.ERROR.value, {"operation": "import_cards", "error": str(e)}
+        )
+        db.rollback()
+        raise HTTPException(
+            status_code=500,
+            detail=f"An error occurred while importing the cards: {str(e)}",
+        ) from e
+
+    deck_cache.invalidate(*touched_categories, ALL_CARDS_KEY)
+    results.sort(key=lambda result: result.row)
+    summary = BulkImportResult(
+        created=sum(result.status == "created" for result in results),
+        duplicates=sum(result.status == "duplicate" for result in results),
+        invalid=sum(result.status == "invalid" for result in results),
+        results=results,
+    )
+
+    s3_logger.log_action(
+        LogAction.CARDS_IMPORTED.value,
+        {
+            "created": summary.created,
+            "duplicates": summary.duplicates,
+            "invalid": summary.invalid,
+            "categories": sorted(touched_categories),
+        },
+    )
+
+    return summary
+
+
 def get_all_cards(db: Session) -> list[FlipCardResponse]:
     """
     This function retrieves all cards from the database.
@@ -123,10 +333,594 @@ def get_all_cards_from_category(
     """
     cards_from_category = db.query(FlipCard).filter(FlipCard.category == category).all()
 
-    if not cards_from_category:
+    return [FlipCardResponse.model_validate(card) for card in cards_from_category]
+
+
+def cards_query(category: str | None = None, after: int | None = None) -> Select:
+    """
+    This function builds the column-only card query shared by the deck reads.
+
+    Args:
+        category (str | None): The category to select, or None for all cards.
+        after (int | None): Only select cards with an id greater than this one.
+
+    Returns:
+        Select: A SELECT of id, front_text, back_text and category ordered by id.
+    """
+    query = select(
+        FlipCard.id, FlipCard.front_text, FlipCard.back_text, FlipCard.category
+    ).order_by(FlipCard.id)
+    if category is not None:
+        query = query.where(FlipCard.category == category)
+    if after is not None:
+        query = query.where(FlipCard.id > after)
+    return query
+
+
+def deck_version_query(category: str | None = None) -> Select:
+    """
+    This function builds the query reading a deck version from `deck_versions`.
+
+    Args:
+        category (str | None): The category to check, or None for all cards.
+
+    Returns:
+        Select: A SELECT of the version and the time of the last change.
+        For all cards the version is the sum of the per-category versions, which
+        grows whenever any category changes.
+    """
+    query = select(
+        func.coalesce(func.sum(DeckVersion.version), 0),
+        func.max(DeckVersion.updated_at),
+    )
+    if category is not None:
+        query = query.where(DeckVersion.category == category)
+    return query
+
+
+def encode_deck(rows) -> bytes:
+    """
+    This function encodes rows from `cards_query` as a JSON array of FlipCardResponse.
+    """
+    with span("serialize"):
+        cards = [
+            {
+                "front_text": row.front_text,
+                "back_text": row.back_text,
+                "category": row.category.value,
+            }
+            for row in rows
+        ]
+        return json.dumps(cards, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+
+def encode_ndjson(rows) -> bytes:
+    """
+    This function encodes rows from `cards_query` as NDJSON lines, including the id.
+    """
+    with span("serialize"):
+        return b"".join(
+            json.dumps(
+                {
+                    "id": row.id,
+                    "front_text": row.front_text,
+                    "back_text": row.back_text,
+                    "category": row.category.value,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            + b"\n"
+            for row in rows
+        )
+
+
+def load_deck_json(
+    db: Session, category: str | None = None, version: int | None = None
+) -> DeckPayload:
+    """
+    This function encodes a deck straight to JSON bytes.
+
+    Only the columns of FlipCardResponse are selected and the rows are encoded
+    without building ORM objects or Pydantic models.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        category (str | None): The category to load, or None for all cards.
+        version (int | None): The deck version the payload is built for.
+
+    Returns:
+        DeckPayload: The encoded JSON array and the number of cards in it.
+    """
+    rows = db.execute(cards_query(category=category)).all()
+
+    return DeckPayload(body=encode_deck(rows), count=len(rows), version=version)
+
+
+def get_deck_json(
+    db: Session, category: str | None = None, version: int | None = None
+) -> DeckPayload:
+    """
+    This function returns the encoded deck, served from the deck cache when possible.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        category (str | None): The category to load, or None for all cards.
+        version (int | None): The deck version from `get_deck_version`. A cached
+                              deck built for another version is not reused.
+
+    Returns:
+        DeckPayload: The encoded JSON array and the number of cards in it.
+    """
+    key = ALL_CARDS_KEY if category is None else category
+    deck = deck_cache.get(key)
+    if deck is not None and (version is None or deck.version == version):
+        return deck
+
+    def load() -> DeckPayload:
+        generation = deck_cache.generation(key)
+        deck = load_deck_json(db=db, category=category, version=version)
+        deck_cache.set(key, deck, generation)
+        return deck
+
+    # Concurrent misses of the same deck version share one query.
+    return single_flight.do(("deck", key, version), load)
+
+
+def get_cards_page(
+    db: Session, category: str | None = None, after: int | None = None, limit: int = 100
+) -> tuple[DeckPayload, int | None]:
+    """
+    This function returns one keyset-paginated page of cards, ordered by id.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        category (str | None): The category to page through, or None for all cards.
+        after (int | None): The cursor returned with the previous page.
+        limit (int): The maximum number of cards in the page.
+
+    Returns:
+        tuple[DeckPayload, int | None]: The encoded page and the cursor of the
+        next page, or None if this is the last page.
+    """
+    query = cards_query(category=category, after=after).limit(limit + 1)
+    rows = db.execute(query).all()
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+
+    page = rows[:limit]
+    return DeckPayload(body=encode_deck(page), count=len(page)), next_cursor
+
+
+def card_ids_query(category: str) -> Select:
+    """
+    This function builds the query for the ids of a deck, read from the
+    (category, id) index alone.
+    """
+    return (
+        select(FlipCard.id).where(FlipCard.category == category).order_by(FlipCard.id)
+    )
+
+
+def get_card_ids(db: Session, category: str, version: int) -> CardIds:
+    """
+    This function returns the ids of a deck, served from `card_ids_cache` when possible.
+
+    The cached array is reused while the deck version is unchanged, so cards
+    created or deleted by any worker are picked up on the next call.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        category (str): The category of the deck.
+        version (int): The deck version from `get_deck_version`.
+
+    Returns:
+        CardIds: The ids of the deck as a compact array.
+    """
+    card_ids = card_ids_cache.get(category)
+    if card_ids is not None and card_ids.version == version:
+        return card_ids
+
+    def load() -> CardIds:
+        generation = card_ids_cache.generation(category)
+        card_ids = CardIds(
+            ids=array("q", db.scalars(card_ids_query(category))), version=version
+        )
+        card_ids_cache.set(category, card_ids, generation)
+        return card_ids
+
+    return single_flight.do(("card_ids", category, version), load)
+
+
+def sample_ids(ids: array, n: int, seed: int | None = None) -> list[int]:
+    """
+    This function picks `n` distinct ids at random, in O(n) for n much
+    smaller than the deck.
+
+    The same seed always picks the same ids, in the same order, from the same deck.
+    """
+    return random.Random(seed).sample(ids, min(n, len(ids)))
+
+
+def sampled_rows_query(ids: list[int]) -> Select:
+    """
+    This function builds the primary key lookup of sampled cards.
+    """
+    return cards_query().where(FlipCard.id.in_(ids))
+
+
+def encode_sample(ids: list[int], rows) -> bytes:
+    """
+    This function encodes sampled rows in the order the ids were picked.
+
+    Cards deleted since the id array was loaded are skipped.
+    """
+    rows_by_id = {row.id: row for row in rows}
+    return encode_deck([rows_by_id[id] for id in ids if id in rows_by_id])
+
+
+def sample_cards(
+    db: Session, category: str, n: int, seed: int | None = None
+) -> DeckPayload:
+    """
+    This function returns `n` random cards of a category.
+
+    Ids are picked from the cached id array of the deck and only the picked
+    cards are read, so the cost depends on `n`, not on the size of the deck.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        category (str): The category to sample from.
+        n (int): The number of cards; the whole deck if it is smaller.
+        seed (int | None): Makes the sample reproducible for an unchanged deck.
+
+    Returns:
+        DeckPayload: The sampled cards encoded as a JSON array.
+    """
+    version, _ = get_deck_version(db=db, category=category)
+    ids = sample_ids(get_card_ids(db, category, version).ids, n, seed)
+    rows = db.execute(sampled_rows_query(ids)).all() if ids else []
+    body = encode_sample(ids, rows)
+    return DeckPayload(body=body, count=len(rows), version=version)
+
+
+def search_query(
+    q: str, category: str | None = None, limit: int = 20, offset: int = 0
+) -> Select:
+    """
+    This function builds the PostgreSQL search query over the search indexes.
+
+    Cards match the words of `q` through the GIN-indexed search_vector, or
+    match `q` approximately through the pg_trgm index on front_text, so typos
+    in a question still find it. Results are ranked by the better of the two
+    scores; matches in front_text weigh more than matches in back_text.
+
+    Args:
+        q (str): The search text, in web search syntax ("quoted phrases", -not).
+        category (str | None): Only return cards of this category.
+        limit (int): The page size; one extra row is selected to detect a next page.
+        offset (int): The number of results to skip.
+
+    Returns:
+        Select: A SELECT of the card columns and their score, best first.
+    """
+    tsquery = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), q)
+    search_vector = literal_column("flipcards.search_vector")
+    score = func.greatest(
+        func.ts_rank(search_vector, tsquery),
+        func.word_similarity(q, FlipCard.front_text),
+    )
+    query = (
+        select(
+            FlipCard.id,
+            FlipCard.front_text,
+            FlipCard.back_text,
+            FlipCard.category,
+            score.label("score"),
+        )
+        .where(
+            or_(
+                search_vector.op("@@")(tsquery),
+                literal(q).op("<%")(FlipCard.front_text),
+            )
+        )
+        .order_by(score.desc(), FlipCard.id)
+        .limit(limit + 1)
+        .offset(offset)
+    )
+    if category is not None:
+        query = query.where(FlipCard.category == category)
+    return query
+
+
+def get_search_index(db: Session) -> InvertedIndex:
+    """
+    This function returns the in-process search index, rebuilding it when any
+    card changed since it was built.
+
+    Concurrent rebuilds of the same version are coalesced through
+    `single_flight`, so only one request reads the whole table.
+    """
+    version, _ = get_deck_version(db=db)
+    index = search_index_cache.get(ALL_CARDS_KEY)
+    if index is not None and index.version == version:
+        return index
+
+    def load() -> InvertedIndex:
+        generation = search_index_cache.generation(ALL_CARDS_KEY)
+        rows = db.execute(cards_query()).yield_per(10000)
+        index = InvertedIndex.build(rows, version)
+        search_index_cache.set(ALL_CARDS_KEY, index, generation)
+        return index
+
+    return single_flight.do(("search_index", version), load)
+
+
+def search_page(hits: list, limit: int, offset: int) -> SearchPage:
+    """
+    This function turns one extra-long page of hits into a SearchPage.
+    """
+    return SearchPage(
+        results=[SearchHit.model_validate(hit) for hit in hits[:limit]],
+        next_offset=offset + limit if len(hits) > limit else None,
+    )
+
+
+def search_hits(scored: list[tuple[int, float]], rows: list) -> list[dict]:
+    """
+    This function pairs the (card id, score) results of the search index with
+    the rows of the cards, keeping the ranking and dropping deleted cards.
+    """
+    rows_by_id = {row.id: row for row in rows}
+    return [
+        {**rows_by_id[card_id]._mapping, "score": score}
+        for card_id, score in scored
+        if card_id in rows_by_id
+    ]
+
+
+def search_cards(
+    db: Session,
+    q: str,
+    category: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> SearchPage:
+    """
+    This function searches front_text and back_text and returns ranked results.
+
+    PostgreSQL uses its full-text and trigram indexes (see `search_query`);
+    other databases use the in-process `InvertedIndex`.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        q (str): The search text.
+        category (str | None): Only return cards of this category.
+        limit (int): The page size.
+        offset (int): The number of results to skip.
+
+    Returns:
+        SearchPage: The results, best first, and the offset of the next page.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        hits = db.execute(search_query(q, category, limit, offset)).all()
+        return search_page(hits, limit, offset)
+
+    scored = get_search_index(db).search(q, category, limit + 1, offset)
+    ids = [card_id for card_id, _ in scored]
+    rows = db.execute(sampled_rows_query(ids)).all() if ids else []
+    return search_page(search_hits(scored, rows), limit, offset)
+
+
+def stream_cards_ndjson(
+    bind: Engine | Connection,
+    category: str | None = None,
+    after: int | None = None,
+    limit: int | None = None,
+    batch_size: int = 1000,
+) -> Iterator[bytes]:
+    """
+    This function streams cards as newline-delimited JSON, ordered by id.
+
+    Rows are fetched through a server-side cursor `batch_size` at a time, so
+    memory stays flat regardless of the table size. The generator opens its own
+    session because it outlives the request-scoped one.
+
+    Args:
+        bind (Engine | Connection): The engine to read from, e.g. `db.get_bind()`.
+        category (str | None): The category to stream, or None for all cards.
+        after (int | None): Only stream cards with an id greater than this one.
+        limit (int | None): Stop after this many cards, or None for all of them.
+        batch_size (int): The number of rows fetched per round trip.
+
+    Yields:
+        bytes: One chunk of NDJSON lines per fetched batch.
+    """
+    query = cards_query(category=category, after=after).limit(limit)
+
+    with Session(bind=bind) as db:
+        result = db.execute(query.execution_options(yield_per=batch_size))
+        for rows in result.partitions():
+            yield encode_ndjson(rows)
+
+
+def get_deck_version(
+    db: Session, category: str | None = None
+) -> tuple[int, datetime | None]:
+    """
+    This function reads the version counter of a deck without touching the cards table.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        category (str | None): The category to check, or None for all cards.
+
+    Returns:
+        tuple[int, datetime | None]: The deck version and the time of the last change.
+    """
+    version, updated_at = db.execute(deck_version_query(category=category)).one()
+    return int(version), updated_at
+
+
+def get_deck_versions(db: Session) -> dict[str, int]:
+    """
+    This function reads the version counter of every category in one query.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+
+    Returns:
+        dict[str, int]: The version of every category; 0 for never changed ones.
+    """
+    versions = dict.fromkeys((category.value for category in Categories), 0)
+    for category, version in db.execute(
+        select(DeckVersion.category, DeckVersion.version)
+    ):
+        versions[category.value] = version
+    return versions
+
+
+def bump_deck_versions(db: Session, *categories) -> None:
+    """
+    This function increments the version of each given category in the current transaction.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        *categories: The categories whose decks changed.
+    """
+    dialect_insert = _dialect_insert(db)
+    now = datetime.now(timezone.utc)
+
+    for category in {Categories(category) for category in categories}:
+        statement = dialect_insert(DeckVersion).values(
+            category=category, version=1, updated_at=now
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[DeckVersion.category],
+            set_={"version": DeckVersion.version + 1, "updated_at": now},
+        )
+        db.execute(statement)
+
+
+def record_changes(db: Session, *changes: tuple[int, str]) -> list[int]:
+    """
+    This function appends entries to the delta sync change log in the current transaction.
+
+    On PostgreSQL writers hold an advisory lock until they commit, so change
+    sequence numbers become visible in order and a client reading up to some
+    `seq` cannot miss an earlier one committed later.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        *changes: (card id, category) of every changed card; an edit moving a
+                  card to another category changes both categories.
+
+    Returns:
+        list[int]: The sequence numbers of the new entries, in order.
+    """
+    rows = [
+        {"card_id": card_id, "category": Categories(category)}
+        for card_id, category in dict.fromkeys(changes)
+    ]
+    if not rows:
         return []
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": CHANGE_LOG_LOCK_KEY}
+        )
+    statement = insert(CardChange).returning(
+        CardChange.seq, sort_by_parameter_order=True
+    )
+    return list(db.scalars(statement, rows))
 
-    return [FlipCardResponse.model_validate(card) for card in cards_from_category]
+
+def changes_query(since: int, category: str | None = None, limit: int = 1000) -> Select:
+    """
+    This function builds the query for the change log entries after `since`,
+    a range scan of the primary key or of the (category, seq) index. One entry
+    more than `limit` is read to tell whether another page follows.
+    """
+    query = (
+        select(CardChange.seq, CardChange.card_id)
+        .where(CardChange.seq > since)
+        .order_by(CardChange.seq)
+        .limit(limit + 1)
+    )
+    if category is not None:
+        query = query.where(CardChange.category == category)
+    return query
+
+
+def changed_cards_query(card_ids: list[int]) -> Select:
+    """
+    This function builds the primary key lookup of the current state of changed cards.
+    """
+    return select(
+        FlipCard.id,
+        FlipCard.front_text,
+        FlipCard.back_text,
+        FlipCard.category,
+        FlipCard.updated_at,
+    ).where(FlipCard.id.in_(card_ids))
+
+
+def build_changes_page(
+    entries, cards, since: int, category: str | None, limit: int
+) -> ChangesPage:
+    """
+    This function turns one page of the change log into upserts and deletes.
+
+    Each card appears once, at its latest `seq`, with its current state: a
+    card that no longer exists (or, for a category, no longer belongs to it)
+    is a delete, any other card an upsert.
+    """
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    latest = {}
+    for entry in entries:
+        latest.pop(entry.card_id, None)
+        latest[entry.card_id] = entry.seq
+    cards_by_id = {card.id: card for card in cards}
+
+    changes = []
+    for card_id, seq in latest.items():
+        card = cards_by_id.get(card_id)
+        if card is None or (category is not None and card.category != category):
+            changes.append(CardChangeEntry(seq=seq, op="delete", id=card_id))
+        else:
+            changes.append(
+                CardChangeEntry.model_validate(
+                    {**card._mapping, "seq": seq, "op": "upsert"}
+                )
+            )
+
+    return ChangesPage(
+        changes=changes,
+        since=entries[-1].seq if entries else since,
+        has_more=has_more,
+    )
+
+
+def get_changes(
+    db: Session, since: int = 0, category: str | None = None, limit: int = 1000
+) -> ChangesPage:
+    """
+    This function returns the cards created, edited or deleted after change `since`.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        since (int): The `since` returned by the previous call; 0 for everything.
+        category (str | None): Only return changes of this category.
+        limit (int): The maximum number of change log entries read.
+
+    Returns:
+        ChangesPage: The upserts and deletes, the `since` of the next call and
+        whether more changes are waiting.
+    """
+    entries = db.execute(changes_query(since, category, limit)).all()
+    card_ids = list({entry.card_id for entry in entries})
+    cards = db.execute(changed_cards_query(card_ids)).all() if card_ids else []
+    return build_changes_page(entries, cards, since, category, limit)
 
 
 def edit_card(db: Session, card_id: int, card_data: CardEdit) -> FlipCardResponse:
@@ -156,6 +950,17 @@ def edit_card(db: Session, card_id: int, card_data: CardEdit) -> FlipCardRespons
             detail=f"Card with ID {card_id} not found. Please try a different ID.",
         )
 
+    if (
+        card_data.category is not None
+        and card_data.category not in Categories.__members__
+    ):
+        error_msg = f"Category '{card_data.category}' is not a valid category!"
+        s3_logger.log_action(
+            LogAction.ERROR.value, {"error": error_msg, "operation": "update_card"}
+        )
+        raise HTTPException(status_code=400, detail=error_msg)
+
+    previous_category = card.category
     updated = False
     if card_data.front_text is not None:
         card.front_text = card_data.front_text
@@ -200,8 +1005,13 @@ def edit_card(db: Session, card_id: int, card_data: CardEdit) -> FlipCardRespons
             status_code=400, detail="No valid fields provided for update."
         )
 
+    db.flush()
+    seq = record_changes(db, (card.id, previous_category), (card.id, card.category))[-1]
+    emit_change(db, card_event(CARD_UPDATED, seq, card, previous_category))
+    bump_deck_versions(db, previous_category, card.category)
     db.commit()
     db.refresh(card)
+    deck_cache.invalidate(previous_category, card.category, ALL_CARDS_KEY)
 
     return FlipCardResponse.model_validate(card)
 
@@ -232,9 +1042,127 @@ def delete_card(db: Session, card_id: int):
         )
 
     db.delete(card)
+    seq = record_changes(db, (card.id, card.category))[-1]
+    emit_change(db, card_event(CARD_DELETED, seq, card))
+    bump_deck_versions(db, card.category)
     db.commit()
+    deck_cache.invalidate(card.category, ALL_CARDS_KEY)
 
     s3_logger.log_action(
         LogAction.CARD_DELETED.value, {"card_id": card_id, "category": card.category}
     )
     return {"message": "Card deleted successfully"}
+
+
+def review_queue_query(category: str, now: datetime, limit: int) -> Select:
+    """
+    This function builds the query for the next due cards of a category.
+
+    Served by the (category, due_at, id) index: the database reads the first
+    `limit` index entries of the category instead of scanning the deck.
+
+    Args:
+        category (str): The category to review.
+        now (datetime): Cards due at or before this time are selected.
+        limit (int): The maximum number of cards.
+
+    Returns:
+        Select: A SELECT of the cards and their schedule, most overdue first.
+    """
+    return (
+        select(FlipCard)
+        .where(FlipCard.category == category, FlipCard.due_at <= now)
+        .order_by(FlipCard.due_at, FlipCard.id)
+        .limit(limit)
+    )
+
+
+def get_review_queue(
+    db: Session, category: str, limit: int = 20, now: datetime | None = None
+) -> list[ReviewCard]:
+    """
+    This function returns the cards of a category that are due for review.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        category (str): The category to review.
+        limit (int): The maximum number of cards.
+        now (datetime | None): The current time, for tests.
+
+    Returns:
+        list[ReviewCard]: The due cards, most overdue first.
+    """
+    query = review_queue_query(category, now or datetime.now(timezone.utc), limit)
+    return [ReviewCard.model_validate(card) for card in db.scalars(query)]
+
+
+def record_review(
+    db: Session, card_id: int, quality: int, now: datetime | None = None
+) -> ReviewCard:
+    """
+    This function records an answer to a card and schedules its next review.
+
+    The card row is locked while it is updated, so two answers to the same
+    card cannot overwrite each other's schedule. Deck versions are not bumped:
+    the schedule is not part of the deck payload.
+
+    Args:
+        db (Session): The database session used to interact with the database.
+        card_id (int): The ID of the reviewed card.
+        quality (int): The answer grade, from 0 (blackout) to 5 (perfect).
+        now (datetime | None): The time of the answer, for tests.
+
+    Raises:
+        HTTPException: If the card with the specified ID is not found.
+
+    Returns:
+        ReviewCard: The card with its new schedule.
+    """
+    now = now or datetime.now(timezone.utc)
+    card = db.scalars(
+        select(FlipCard).where(FlipCard.id == card_id).with_for_update()
+    ).first()
+
+    if not card:
+        error_msg = f"Card with id {card_id} not found"
+        s3_logger.log_action(
+            LogAction.ERROR.value, {"error": error_msg, "operation": "record_review"}
+        )
+        raise HTTPException(
+            status_code=404, detail=f"Card with ID {card_id} not found!"
+        )
+
+    state, card.due_at = next_review(
+        ReviewState(
+            ease_factor=card.ease_factor,
+            interval_days=card.interval_days,
+            repetitions=card.repetitions,
+            lapses=card.lapses,
+        ),
+        quality,
+        now,
+    )
+    card.ease_factor = state.ease_factor
+    card.interval_days = state.interval_days
+    card.repetitions = state.repetitions
+    card.lapses = state.lapses
+    card.last_reviewed_at = now
+    db.commit()
+    db.refresh(card)
+
+    s3_logger.log_action(
+        LogAction.CARD_REVIEWED.value,
+        {
+            "card_id": card.id,
+            "quality": quality,
+            "interval_days": card.interval_days,
+        },
+    )
+    return ReviewCard.model_validate(card)
+
+
+def _dialect_insert(db: Session):
+    # INSERT ... ON CONFLICT is dialect specific; SQLite is used by the tests.
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
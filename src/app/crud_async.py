@@ -0,0 +1,293 @@
+# Async counterparts of app.crud for the AsyncSession data path (DB_ASYNC).
+# Reads run natively on AsyncSession. Writes reuse the sync functions, so
+# validation, logging and cache invalidation stay identical. They run in a
+# worker thread on a sync Session (see `_run_write`): AsyncSession.run_sync
+# would run their CPU work (dedup, change log, audit spool) on the event loop.
+import asyncio
+from array import array
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app import crud
+from app.database import Session, get_sync_engine
+from app.schemas import (
+    BulkImportResult,
+    ChangesPage,
+    CardEdit,
+    FlipCardCreate,
+    FlipCardResponse,
+    ReviewCard,
+    SearchPage,
+)
+from app.utils.deck_cache import (
+    ALL_CARDS_KEY,
+    CardIds,
+    DeckPayload,
+    card_ids_cache,
+    deck_cache,
+)
+from app.utils.search_index import InvertedIndex, search_index_cache
+from app.utils.single_flight import single_flight
+
+# Decks larger than this are encoded in a worker thread to keep the loop responsive.
+ENCODE_IN_THREAD_ROWS = 2000
+
+
+async def create_card(db: AsyncSession, card_data: FlipCardCreate) -> FlipCardResponse:
+    """
+    This function creates a new card in the database.
+
+    See `app.crud.create_card`.
+    """
+    return await _run_write(db, crud.create_card, card_data)
+
+
+async def import_cards(
+    db: AsyncSession, cards: list[FlipCardCreate | str]
+) -> BulkImportResult:
+    """
+    This function imports many cards in a single transaction.
+
+    See `app.crud.import_cards`.
+    """
+    return await _run_write(db, crud.import_cards, cards)
+
+
+async def edit_card(
+    db: AsyncSession, card_id: int, card_data: CardEdit
+) -> FlipCardResponse:
+    """
+    This function edits an existing card based on the provided card ID and new data.
+
+    See `app.crud.edit_card`.
+    """
+    return await _run_write(db, crud.edit_card, card_id, card_data)
+
+
+async def delete_card(db: AsyncSession, card_id: int):
+    """
+    This function deletes a card from the database based on the provided card ID.
+
+    See `app.crud.delete_card`.
+    """
+    return await _run_write(db, crud.delete_card, card_id)
+
+
+async def get_deck_version(
+    db: AsyncSession, category: str | None = None
+) -> tuple[int, datetime | None]:
+    """
+    This function reads the version counter of a deck without touching the cards table.
+
+    See `app.crud.get_deck_version`.
+    """
+    result = await db.execute(crud.deck_version_query(category=category))
+    version, updated_at = result.one()
+    return int(version), updated_at
+
+
+async def get_deck_json(
+    db: AsyncSession, category: str | None = None, version: int | None = None
+) -> DeckPayload:
+    """
+    This function returns the encoded deck, served from the deck cache when possible.
+
+    See `app.crud.get_deck_json`.
+    """
+    key = ALL_CARDS_KEY if category is None else category
+    deck = deck_cache.get(key)
+    if deck is not None and (version is None or deck.version == version):
+        return deck
+
+    async def load() -> DeckPayload:
+        generation = deck_cache.generation(key)
+        rows = (await db.execute(crud.cards_query(category=category))).all()
+        body = await _encode(crud.encode_deck, rows)
+        deck = DeckPayload(body=body, count=len(rows), version=version)
+        deck_cache.set(key, deck, generation)
+        return deck
+
+    return await single_flight.do_async(("deck", key, version), load)
+
+
+async def get_cards_page(
+    db: AsyncSession,
+    category: str | None = None,
+    after: int | None = None,
+    limit: int = 100,
+) -> tuple[DeckPayload, int | None]:
+    """
+    This function returns one keyset-paginated page of cards, ordered by id.
+
+    See `app.crud.get_cards_page`.
+    """
+    query = crud.cards_query(category=category, after=after).limit(limit + 1)
+    rows = (await db.execute(query)).all()
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+
+    page = rows[:limit]
+    return DeckPayload(body=crud.encode_deck(page), count=len(page)), next_cursor
+
+
+async def get_card_ids(db: AsyncSession, category: str, version: int) -> CardIds:
+    """
+    This function returns the ids of a deck, served from `card_ids_cache` when possible.
+
+    See `app.crud.get_card_ids`.
+    """
+    card_ids = card_ids_cache.get(category)
+    if card_ids is not None and card_ids.version == version:
+        return card_ids
+
+    async def load() -> CardIds:
+        generation = card_ids_cache.generation(category)
+        ids = await db.scalars(crud.card_ids_query(category))
+        card_ids = CardIds(ids=array("q", ids), version=version)
+        card_ids_cache.set(category, card_ids, generation)
+        return card_ids
+
+    return await single_flight.do_async(("card_ids", category, version), load)
+
+
+async def sample_cards(
+    db: AsyncSession, category: str, n: int, seed: int | None = None
+) -> DeckPayload:
+    """
+    This function returns `n` random cards of a category.
+
+    See `app.crud.sample_cards`.
+    """
+    version, _ = await get_deck_version(db=db, category=category)
+    card_ids = await get_card_ids(db, category, version)
+    ids = crud.sample_ids(card_ids.ids, n, seed)
+    rows = (await db.execute(crud.sampled_rows_query(ids))).all() if ids else []
+    body = crud.encode_sample(ids, rows)
+    return DeckPayload(body=body, count=len(rows), version=version)
+
+
+async def get_search_index(db: AsyncSession) -> InvertedIndex:
+    """
+    This function returns the in-process search index, rebuilding it when any
+    card changed since it was built.
+
+    The rows are read on the loop and the index is built in a worker thread.
+    See `app.crud.get_search_index`.
+    """
+    version, _ = await get_deck_version(db=db)
+    index = search_index_cache.get(ALL_CARDS_KEY)
+    if index is not None and index.version == version:
+        return index
+
+    async def load() -> InvertedIndex:
+        generation = search_index_cache.generation(ALL_CARDS_KEY)
+        rows = (await db.execute(crud.cards_query())).all()
+        index = await asyncio.to_thread(InvertedIndex.build, rows, version)
+        search_index_cache.set(ALL_CARDS_KEY, index, generation)
+        return index
+
+    return await single_flight.do_async(("search_index", version), load)
+
+
+async def search_cards(
+    db: AsyncSession,
+    q: str,
+    category: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> SearchPage:
+    """
+    This function searches front_text and back_text and returns ranked results.
+
+    See `app.crud.search_cards`.
+    """
+    if db.bind.dialect.name == "postgresql":
+        result = await db.execute(crud.search_query(q, category, limit, offset))
+        return crud.search_page(result.all(), limit, offset)
+
+    index = await get_search_index(db)
+    scored = index.search(q, category, limit + 1, offset)
+    ids = [card_id for card_id, _ in scored]
+    rows = (await db.execute(crud.sampled_rows_query(ids))).all() if ids else []
+    return crud.search_page(crud.search_hits(scored, rows), limit, offset)
+
+
+async def get_changes(
+    db: AsyncSession, since: int = 0, category: str | None = None, limit: int = 1000
+) -> ChangesPage:
+    """
+    This function returns the cards created, edited or deleted after change `since`.
+
+    See `app.crud.get_changes`.
+    """
+    entries = (await db.execute(crud.changes_query(since, category, limit))).all()
+    card_ids = list({entry.card_id for entry in entries})
+    cards = (
+        (await db.execute(crud.changed_cards_query(card_ids))).all() if card_ids else []
+    )
+    return crud.build_changes_page(entries, cards, since, category, limit)
+
+
+async def stream_cards_ndjson(
+    bind: AsyncEngine,
+    category: str | None = None,
+    after: int | None = None,
+    limit: int | None = None,
+    batch_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """
+    This function streams cards as newline-delimited JSON, ordered by id.
+
+    See `app.crud.stream_cards_ndjson`.
+    """
+    query = crud.cards_query(category=category, after=after).limit(limit)
+
+    async with AsyncSession(bind=bind) as db:
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            yield crud.encode_ndjson(rows)
+
+
+async def get_review_queue(
+    db: AsyncSession, category: str, limit: int = 20, now: datetime | None = None
+) -> list[ReviewCard]:
+    """
+    This function returns the cards of a category that are due for review.
+
+    See `app.crud.get_review_queue`.
+    """
+    query = crud.review_queue_query(category, now or datetime.now(timezone.utc), limit)
+    return [ReviewCard.model_validate(card) for card in await db.scalars(query)]
+
+
+async def record_review(
+    db: AsyncSession, card_id: int, quality: int, now: datetime | None = None
+) -> ReviewCard:
+    """
+    This function records an answer to a card and schedules its next review.
+
+    See `app.crud.record_review`.
+    """
+    return await _run_write(db, crud.record_review, card_id, quality, now)
+
+
+async def _run_write(db: AsyncSession, write, *args):
+    """
+    Runs a sync crud write in a worker thread, on a sync Session of the same database.
+
+    `db` itself is left untouched, so it must not hold an open write transaction.
+    """
+    bind = get_sync_engine(db.bind)
+
+    def run():
+        with Session(bind=bind) as sync_db:
+            return write(sync_db, *args)
+
+    return await asyncio.to_thread(run)
+
+
+async def _encode(encoder, rows) -> bytes:
+    if len(rows) > ENCODE_IN_THREAD_ROWS:
+        return await asyncio.to_thread(encoder, rows)
+    return encoder(rows)
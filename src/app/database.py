@@ -1,17 +1,64 @@
+import threading
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
-from app.config import DB_URL
+from app.config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_SLOW_CHECKOUT_MS,
+    DB_URL,
+)
 
-from app.models import Base
+from app.migrations.runner import run_migrations
+from app.utils.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    PoolMetrics,
+    instrument_pool,
+)
+from app.utils.telemetry import instrument_queries
 
 DATABASE_URL = DB_URL
 
-engine = create_engine(DATABASE_URL, pool_size=5, max_overflow=10)
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
+
+engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
 Session = sessionmaker(autoflush=False, bind=engine)
 
+sync_pool_metrics = PoolMetrics("sync", DB_SLOW_CHECKOUT_MS)
+async_pool_metrics = PoolMetrics("async", DB_SLOW_CHECKOUT_MS)
+instrument_pool(engine.pool, sync_pool_metrics)
+instrument_queries()
+
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+# Created on first use, so the sync path never needs an async driver installed.
+async_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+# Sync engines on the database of other async engines (e.g. in tests), by URL.
+sync_engines: dict[str, Engine] = {}
+sync_engines_lock = threading.Lock()
+
 
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    return run_migrations(engine)
 
 
 def get_db():
@@ -20,3 +67,86 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def to_async_url(url: str | URL) -> URL:
+    """
+    Converts a sync database URL to the matching async driver.
+
+    `sslmode` is renamed to asyncpg's `ssl` parameter.
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+    query = dict(url.query)
+    if backend == "postgresql" and "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return url.set(drivername=ASYNC_DRIVERS.get(backend, url.drivername), query=query)
+
+
+def to_sync_url(url: str | URL) -> URL:
+    """
+    Converts an async database URL back to the default sync driver.
+
+    The inverse of `to_async_url`.
+    """
+    url = make_url(url)
+    query = dict(url.query)
+    if url.get_backend_name() == "postgresql" and "ssl" in query:
+        query["sslmode"] = query.pop("ssl")
+    return url.set(drivername=url.get_backend_name(), query=query)
+
+
+def get_sync_engine(bind: AsyncEngine) -> Engine:
+    """
+    Returns a sync engine on the database of an async engine, for the work the
+    async path runs in worker threads.
+
+    This is `engine` for the application's async engine; other async engines
+    get a sync engine of their own, created on first use.
+    """
+    if bind is async_engine:
+        return engine
+    key = bind.url.render_as_string(hide_password=False)
+    with sync_engines_lock:
+        if key not in sync_engines:
+            sync_engines[key] = create_engine(to_sync_url(bind.url))
+        return sync_engines[key]
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Returns the async engine, creating it on first use.
+    """
+    global async_engine, AsyncSessionLocal
+    if async_engine is None:
+        async_engine = create_async_engine(
+            to_async_url(DATABASE_URL),
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            **POOL_OPTIONS,
+        )
+        instrument_pool(async_engine.sync_engine.pool, async_pool_metrics)
+        AsyncSessionLocal = async_sessionmaker(
+            async_engine, autoflush=False, expire_on_commit=False
+        )
+    return async_engine
+
+
+async def get_async_db():
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine():
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+def pool_stats() -> dict:
+    """
+    Returns the pool metrics of the sync engine and, once created, the async engine.
+    """
+    stats = {"sync": sync_pool_metrics.stats(engine.pool)}
+    if async_engine is not None:
+        stats["async"] = async_pool_metrics.stats(async_engine.sync_engine.pool)
+    return stats
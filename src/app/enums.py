@@ -19,5 +19,7 @@ class LogAction(Enum):
     CARD_CREATED = "card_created"
     CARD_UPDATED = "card_updated"
     CARD_DELETED = "card_deleted"
+    CARDS_IMPORTED = "cards_imported"
     CARD_READ = "card_read"
+    CARD_REVIEWED = "card_reviewed"
     ERROR = "error"
@@ -1,14 +1,24 @@
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config import DB_ASYNC, DB_POOL_SIZE, WARMUP_ON_STARTUP
+from app.database import Session, dispose_async_engine, engine, get_async_engine
+from app.routes.assets import assets_router
+from app.routes.bundles import bundles_router
 from app.routes.cards import cards_router
+from app.routes.cards_async import async_cards_router
+from app.routes.metrics import metrics_router, prometheus_router
+from app.routes.review import async_review_router, review_router
+from app.utils.bundles import BUNDLE_URL_PREFIX, ImmutableStaticFiles, deck_bundler
+from app.utils.change_feed import pg_bridge
+from app.utils.image_processing import image_processor
 from app.utils.s3_logger import s3_logger
-
-# from app.utils.assets import assets_router - NO NEED ATM
+from app.utils.telemetry import MetricsMiddleware
+from app.utils.warmup import warm_async_pool, warm_up
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 STATIC_DIR = os.path.join(BASE_DIR, "static")
@@ -18,10 +28,20 @@ TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    s3_logger.start()
     s3_logger.log_action("startup", {"message": "Application startup"})
+    pg_bridge.start(engine)
+    if WARMUP_ON_STARTUP:
+        await asyncio.to_thread(warm_up, engine, Session, DB_POOL_SIZE)
+        if DB_ASYNC:
+            await warm_async_pool(get_async_engine(), DB_POOL_SIZE)
     yield
     # Shutdown
     s3_logger.log_action("shutdown", {"message": "Application shutdown"})
+    await asyncio.to_thread(pg_bridge.stop)
+    await asyncio.to_thread(image_processor.shutdown)
+    await asyncio.to_thread(s3_logger.close)
+    await dispose_async_engine()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -36,12 +56,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "X-Next-Cursor", "Link"],
 )
+app.add_middleware(MetricsMiddleware)
 
-app.include_router(cards_router)
-# app.include_router(assets_router)
+app.include_router(async_cards_router if DB_ASYNC else cards_router)
+app.include_router(async_review_router if DB_ASYNC else review_router)
+app.include_router(metrics_router)
+app.include_router(prometheus_router)
+app.include_router(assets_router)
+app.include_router(bundles_router)
+app.mount(
+    BUNDLE_URL_PREFIX,
+    ImmutableStaticFiles(directory=deck_bundler.directory, check_dir=False),
+    name="bundles",
+)
 
 if __name__ == "__main__":
+    # Development server; production runs `python -m app.server`.
     import uvicorn
 
     uvicorn.run("src.app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,8 @@
+from app.database import engine
+from app.migrations.runner import discover_migrations, run_migrations
+
+if __name__ == "__main__":
+    applied = run_migrations(engine)
+    for version, module in discover_migrations():
+        status = "applied now" if version in applied else "up to date"
+        print(f"{version} {status:<12} {(module.__doc__ or '').strip()}")
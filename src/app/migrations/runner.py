@@ -0,0 +1,130 @@
+# Minimal, ordered schema migrations. Every module named `vNNNN_<name>.py` in this
+# package is one migration with a docstring and an `upgrade(connection)` function;
+# applied versions are recorded in `schema_migrations`.
+import importlib
+import pkgutil
+from datetime import datetime, timezone
+from types import ModuleType
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Engine,
+    MetaData,
+    String,
+    Table,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy import column as sql_column
+from sqlalchemy import table as sql_table
+from sqlalchemy.schema import CreateColumn
+
+import app.migrations
+
+# Arbitrary key for the Postgres advisory lock that serializes concurrent runs.
+MIGRATION_LOCK_KEY = 7316_0010
+
+migration_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", String, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def discover_migrations() -> list[tuple[str, ModuleType]]:
+    """
+    This function finds the migration modules, ordered by version.
+
+    Returns:
+        list[tuple[str, ModuleType]]: The version (e.g. "0002") and the module.
+    """
+    migrations = []
+    for module_info in pkgutil.iter_modules(app.migrations.__path__):
+        if not module_info.name.startswith("v"):
+            continue
+        version = module_info.name[1:].split("_", 1)[0]
+        module = importlib.import_module(f"app.migrations.{module_info.name}")
+        migrations.append((version, module))
+    return sorted(migrations, key=lambda migration: migration[0])
+
+
+def run_migrations(engine: Engine) -> list[str]:
+    """
+    This function applies the pending migrations in a single transaction.
+
+    On PostgreSQL an advisory lock makes concurrent runs (e.g. several workers
+    starting at once) wait for each other instead of racing.
+
+    Args:
+        engine (Engine): The engine of the database to migrate.
+
+    Returns:
+        list[str]: The versions applied by this run.
+    """
+    applied = []
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"),
+                {"key": MIGRATION_LOCK_KEY},
+            )
+        migration_metadata.create_all(bind=connection)
+        done = set(connection.scalars(select(schema_migrations.c.version)))
+
+        for version, module in discover_migrations():
+            if version in done:
+                continue
+            module.upgrade(connection)
+            connection.execute(
+                schema_migrations.insert().values(
+                    version=version,
+                    description=(module.__doc__ or "").strip().splitlines()[0],
+                    applied_at=datetime.now(timezone.utc),
+                )
+            )
+            applied.append(version)
+    return applied
+
+
+def add_missing_columns(connection: Connection, table: Table, values: dict) -> None:
+    """
+    This function adds the model columns missing from an existing table.
+
+    Columns are added as nullable, because SQLite cannot add a NOT NULL column
+    without a constant default, then existing rows get the value from `values`
+    and, on PostgreSQL, the NOT NULL constraint.
+
+    Args:
+        connection (Connection): The connection of the running migration.
+        table (Table): The model table, which already has the new columns.
+        values (dict): Column name to the value of existing rows, for every
+                       column to add.
+    """
+    existing = {
+        column["name"] for column in inspect(connection).get_columns(table.name)
+    }
+
+    for name, value in values.items():
+        if name in existing:
+            continue
+        column = table.c[name]
+        ddl = str(CreateColumn(column).compile(dialect=connection.dialect))
+        connection.execute(
+            text(f"ALTER TABLE {table.name} ADD COLUMN {ddl.replace(' NOT NULL', '')}")
+        )
+        if column.nullable:
+            continue
+
+        # A bare table clause, so no onupdate default of the model is applied.
+        bare_table = sql_table(table.name, sql_column(name, column.type))
+        connection.execute(bare_table.update().values({name: value}))
+        if connection.dialect.name == "postgresql":
+            connection.execute(
+                text(f"ALTER TABLE {table.name} ALTER COLUMN {name} SET NOT NULL")
+            )
@@ -0,0 +1,51 @@
+"""Create the flipcards and deck_versions tables."""
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Enum,
+    Integer,
+    MetaData,
+    String,
+    Table,
+)
+
+# The schema as it was before migrations existed. Later changes belong in
+# their own migrations, so this never follows the models.
+CATEGORIES = (
+    "OOP",
+    "DSA",
+    "WEB",
+    "DOCKER",
+    "KUBERNETES",
+    "LINUX",
+    "AZURE",
+    "CI_CD",
+    "GENERAL",
+)
+
+metadata = MetaData()
+category_type = Enum(*CATEGORIES, name="categories")
+
+flipcards = Table(
+    "flipcards",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("front_text", String, nullable=False, unique=True, index=True),
+    Column("back_text", String),
+    Column("category", category_type, nullable=False),
+)
+
+deck_versions = Table(
+    "deck_versions",
+    metadata,
+    Column("category", category_type, primary_key=True),
+    Column("version", Integer, nullable=False, default=0),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+)
+
+
+def upgrade(connection: Connection) -> None:
+    # Databases created before migrations existed already have these tables.
+    metadata.create_all(bind=connection, checkfirst=True)
@@ -0,0 +1,27 @@
+"""Index flipcards by (category, id) and (category, front_text)."""
+
+from sqlalchemy import Column, Connection, Index, Integer, MetaData, String, Table
+
+from app.migrations.v0001_baseline import category_type
+
+flipcards = Table(
+    "flipcards",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("front_text", String),
+    Column("category", category_type),
+)
+
+INDEXES = (
+    Index("ix_flipcards_category_id", flipcards.c.category, flipcards.c.id),
+    Index(
+        "ix_flipcards_category_front_text",
+        flipcards.c.category,
+        flipcards.c.front_text,
+    ),
+)
+
+
+def upgrade(connection: Connection) -> None:
+    for index in INDEXES:
+        index.create(bind=connection, checkfirst=True)
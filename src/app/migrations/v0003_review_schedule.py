@@ -0,0 +1,54 @@
+"""Add the spaced-repetition schedule columns and the review queue index."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+)
+
+from app.migrations.runner import add_missing_columns
+from app.migrations.v0001_baseline import category_type
+
+flipcards = Table(
+    "flipcards",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("category", category_type),
+    Column("due_at", DateTime(timezone=True), nullable=False),
+    Column("ease_factor", Float, nullable=False),
+    Column("interval_days", Integer, nullable=False),
+    Column("repetitions", Integer, nullable=False),
+    Column("lapses", Integer, nullable=False),
+    Column("last_reviewed_at", DateTime(timezone=True)),
+)
+
+REVIEW_QUEUE_INDEX = Index(
+    "ix_flipcards_category_due_at",
+    flipcards.c.category,
+    flipcards.c.due_at,
+    flipcards.c.id,
+)
+
+
+def upgrade(connection: Connection) -> None:
+    # Existing cards are due right away, with the SM-2 starting ease.
+    add_missing_columns(
+        connection,
+        flipcards,
+        {
+            "due_at": datetime.now(timezone.utc),
+            "ease_factor": 2.5,
+            "interval_days": 0,
+            "repetitions": 0,
+            "lapses": 0,
+            "last_reviewed_at": None,
+        },
+    )
+    REVIEW_QUEUE_INDEX.create(bind=connection, checkfirst=True)
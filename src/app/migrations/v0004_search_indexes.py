@@ -0,0 +1,27 @@
+"""Add the full-text search vector and the trigram index on PostgreSQL."""
+
+from sqlalchemy import Connection, text
+
+from app.utils.search_index import SEARCH_CONFIG
+
+STATEMENTS = (
+    # Needs a role allowed to create extensions, or pg_trgm installed beforehand.
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE flipcards ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', front_text), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(back_text, '')), 'B')"
+    ") STORED",
+    "CREATE INDEX IF NOT EXISTS ix_flipcards_search_vector "
+    "ON flipcards USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_flipcards_front_text_trgm "
+    "ON flipcards USING gin (front_text gin_trgm_ops)",
+)
+
+
+def upgrade(connection: Connection) -> None:
+    # Other databases are searched through the in-process index instead.
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in STATEMENTS:
+        connection.execute(text(statement))
@@ -0,0 +1,58 @@
+"""Add flipcards.updated_at and the card_changes log for delta sync."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    insert,
+    inspect,
+    select,
+)
+
+from app.migrations.runner import add_missing_columns
+from app.migrations.v0001_baseline import category_type
+
+metadata = MetaData()
+
+flipcards = Table(
+    "flipcards",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("category", category_type),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+)
+
+card_changes = Table(
+    "card_changes",
+    metadata,
+    Column("seq", Integer, primary_key=True, autoincrement=True),
+    Column("card_id", Integer, nullable=False),
+    Column("category", category_type, nullable=False),
+    Column("changed_at", DateTime(timezone=True), nullable=False),
+    Index("ix_card_changes_category_seq", "category", "seq"),
+)
+
+
+def upgrade(connection: Connection) -> None:
+    add_missing_columns(
+        connection, flipcards, {"updated_at": datetime.now(timezone.utc)}
+    )
+
+    if inspect(connection).has_table(card_changes.name):
+        return
+    card_changes.create(bind=connection, checkfirst=True)
+    # One entry per existing card, so syncing from 0 returns every card.
+    connection.execute(
+        insert(card_changes).from_select(
+            ["card_id", "category", "changed_at"],
+            select(
+                flipcards.c.id, flipcards.c.category, flipcards.c.updated_at
+            ).order_by(flipcards.c.id),
+        )
+    )
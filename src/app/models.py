@@ -1,11 +1,18 @@
-from sqlalchemy import Column, Enum, Integer, String
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Enum, Float, Index, Integer, String
 from sqlalchemy.orm import declarative_base
 
 from app.enums import Categories
+from app.utils.scheduler import DEFAULT_EASE_FACTOR
 
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class FlipCard(Base):
     __tablename__ = "flipcards"
 
@@ -13,3 +20,47 @@ class FlipCard(Base):
     front_text = Column(String, nullable=False, unique=True, index=True)
     back_text = Column(String)
     category = Column(Enum(Categories), nullable=False)
+
+    # Spaced-repetition schedule; a new card is due right away.
+    due_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+    ease_factor = Column(Float, nullable=False, default=DEFAULT_EASE_FACTOR)
+    interval_days = Column(Integer, nullable=False, default=0)
+    repetitions = Column(Integer, nullable=False, default=0)
+    lapses = Column(Integer, nullable=False, default=0)
+    last_reviewed_at = Column(DateTime(timezone=True))
+    updated_at = Column(
+        DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow
+    )
+
+    __table_args__ = (
+        # Category reads ordered by id and keyset pages within a category
+        Index("ix_flipcards_category_id", "category", "id"),
+        # Duplicate check in create_card
+        Index("ix_flipcards_category_front_text", "category", "front_text"),
+        # Review queue: the next due cards of a category
+        Index("ix_flipcards_category_due_at", "category", "due_at", "id"),
+    )
+
+
+class DeckVersion(Base):
+    __tablename__ = "deck_versions"
+
+    category = Column(Enum(Categories), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class CardChange(Base):
+    """
+    One entry of the change log read by delta sync: the card with `card_id`
+    was created, edited or deleted in `category`. `seq` grows monotonically.
+    """
+
+    __tablename__ = "card_changes"
+
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    card_id = Column(Integer, nullable=False)
+    category = Column(Enum(Categories), nullable=False)
+    changed_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
+
+    __table_args__ = (Index("ix_card_changes_category_seq", "category", "seq"),)
@@ -0,0 +1,48 @@
+from fastapi import APIRouter
+from fastapi.responses import RedirectResponse
+
+from app.schemas import AssetUploadForm, AssetUploadRequest
+from app.utils.presign import presign_service
+
+assets_router = APIRouter(prefix="/api/assets", tags=["Assets"])
+
+
+@assets_router.post("/uploads", response_model=AssetUploadForm)
+def create_asset_upload(upload: AssetUploadRequest):
+    """
+    Route for getting a presigned form to upload a file directly to S3.
+
+    The client posts the returned fields plus the file to the returned URL;
+    the file never passes through the API.
+
+    Args:
+        upload (AssetUploadRequest): The target folder, file name and type.
+
+    Returns:
+        AssetUploadForm: The form URL and fields, the object key and expiry.
+    """
+    return presign_service.upload_form(
+        upload.folder, upload.filename, upload.content_type
+    )
+
+
+@assets_router.get("/{key:path}")
+def read_asset(key: str):
+    """
+    Route for downloading an asset directly from S3.
+
+    Redirects to a presigned URL, which the browser may reuse for as long as
+    the signature stays valid.
+
+    Args:
+        key (str): The object key, e.g. "icons/rocket.svg".
+
+    Returns:
+        RedirectResponse: A 307 redirect to the presigned URL.
+    """
+    url, max_age = presign_service.download_url(key)
+    return RedirectResponse(
+        url,
+        status_code=307,
+        headers={"Cache-Control": f"private, max-age={max_age}"},
+    )
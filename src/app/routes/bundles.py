@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.crud import get_deck_version
+from app.database import get_db
+from app.utils.bundles import deck_bundler
+from app.utils.http_cache import format_http_date, is_not_modified, make_etag
+
+bundles_router = APIRouter(prefix="/api/bundles", tags=["Bundles"])
+
+
+@bundles_router.get("/")
+def read_bundle_manifest(request: Request, db: Session = Depends(get_db)):
+    """
+    Route for retrieving the manifest of the offline deck bundles.
+
+    Every bundle is a gzip-compressed NDJSON snapshot of a category (or of
+    every card, under "all") served as an immutable file from its `url`. A
+    client keeps the bundles it has and downloads only those whose `sha256`
+    changed. Responds with 304 Not Modified while no card changed.
+
+    Args:
+        request (Request): The incoming request with the conditional headers.
+        db (Session): The database session provided by dependency injection.
+
+    Returns:
+        dict: The total deck version and, per bundle, its url, sha256, deck
+        version, card count and compressed size.
+    """
+    version, updated_at = get_deck_version(db=db)
+    headers = {"ETag": make_etag("bundles", version), "Cache-Control": "no-cache"}
+    if updated_at is not None:
+        headers["Last-Modified"] = format_http_date(updated_at)
+
+    if is_not_modified(request, headers["ETag"], updated_at):
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(deck_bundler.manifest(db), headers=headers)
@@ -1,5 +1,7 @@
 from typing import Literal
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.utils.s3_logger import s3_logger
 from app.enums import LogAction
@@ -9,17 +11,173 @@ from app.crud import (
     create_card,
     delete_card,
     edit_card,
-    get_all_cards,
-    get_all_cards_from_category,
+    get_changes,
+    get_cards_page,
+    get_deck_json,
+    get_deck_version,
+    import_cards,
+    sample_cards,
+    search_cards,
+    stream_cards_ndjson,
 )
 from app.database import get_db
-from app.schemas import CardEdit, FlipCardCreate, FlipCardResponse
+from app.schemas import (
+    BulkImportResult,
+    CardEdit,
+    ChangesPage,
+    FlipCardCreate,
+    FlipCardResponse,
+    SearchPage,
+)
+from app.utils.card_import import parse_cards_payload, read_payload
+from app.utils.change_feed import change_hub
+from app.utils.deck_cache import DeckPayload
+from app.utils.http_cache import format_http_date, is_not_modified, make_etag
 
 CategoryType = Literal[
     "OOP", "DSA", "WEB", "AZURE", "LINUX", "DOCKER", "KUBERNETES", "CI_CD", "GENERAL"
 ]
 cards_router = APIRouter(prefix="/api/cards", tags=["Cards"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_SAMPLE_SIZE = 10
+MAX_SAMPLE_SIZE = 200
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_SEARCH_OFFSET = 10000
+MAX_SEARCH_LENGTH = 200
+DEFAULT_CHANGES_LIMIT = 1000
+MAX_CHANGES_LIMIT = 10000
+
+
+def deck_headers(category: str | None, version: int, updated_at) -> dict:
+    """
+    Builds the validator headers of a deck from its version.
+    """
+    headers = {
+        "ETag": make_etag(category or "all", version),
+        "Cache-Control": "no-cache",
+    }
+    if updated_at is not None:
+        headers["Last-Modified"] = format_http_date(updated_at)
+    return headers
+
+
+def page_headers(request: Request, next_cursor: int | None, limit: int) -> dict:
+    """
+    Builds the X-Next-Cursor and Link headers pointing at the next page.
+    """
+    if next_cursor is None:
+        return {}
+    next_url = request.url.include_query_params(after=next_cursor, limit=limit)
+    return {"X-Next-Cursor": str(next_cursor), "Link": f'<{next_url}>; rel="next"'}
+
+
+def last_event_id(request: Request) -> int | None:
+    """
+    Returns the change sequence number an EventSource client resumes from.
+    """
+    value = request.headers.get("last-event-id", "")
+    return int(value) if value.isdigit() else None
+
+
+def event_stream_response(subscription, replay: ChangesPage | None) -> Response:
+    """
+    Streams the events of a change feed subscription to the client.
+    """
+    return StreamingResponse(
+        change_hub.stream(subscription, replay),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        # Stops nginx from buffering the stream.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def read_log_details(
+    category: str, response: Response, deck: DeckPayload | None
+) -> dict:
+    """
+    Builds the audit log details of a successful category read.
+    """
+    if deck is not None:
+        return {"category": category, "cards_count": deck.count, "status": "success"}
+    if response.status_code == 304:
+        return {"category": category, "status": "not_modified"}
+    return {"category": category, "status": "streaming"}
+
+
+def deck_response(
+    request: Request, db: Session, category: str | None = None
+) -> tuple[Response, DeckPayload | None]:
+    """
+    Builds the response for a deck read, honouring conditional request headers.
+
+    The deck version is checked first, so a client with a current copy gets a
+    304 without the cards table being queried.
+
+    Returns:
+        tuple[Response, DeckPayload | None]: The response and the deck that was
+        sent, or None when the client copy is current.
+    """
+    version, updated_at = get_deck_version(db=db, category=category)
+    headers = deck_headers(category, version, updated_at)
+
+    if is_not_modified(request, headers["ETag"], updated_at):
+        return Response(status_code=304, headers=headers), None
+
+    deck = get_deck_json(db=db, category=category, version=version)
+    response = Response(
+        content=deck.body, media_type="application/json", headers=headers
+    )
+    return response, deck
+
+
+def cards_response(
+    request: Request,
+    db: Session,
+    category: str | None = None,
+    limit: int | None = None,
+    after: int | None = None,
+) -> tuple[Response, DeckPayload | None]:
+    """
+    Picks the representation of a card listing requested by the client.
+
+    - `Accept: application/x-ndjson` streams the cards (after `after`, at most
+      `limit` of them) as NDJSON.
+    - `limit` or `after` returns one keyset-paginated page, with the cursor of
+      the next page in the `X-Next-Cursor` and `Link` headers.
+    - Otherwise the whole deck is returned as a cached, conditional response.
+
+    Every response carries `Vary: Accept`, so caches keep the JSON and NDJSON
+    representations of the URL apart.
+
+    Returns:
+        tuple[Response, DeckPayload | None]: The response and the encoded cards
+        it carries, or None for streamed and 304 responses.
+    """
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        stream = stream_cards_ndjson(
+            bind=db.get_bind(), category=category, after=after, limit=limit
+        )
+        response, cards = StreamingResponse(stream, media_type=NDJSON_MEDIA_TYPE), None
+    elif limit is None and after is None:
+        response, cards = deck_response(request=request, db=db, category=category)
+    else:
+        limit = limit or DEFAULT_PAGE_SIZE
+        cards, next_cursor = get_cards_page(
+            db=db, category=category, after=after, limit=limit
+        )
+        response = Response(
+            content=cards.body,
+            media_type="application/json",
+            headers=page_headers(request, next_cursor, limit),
+        )
+    response.headers["Vary"] = "Accept"
+    return response, cards
+
 
 @cards_router.post("/", response_model=FlipCardResponse)
 def create_card_route(card_data: FlipCardCreate, db: Session = Depends(get_db)):
@@ -36,20 +194,181 @@ def create_card_route(card_data: FlipCardCreate, db: Session = Depends(get_db)):
     return create_card(db=db, card_data=card_data)
 
 
+@cards_router.post("/bulk", response_model=BulkImportResult)
+async def import_cards_route(request: Request, db: Session = Depends(get_db)):
+    """
+    This route imports many cards at once in a single transaction.
+
+    The body is a JSON array, NDJSON or CSV (with a front_text,back_text,category
+    header), selected by the Content-Type header. Invalid and duplicate rows are
+    skipped and reported; the remaining rows are inserted.
+
+    Args:
+        request (Request): The request carrying the payload.
+        db (Session): Database session.
+
+    Raises:
+        HTTPException: If the payload cannot be parsed or a database error occurs.
+
+    Returns:
+        BulkImportResult: The number of created, duplicate and invalid rows and
+        the outcome of every row.
+    """
+    body = await read_payload(request)
+    cards = parse_cards_payload(body, request.headers.get("content-type", ""))
+    return await run_in_threadpool(import_cards, db=db, cards=cards)
+
+
+@cards_router.get("/changes", response_model=ChangesPage)
+def read_changes(
+    since: int = Query(0, ge=0),
+    category: CategoryType | None = None,
+    limit: int = Query(DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT),
+    db: Session = Depends(get_db),
+):
+    """
+    Route for syncing a local copy of the cards: returns what changed after `since`.
+
+    Start with `since=0` (every card) and pass the returned `since` to the next
+    call. Keep calling while `has_more` is true. Each changed card is returned
+    once, as an upsert with its current content or as a delete.
+
+    Args:
+        since (int): The `since` returned by the previous call.
+        category (CategoryType | None): Only sync this category.
+        limit (int): The maximum number of change log entries per call.
+        db (Session): The database session provided by dependency injection.
+
+    Returns:
+        ChangesPage: The upserts and deletes and the cursor of the next call.
+    """
+    return get_changes(db=db, since=since, category=category, limit=limit)
+
+
+@cards_router.get("/events")
+async def stream_card_events(
+    request: Request,
+    category: CategoryType | None = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Route for receiving card changes as they happen, as Server-Sent Events.
+
+    Sends `card.created`, `card.updated` and `card.deleted` events whose data
+    is the card's delta sync entry and whose id is its change sequence
+    number. A reconnecting client (Last-Event-ID) first gets the changes it
+    missed. On a `reset` event the client syncs through `/changes` and
+    reconnects.
+
+    Args:
+        request (Request): The request, with the optional Last-Event-ID header.
+        category (CategoryType | None): Only send changes of this category.
+        db (Session): The database session provided by dependency injection.
+
+    Returns:
+        StreamingResponse: The text/event-stream of the changes.
+    """
+    subscription = change_hub.subscribe(category)
+    try:
+        since = last_event_id(request)
+        replay = None
+        if since is not None:
+            replay = await run_in_threadpool(
+                get_changes,
+                db=db,
+                since=since,
+                category=category,
+                limit=MAX_CHANGES_LIMIT,
+            )
+    except BaseException:
+        change_hub.unsubscribe(subscription)
+        raise
+    return event_stream_response(subscription, replay)
+
+
+@cards_router.get("/search", response_model=SearchPage)
+def search_cards_route(
+    q: str = Query(..., min_length=1, max_length=MAX_SEARCH_LENGTH),
+    category: CategoryType | None = None,
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+    db: Session = Depends(get_db),
+):
+    """
+    Route for searching the front and back text of the cards.
+
+    Small typos are tolerated. Results are ranked best first; pass the
+    returned `next_offset` as `offset` to get the next page.
+
+    Args:
+        q (str): The search text.
+        category (CategoryType | None): Only return cards of this category.
+        limit (int): The page size.
+        offset (int): The number of results to skip.
+        db (Session): The database session provided by dependency injection.
+
+    Returns:
+        SearchPage: The matching cards with their score and the next offset.
+    """
+    return search_cards(db=db, q=q, category=category, limit=limit, offset=offset)
+
+
+@cards_router.get("/{category}/sample", response_model=list[FlipCardResponse])
+def read_card_sample(
+    category: CategoryType,
+    n: int = Query(DEFAULT_SAMPLE_SIZE, ge=1, le=MAX_SAMPLE_SIZE),
+    seed: int | None = Query(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Route for retrieving random cards from a category, e.g. for a quiz.
+
+    Only the picked cards are read from the database, whatever the size of
+    the deck. Passing the same `seed` returns the same quiz while the deck is
+    unchanged.
+
+    Args:
+        category (CategoryType): The category to sample from.
+        n (int): The number of cards.
+        seed (int | None): Seed for a reproducible sample.
+        db (Session): The database session provided by dependency injection.
+
+    Returns:
+        list[FlipCardResponse]: The sampled cards, sent as pre-encoded JSON.
+    """
+    sample = sample_cards(db=db, category=category, n=n, seed=seed)
+    return Response(content=sample.body, media_type="application/json")
+
+
 @cards_router.get("/{category}", response_model=list[FlipCardResponse])
-def read_cards_from_category(category: CategoryType, db: Session = Depends(get_db)):
+def read_cards_from_category(
+    category: CategoryType,
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: int | None = Query(None, ge=0),
+    db: Session = Depends(get_db),
+):
     """
     Route for retrieving all cards from a specific category.
 
+    Responds with 304 Not Modified when If-None-Match or If-Modified-Since
+    shows the client already has the current version of the deck. Passing
+    `limit`/`after` pages through the deck by card id, and
+    `Accept: application/x-ndjson` streams it.
+
     Args:
         category (CategoryType): The category to filter cards by (OOP, DSA, WEB).
+        request (Request): The incoming request with the conditional headers.
+        limit (int | None): The page size for keyset pagination.
+        after (int | None): The cursor from the previous page's X-Next-Cursor.
         db (Session): The database session provided by dependency injection.
 
     Raises:
         HTTPException: If no cards are found in the specified category.
 
     Returns:
-        list[FlipCardResponse]: A list of cards in the specified category.
+        list[FlipCardResponse]: A list of cards in the specified category,
+        sent as pre-encoded JSON.
     """
     try:
         s3_logger.log_action(
@@ -57,14 +376,15 @@ def read_cards_from_category(category: CategoryType, db: Session = Depends(get_d
             {"category": category, "operation": "read_cards_from_category"},
         )
 
-        cards = get_all_cards_from_category(db=db, category=category)
+        response, deck = cards_response(
+            request=request, db=db, category=category, limit=limit, after=after
+        )
 
         s3_logger.log_action(
-            LogAction.CARD_READ.value,
-            {"category": category, "cards_count": len(cards), "status": "success"},
+            LogAction.CARD_READ.value, read_log_details(category, response, deck)
         )
 
-        return cards
+        return response
     except Exception as e:
         s3_logger.log_action(
             LogAction.ERROR.value,
@@ -78,23 +398,32 @@ def read_cards_from_category(category: CategoryType, db: Session = Depends(get_d
 
 
 @cards_router.get("/", response_model=list[FlipCardResponse])
-def read_all_cards(db: Session = Depends(get_db)):
+def read_all_cards(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: int | None = Query(None, ge=0),
+    db: Session = Depends(get_db),
+):
     """
     Route for retrieving all cards.
 
+    Supports the same conditional requests, pagination and NDJSON streaming
+    as the category route.
+
     Args:
+    request (Request): The incoming request with the conditional headers.
+    limit (int | None): The page size for keyset pagination.
+    after (int | None): The cursor from the previous page's X-Next-Cursor.
     db (Session): The database session.
 
     Raises:
         HTTPException: If no cards are found.
 
     Returns:
-        list[FlipCardResponse]: A list of all cards.
+        list[FlipCardResponse]: A list of all cards, sent as pre-encoded JSON.
     """
-    try:
-        return get_all_cards(db=db)
-    except HTTPException as e:
-        raise HTTPException(status_code=404, detail=e.detail) from e
+    response, _ = cards_response(request=request, db=db, limit=limit, after=after)
+    return response
 
 
 @cards_router.patch("/{card_id}", response_model=FlipCardResponse)
@@ -111,12 +440,9 @@ def edit_flip_card(card_id: int, card_data: CardEdit, db: Session = Depends(get_
         FlipCardResponse: The edited card.
 
     Raises:
-        HTTPException: If the card is not found.
+        HTTPException: 404 if the card is not found, 400 if the edit is invalid.
     """
-    try:
-        return edit_card(db=db, card_data=card_data, card_id=card_id)
-    except HTTPException as e:
-        raise HTTPException(status_code=404, detail=e.detail) from e
+    return edit_card(db=db, card_data=card_data, card_id=card_id)
 
 
 @cards_router.delete("/{card_id}")
@@ -131,7 +457,4 @@ def delete_flip_card(card_id: int, db: Session = Depends(get_db)):
     Raises:
         HTTPException: If the card is not found.
     """
-    try:
-        return delete_card(card_id=card_id, db=db)
-    except HTTPException as e:
-        raise HTTPException(status_code=404, detail=e.detail) from e
+    return delete_card(card_id=card_id, db=db)
@@ -0,0 +1,325 @@
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud_async import (
+    create_card,
+    delete_card,
+    edit_card,
+    get_changes,
+    get_cards_page,
+    get_deck_json,
+    get_deck_version,
+    import_cards,
+    sample_cards,
+    search_cards,
+    stream_cards_ndjson,
+)
+from app.database import get_async_db
+from app.enums import LogAction
+from app.routes.cards import (
+    DEFAULT_CHANGES_LIMIT,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SAMPLE_SIZE,
+    DEFAULT_SEARCH_LIMIT,
+    MAX_CHANGES_LIMIT,
+    MAX_PAGE_SIZE,
+    MAX_SAMPLE_SIZE,
+    MAX_SEARCH_LENGTH,
+    MAX_SEARCH_LIMIT,
+    MAX_SEARCH_OFFSET,
+    NDJSON_MEDIA_TYPE,
+    CategoryType,
+    deck_headers,
+    event_stream_response,
+    last_event_id,
+    page_headers,
+    read_log_details,
+)
+from app.schemas import (
+    BulkImportResult,
+    CardEdit,
+    ChangesPage,
+    FlipCardCreate,
+    FlipCardResponse,
+    SearchPage,
+)
+from app.utils.card_import import parse_cards_payload, read_payload
+from app.utils.change_feed import change_hub
+from app.utils.deck_cache import DeckPayload
+from app.utils.http_cache import is_not_modified
+from app.utils.s3_logger import s3_logger
+
+# Same routes as `cards_router`, served on the AsyncSession data path (DB_ASYNC).
+async_cards_router = APIRouter(prefix="/api/cards", tags=["Cards"])
+
+
+async def deck_response(
+    request: Request, db: AsyncSession, category: str | None = None
+) -> tuple[Response, DeckPayload | None]:
+    """
+    Builds the response for a deck read, honouring conditional request headers.
+
+    See `app.routes.cards.deck_response`.
+    """
+    version, updated_at = await get_deck_version(db=db, category=category)
+    headers = deck_headers(category, version, updated_at)
+
+    if is_not_modified(request, headers["ETag"], updated_at):
+        return Response(status_code=304, headers=headers), None
+
+    deck = await get_deck_json(db=db, category=category, version=version)
+    response = Response(
+        content=deck.body, media_type="application/json", headers=headers
+    )
+    return response, deck
+
+
+async def cards_response(
+    request: Request,
+    db: AsyncSession,
+    category: str | None = None,
+    limit: int | None = None,
+    after: int | None = None,
+) -> tuple[Response, DeckPayload | None]:
+    """
+    Picks the representation of a card listing requested by the client.
+
+    See `app.routes.cards.cards_response`.
+    """
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        stream = stream_cards_ndjson(
+            bind=db.bind, category=category, after=after, limit=limit
+        )
+        response, cards = StreamingResponse(stream, media_type=NDJSON_MEDIA_TYPE), None
+    elif limit is None and after is None:
+        response, cards = await deck_response(request=request, db=db, category=category)
+    else:
+        limit = limit or DEFAULT_PAGE_SIZE
+        cards, next_cursor = await get_cards_page(
+            db=db, category=category, after=after, limit=limit
+        )
+        response = Response(
+            content=cards.body,
+            media_type="application/json",
+            headers=page_headers(request, next_cursor, limit),
+        )
+    response.headers["Vary"] = "Accept"
+    return response, cards
+
+
+@async_cards_router.post("/", response_model=FlipCardResponse)
+async def create_card_route(
+    card_data: FlipCardCreate, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    This route creates a new flashcard based on the provided data.
+
+    Args:
+        card_data: The data used to create the card.
+        db (AsyncSession): Database session.
+
+    Returns:
+        FlipCardResponse: The created card.
+    """
+    return await create_card(db=db, card_data=card_data)
+
+
+@async_cards_router.post("/bulk", response_model=BulkImportResult)
+async def import_cards_route(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    This route imports many cards at once in a single transaction.
+
+    Args:
+        request (Request): The request carrying a JSON, NDJSON or CSV payload.
+        db (AsyncSession): Database session.
+
+    Returns:
+        BulkImportResult: The number of created, duplicate and invalid rows and
+        the outcome of every row.
+    """
+    body = await read_payload(request)
+    cards = parse_cards_payload(body, request.headers.get("content-type", ""))
+    return await import_cards(db=db, cards=cards)
+
+
+@async_cards_router.get("/changes", response_model=ChangesPage)
+async def read_changes(
+    since: int = Query(0, ge=0),
+    category: CategoryType | None = None,
+    limit: int = Query(DEFAULT_CHANGES_LIMIT, ge=1, le=MAX_CHANGES_LIMIT),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Route for syncing a local copy of the cards: returns what changed after `since`.
+
+    See `app.routes.cards.read_changes`.
+    """
+    return await get_changes(db=db, since=since, category=category, limit=limit)
+
+
+@async_cards_router.get("/events")
+async def stream_card_events(
+    request: Request,
+    category: CategoryType | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Route for receiving card changes as they happen, as Server-Sent Events.
+
+    See `app.routes.cards.stream_card_events`.
+    """
+    subscription = change_hub.subscribe(category)
+    try:
+        since = last_event_id(request)
+        replay = None
+        if since is not None:
+            replay = await get_changes(
+                db=db, since=since, category=category, limit=MAX_CHANGES_LIMIT
+            )
+    except BaseException:
+        change_hub.unsubscribe(subscription)
+        raise
+    return event_stream_response(subscription, replay)
+
+
+@async_cards_router.get("/search", response_model=SearchPage)
+async def search_cards_route(
+    q: str = Query(..., min_length=1, max_length=MAX_SEARCH_LENGTH),
+    category: CategoryType | None = None,
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Route for searching the front and back text of the cards.
+
+    See `app.routes.cards.search_cards_route`.
+    """
+    return await search_cards(db=db, q=q, category=category, limit=limit, offset=offset)
+
+
+@async_cards_router.get("/{category}/sample", response_model=list[FlipCardResponse])
+async def read_card_sample(
+    category: CategoryType,
+    n: int = Query(DEFAULT_SAMPLE_SIZE, ge=1, le=MAX_SAMPLE_SIZE),
+    seed: int | None = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Route for retrieving random cards from a category, e.g. for a quiz.
+
+    See `app.routes.cards.read_card_sample`.
+    """
+    sample = await sample_cards(db=db, category=category, n=n, seed=seed)
+    return Response(content=sample.body, media_type="application/json")
+
+
+@async_cards_router.get("/{category}", response_model=list[FlipCardResponse])
+async def read_cards_from_category(
+    category: CategoryType,
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: int | None = Query(None, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Route for retrieving all cards from a specific category.
+
+    Args:
+        category (CategoryType): The category to filter cards by.
+        request (Request): The incoming request with the conditional headers.
+        limit (int | None): The page size for keyset pagination.
+        after (int | None): The cursor from the previous page's X-Next-Cursor.
+        db (AsyncSession): The database session provided by dependency injection.
+
+    Returns:
+        list[FlipCardResponse]: A list of cards in the specified category,
+        sent as pre-encoded JSON.
+    """
+    try:
+        s3_logger.log_action(
+            LogAction.CARD_READ.value,
+            {"category": category, "operation": "read_cards_from_category"},
+        )
+
+        response, deck = await cards_response(
+            request=request, db=db, category=category, limit=limit, after=after
+        )
+
+        s3_logger.log_action(
+            LogAction.CARD_READ.value, read_log_details(category, response, deck)
+        )
+
+        return response
+    except Exception as e:
+        s3_logger.log_action(
+            LogAction.ERROR.value,
+            {
+                "category": category,
+                "operation": "read_cards_from_category",
+                "error": str(e),
+            },
+        )
+        raise
+
+
+@async_cards_router.get("/", response_model=list[FlipCardResponse])
+async def read_all_cards(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    after: int | None = Query(None, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Route for retrieving all cards.
+
+    Args:
+    request (Request): The incoming request with the conditional headers.
+    limit (int | None): The page size for keyset pagination.
+    after (int | None): The cursor from the previous page's X-Next-Cursor.
+    db (AsyncSession): The database session.
+
+    Returns:
+        list[FlipCardResponse]: A list of all cards, sent as pre-encoded JSON.
+    """
+    response, _ = await cards_response(request=request, db=db, limit=limit, after=after)
+    return response
+
+
+@async_cards_router.patch("/{card_id}", response_model=FlipCardResponse)
+async def edit_flip_card(
+    card_id: int, card_data: CardEdit, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    This route edits a card based on the provided card_id and card_data.
+
+    Args:
+        card_id: The id of the card to edit.
+        card_data: The data used to edit the card.
+        db (AsyncSession): Database session.
+
+    Returns:
+        FlipCardResponse: The edited card.
+
+    Raises:
+        HTTPException: 404 if the card is not found, 400 if the edit is invalid.
+    """
+    return await edit_card(db=db, card_data=card_data, card_id=card_id)
+
+
+@async_cards_router.delete("/{card_id}")
+async def delete_flip_card(card_id: int, db: AsyncSession = Depends(get_async_db)):
+    """
+    This route deletes a card based on the provided card_id.
+
+    Args:
+        card_id: The id of the card to delete.
+        db (AsyncSession): Database session.
+
+    Raises:
+        HTTPException: If the card is not found.
+    """
+    return await delete_card(card_id=card_id, db=db)
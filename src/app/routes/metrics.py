@@ -0,0 +1,118 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.database import pool_stats
+
+from app.utils.change_feed import change_hub
+from app.utils.deck_cache import deck_cache
+from app.utils.metrics import registry, render_stats
+from app.utils.presign import presign_service
+from app.utils.s3_logger import s3_logger
+from app.utils.single_flight import single_flight
+
+metrics_router = APIRouter(prefix="/api/metrics", tags=["Metrics"])
+prometheus_router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@metrics_router.get("/s3-logger")
+def read_s3_logger_metrics():
+    """
+    Route for retrieving the counters of the background S3 log shipper.
+
+    Returns:
+        dict: Enqueued, dropped, spooled-only and shipped record counts plus
+        queue depth.
+    """
+    return s3_logger.stats()
+
+
+@metrics_router.get("/cache")
+def read_deck_cache_metrics():
+    """
+    Route for retrieving the hit and miss counters of the deck cache.
+
+    Returns:
+        dict: Hits, misses, evictions, invalidations and the number of entries.
+    """
+    return deck_cache.stats()
+
+
+@metrics_router.get("/presign")
+def read_presign_cache_metrics():
+    """
+    Route for retrieving the hit and miss counters of the presigned URL cache.
+
+    Returns:
+        dict: Hits, misses, evictions, expirations and the number of entries.
+    """
+    return presign_service.cache.stats()
+
+
+@metrics_router.get("/change-feed")
+def read_change_feed_metrics():
+    """
+    Route for retrieving the connected clients and event counters of the change feed.
+
+    Returns:
+        dict: Subscribers, published and delivered events and slow clients
+        disconnected on overflow.
+    """
+    return change_hub.stats()
+
+
+@metrics_router.get("/single-flight")
+def read_single_flight_metrics():
+    """
+    Route for retrieving how many duplicate cold loads were coalesced.
+
+    Returns:
+        dict: Per kind of load ("deck", "card_ids"), the loads run, the
+        concurrent duplicates that shared them, the failures and the loads
+        in flight.
+    """
+    return single_flight.stats()
+
+
+@metrics_router.get("/pool")
+def read_pool_metrics():
+    """
+    Route for retrieving the connection pool gauges and checkout wait times.
+
+    Returns:
+        dict: Per engine, the connections in use, idle and in overflow, the
+        checkout, timeout and slow checkout counters and the wait histogram.
+    """
+    return pool_stats()
+
+
+@prometheus_router.get("/metrics", response_class=PlainTextResponse)
+def read_prometheus_metrics():
+    """
+    Route for scraping every metric in the Prometheus text format.
+
+    Returns:
+        PlainTextResponse: Request latency, status and in-flight metrics, the
+        internal span timings, and the pool, cache and S3 logger counters.
+    """
+    pools = {
+        (engine,): {k: v for k, v in stats.items() if k != "checkout_wait_seconds"}
+        for engine, stats in pool_stats().items()
+    }
+    sections = [
+        registry.render(),
+        render_stats("db_pool", pools, ("engine",)),
+        render_stats("deck_cache", {(): deck_cache.stats()}),
+        render_stats("presign_cache", {(): presign_service.cache.stats()}),
+        render_stats("change_feed", {(): change_hub.stats()}),
+        render_stats(
+            "single_flight",
+            {(kind,): stats for kind, stats in single_flight.stats().items()},
+            ("load",),
+        ),
+        render_stats("s3_logger", {(): s3_logger.stats()}),
+    ]
+    return PlainTextResponse(
+        "\n".join(sections) + "\n", media_type=PROMETHEUS_MEDIA_TYPE
+    )
@@ -0,0 +1,82 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import crud, crud_async
+from app.database import get_async_db, get_db
+from app.routes.cards import CategoryType
+from app.schemas import ReviewAnswer, ReviewCard
+
+review_router = APIRouter(prefix="/api/review", tags=["Review"])
+# Same routes on the AsyncSession data path (DB_ASYNC).
+async_review_router = APIRouter(prefix="/api/review", tags=["Review"])
+
+DEFAULT_REVIEW_LIMIT = 20
+MAX_REVIEW_LIMIT = 100
+
+
+@review_router.get("/next", response_model=list[ReviewCard])
+def read_review_queue(
+    category: CategoryType,
+    limit: int = Query(DEFAULT_REVIEW_LIMIT, ge=1, le=MAX_REVIEW_LIMIT),
+    db: Session = Depends(get_db),
+):
+    """
+    Route for retrieving the next cards due for review in a category.
+
+    Args:
+        category (CategoryType): The category to review.
+        limit (int): The maximum number of cards.
+        db (Session): The database session provided by dependency injection.
+
+    Returns:
+        list[ReviewCard]: The due cards with their schedule, most overdue first.
+    """
+    return crud.get_review_queue(db=db, category=category, limit=limit)
+
+
+@review_router.post("/{card_id}", response_model=ReviewCard)
+def answer_card(card_id: int, answer: ReviewAnswer, db: Session = Depends(get_db)):
+    """
+    Route for recording an answer to a card and scheduling its next review.
+
+    Args:
+        card_id (int): The ID of the reviewed card.
+        answer (ReviewAnswer): The answer grade, from 0 (blackout) to 5 (perfect).
+        db (Session): Database session.
+
+    Raises:
+        HTTPException: If the card is not found.
+
+    Returns:
+        ReviewCard: The card with its next due time.
+    """
+    return crud.record_review(db=db, card_id=card_id, quality=answer.quality)
+
+
+@async_review_router.get("/next", response_model=list[ReviewCard])
+async def read_review_queue_async(
+    category: CategoryType,
+    limit: int = Query(DEFAULT_REVIEW_LIMIT, ge=1, le=MAX_REVIEW_LIMIT),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Route for retrieving the next cards due for review in a category.
+
+    See `read_review_queue`.
+    """
+    return await crud_async.get_review_queue(db=db, category=category, limit=limit)
+
+
+@async_review_router.post("/{card_id}", response_model=ReviewCard)
+async def answer_card_async(
+    card_id: int, answer: ReviewAnswer, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Route for recording an answer to a card and scheduling its next review.
+
+    See `answer_card`.
+    """
+    return await crud_async.record_review(
+        db=db, card_id=card_id, quality=answer.quality
+    )
@@ -1,6 +1,7 @@
-from typing import Optional
+from datetime import datetime
+from typing import Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class BaseConfig(BaseModel):
@@ -31,3 +32,75 @@ class FlipCardResponse(BaseConfig):
     front_text: str
     back_text: str
     category: str
+
+
+class BulkImportRowResult(BaseModel):
+    row: int
+    status: Literal["created", "duplicate", "invalid"]
+    front_text: Optional[str] = None
+    detail: Optional[str] = None
+
+
+class BulkImportResult(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    results: list[BulkImportRowResult]
+
+
+class AssetUploadRequest(BaseModel):
+    folder: str
+    filename: str
+    content_type: str
+
+
+class AssetUploadForm(BaseModel):
+    url: str
+    fields: dict[str, str]
+    key: str
+    expires_in: int
+
+
+class ReviewCard(BaseConfig):
+    id: int
+    front_text: str
+    back_text: str
+    category: str
+    due_at: datetime
+    ease_factor: float
+    interval_days: int
+    repetitions: int
+    lapses: int
+
+
+class ReviewAnswer(BaseModel):
+    quality: int = Field(..., ge=0, le=5)
+
+
+class SearchHit(BaseConfig):
+    id: int
+    front_text: str
+    back_text: str
+    category: str
+    score: float
+
+
+class SearchPage(BaseModel):
+    results: list[SearchHit]
+    next_offset: Optional[int] = None
+
+
+class CardChangeEntry(BaseModel):
+    seq: int
+    op: Literal["upsert", "delete"]
+    id: int
+    front_text: Optional[str] = None
+    back_text: Optional[str] = None
+    category: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+
+class ChangesPage(BaseModel):
+    changes: list[CardChangeEntry]
+    since: int
+    has_more: bool
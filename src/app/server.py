@@ -0,0 +1,112 @@
+"""
+Production launcher: serves the API from several worker processes.
+
+    cd src && python -m app.server
+
+Pending migrations are applied once, then one worker per CPU core (or
+SERVER_WORKERS) is started under gunicorn: the app is imported once in the
+master and forked (preload), and `kill -HUP <master pid>`
+replaces the workers one batch at a time: new workers start (and warm up,
+with WARMUP_ON_STARTUP) before the old ones finish their in-flight requests
+and exit.
+Where gunicorn is unavailable (it does not run on Windows) it falls back to
+`uvicorn --workers`.
+"""
+
+import os
+
+import uvicorn
+
+from app.config import (
+    SERVER_GRACEFUL_TIMEOUT,
+    SERVER_HOST,
+    SERVER_KEEPALIVE,
+    SERVER_MAX_REQUESTS,
+    SERVER_MAX_REQUESTS_JITTER,
+    SERVER_PORT,
+    SERVER_RUN_MIGRATIONS,
+    SERVER_WORKERS,
+)
+from app.database import engine, init_db
+
+APP = "app.main:app"
+WORKER_CLASS = "uvicorn.workers.UvicornWorker"
+
+
+def worker_count() -> int:
+    """
+    Returns SERVER_WORKERS, or the number of CPU cores when it is 0.
+    """
+    return SERVER_WORKERS or os.cpu_count() or 1
+
+
+def post_fork(server, worker) -> None:
+    # Pooled connections must never be shared between processes; the
+    # worker opens its own (and warms them up in the startup hook).
+    engine.dispose(close=False)
+
+
+def gunicorn_options() -> dict:
+    """
+    Returns the gunicorn settings of the production server.
+    """
+    return {
+        "bind": f"{SERVER_HOST}:{SERVER_PORT}",
+        "workers": worker_count(),
+        "worker_class": WORKER_CLASS,
+        # Import the app once in the master so the workers share its memory.
+        "preload_app": True,
+        "graceful_timeout": SERVER_GRACEFUL_TIMEOUT,
+        "keepalive": SERVER_KEEPALIVE,
+        "max_requests": SERVER_MAX_REQUESTS,
+        "max_requests_jitter": SERVER_MAX_REQUESTS_JITTER,
+        "post_fork": post_fork,
+    }
+
+
+def run_gunicorn(options: dict) -> None:
+    from gunicorn.app.base import BaseApplication
+
+    class FlipCardsApplication(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app.main import app
+
+            return app
+
+    FlipCardsApplication().run()
+
+
+def run_uvicorn() -> None:
+    print("⚠️ gunicorn is not installed: starting uvicorn workers without preload")
+    uvicorn.run(
+        APP,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        workers=worker_count(),
+        timeout_keep_alive=SERVER_KEEPALIVE,
+        timeout_graceful_shutdown=SERVER_GRACEFUL_TIMEOUT,
+        limit_max_requests=SERVER_MAX_REQUESTS or None,
+    )
+
+
+def main() -> None:
+    if SERVER_RUN_MIGRATIONS:
+        applied = init_db()
+        print(f"✅ Migrations up to date ({len(applied)} applied now)")
+    # The workers open their own connections.
+    engine.dispose()
+
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        run_uvicorn()
+    else:
+        run_gunicorn(gunicorn_options())
+
+
+if __name__ == "__main__":
+    main()
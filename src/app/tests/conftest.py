@@ -1,13 +1,16 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 import unittest.mock as mock
 
 from app.main import app
+from app.migrations.runner import run_migrations
 from app.models import Base
 from app.tests.database_test import override_get_db, TEST_DATABASE_URL
 from app.database import get_db
+from app.utils.deck_cache import card_ids_cache, deck_cache
+from app.utils.search_index import search_index_cache
 
 # Create test database engine
 engine = create_engine(TEST_DATABASE_URL)
@@ -16,11 +19,20 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 
 @pytest.fixture(scope="function")
 def test_db():
-    # Create tables
-    Base.metadata.create_all(bind=engine)
+    # Create tables through the migrations, so the schema is the deployed one
+    # (e.g. the PostgreSQL search vector and indexes the models do not declare)
+    run_migrations(engine)
+    deck_cache.clear()
+    card_ids_cache.clear()
+    search_index_cache.clear()
     yield
     # Drop tables after test
     Base.metadata.drop_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS schema_migrations"))
+    deck_cache.clear()
+    card_ids_cache.clear()
+    search_index_cache.clear()
 
 
 @pytest.fixture(scope="function")
@@ -47,3 +59,56 @@ def mock_s3_logger():
     with mock.patch("app.utils.s3_logger.s3_logger.log_action") as mock_log:
         mock_log.return_value = None
         yield mock_log
+
+
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client used by the services."""
+
+    def __init__(self):
+        self.objects = {}
+        self.metadata = {}
+        self.puts = 0
+        self.parts = {}
+        self.signed = 0
+        self.fail = False
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        if self.fail:
+            raise ConnectionError("S3 is unavailable")
+        self.objects[Key] = Body
+        self.metadata[Key] = kwargs
+        self.puts += 1
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None):
+        # Reads part by part like the boto3 transfer manager.
+        part_size = Config.multipart_chunksize if Config else 8 * 1024 * 1024
+        parts = []
+        while chunk := Fileobj.read(part_size):
+            parts.append(chunk)
+        self.put_object(
+            Bucket=Bucket, Key=Key, Body=b"".join(parts), **(ExtraArgs or {})
+        )
+        self.parts[Key] = len(parts)
+
+    def list_objects_v2(self, Bucket, Prefix=""):
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        return {"Contents": [{"Key": key} for key in keys], "KeyCount": len(keys)}
+
+    def generate_presigned_url(self, ClientMethod, Params, ExpiresIn):
+        self.signed += 1
+        return (
+            f"https://{Params['Bucket']}.s3.amazonaws.com/{Params['Key']}"
+            f"?Expires={ExpiresIn}&Signature={self.signed}"
+        )
+
+    def generate_presigned_post(self, Bucket, Key, Fields, Conditions, ExpiresIn):
+        return {
+            "url": f"https://{Bucket}.s3.amazonaws.com/",
+            "fields": {**Fields, "key": Key, "policy": repr(Conditions)},
+        }
+
+
+@pytest.fixture(scope="function")
+def fake_s3():
+    """Returns an in-memory S3 client"""
+    return FakeS3Client()
@@ -0,0 +1,110 @@
+import time
+from unittest import mock
+
+import pytest
+
+from app.utils.presign import PresignService, presign_service
+
+
+@pytest.fixture
+def presign(fake_s3):
+    presign_service.s3_client = fake_s3
+    presign_service.cache.clear()
+    yield presign_service
+    presign_service.s3_client = None
+    presign_service.cache.clear()
+
+
+def test_read_asset_redirects_to_presigned_url(client, presign):
+    response = client.get("/api/assets/icons/rocket.svg", follow_redirects=False)
+
+    assert response.status_code == 307
+    assert response.headers["location"].startswith(
+        f"https://{presign.bucket_name}.s3.amazonaws.com/icons/rocket.svg?"
+    )
+    max_age = int(response.headers["cache-control"].split("max-age=")[1])
+    assert 0 < max_age <= presign.download_expires - presign.refresh_margin
+
+
+def test_download_urls_are_signed_once_per_key(fake_s3):
+    service = PresignService(download_expires=3600, refresh_margin=300)
+    service.s3_client = fake_s3
+
+    first, _ = service.download_url("icons/rocket.svg")
+    second, _ = service.download_url("icons/rocket.svg")
+    service.download_url("icons/dsa-icon.svg")
+
+    assert first == second
+    assert fake_s3.signed == 2
+    assert service.cache.stats()["hits"] == 1
+
+
+def test_download_url_is_resigned_near_expiry(fake_s3):
+    service = PresignService(download_expires=60, refresh_margin=60)
+    service.s3_client = fake_s3
+
+    first, max_age = service.download_url("icons/rocket.svg")
+    second, _ = service.download_url("icons/rocket.svg")
+
+    assert max_age == 0
+    assert first != second
+
+
+def test_cached_download_url_is_not_returned_close_to_expiry(fake_s3):
+    service = PresignService(download_expires=3600, refresh_margin=300)
+    service.s3_client = fake_s3
+    first, _ = service.download_url("icons/rocket.svg")
+
+    # 3400s later the first URL has less than the refresh margin left.
+    later = {"monotonic": time.monotonic() + 3400, "time": time.time() + 3400}
+    with (
+        mock.patch("time.monotonic", return_value=later["monotonic"]),
+        mock.patch("time.time", return_value=later["time"]),
+    ):
+        second, max_age = service.download_url("icons/rocket.svg")
+
+    assert second != first
+    assert max_age == 3600 - 300
+
+
+@pytest.mark.parametrize(
+    "key", ["logs/2025/01/01/log.json", "icons/../logs/x.json", "rocket.svg"]
+)
+def test_read_asset_rejects_private_keys(client, presign, key):
+    response = client.get(f"/api/assets/{key}", follow_redirects=False)
+
+    assert response.status_code == 404
+    assert presign.s3_client.signed == 0
+
+
+def test_create_asset_upload(client, presign):
+    response = client.post(
+        "/api/assets/uploads",
+        json={
+            "folder": "images",
+            "filename": "Photo.JPG",
+            "content_type": "image/jpeg",
+        },
+    )
+
+    assert response.status_code == 200
+    form = response.json()
+    assert form["key"].startswith("images/") and form["key"].endswith(".jpg")
+    assert form["fields"]["key"] == form["key"]
+    assert form["fields"]["Content-Type"] == "image/jpeg"
+    assert "content-length-range" in form["fields"]["policy"]
+    assert form["expires_in"] == presign.upload_expires
+
+
+@pytest.mark.parametrize(
+    "upload",
+    [
+        {"folder": "logs", "filename": "a.png", "content_type": "image/png"},
+        {"folder": "images", "filename": "a.exe", "content_type": "image/png"},
+        {"folder": "images", "filename": "a.png", "content_type": "text/html"},
+    ],
+)
+def test_create_asset_upload_rejects_invalid_requests(client, presign, upload):
+    response = client.post("/api/assets/uploads", json=upload)
+
+    assert response.status_code == 400
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+import threading
+
+from app.utils.aws import get_s3_client
+from app.utils.s3 import S3Service
+from app.utils.s3_logger import S3Logger
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_importing_app_does_not_load_boto3():
+    """Testing - Starting the app defers boto3 until S3 is used - should pass."""
+    probe = "import sys, app.main; print('boto3' in sys.modules)"
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    env.setdefault("DATABASE_URL", "sqlite://")
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_services_share_one_s3_client():
+    """Testing - Concurrent first use creates a single shared client - should pass."""
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(get_s3_client()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(client is clients[0] for client in clients)
+    assert S3Service().s3_client is clients[0]
+    assert S3Logger().s3_client is clients[0]
+    assert clients[0].meta.config.max_pool_connections >= 10
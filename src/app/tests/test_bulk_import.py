@@ -0,0 +1,112 @@
+from unittest import mock
+
+from app.models import FlipCard
+from app.utils.card_import import NOT_AN_OBJECT
+
+
+def test_bulk_import_json_reports_every_row(client, db_session):
+    """Testing - Bulk JSON import creates new cards and reports the rest."""
+    db_session.add(
+        FlipCard(front_text="What is a list?", back_text="...", category="DSA")
+    )
+    db_session.commit()
+
+    payload = [
+        {
+            "front_text": "What is a set?",
+            "back_text": "Unique items",
+            "category": "DSA",
+        },
+        {"front_text": "What is a list?", "back_text": "...", "category": "DSA"},
+        {"front_text": "What is CSS?", "back_text": "Styles", "category": "INVALIDCAT"},
+        {"front_text": "What is a set?", "back_text": "Again", "category": "DSA"},
+        {"front_text": "What is HTML?"},
+    ]
+
+    response = client.post("/api/cards/bulk", json=payload)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["duplicates"], data["invalid"]) == (1, 2, 2)
+    assert [row["status"] for row in data["results"]] == [
+        "created",
+        "duplicate",
+        "invalid",
+        "duplicate",
+        "invalid",
+    ]
+    assert db_session.query(FlipCard).count() == 2
+
+
+def test_bulk_import_csv_invalidates_deck(client):
+    """Testing - A CSV import is visible in the next category read."""
+    assert client.get("/api/cards/LINUX").json() == []
+
+    csv_payload = (
+        "front_text,back_text,category\n"
+        "What does pwd do?,Prints the working directory,LINUX\n"
+        '"What does ls -a do?","Lists all files, including hidden",LINUX\n'
+    )
+    response = client.post(
+        "/api/cards/bulk",
+        content=csv_payload,
+        headers={"Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 2
+    cards = client.get("/api/cards/LINUX").json()
+    assert cards[1]["back_text"] == "Lists all files, including hidden"
+
+
+def test_bulk_import_ndjson_reports_malformed_lines(client):
+    """Testing - A malformed NDJSON line is reported without failing the import."""
+    ndjson_payload = (
+        '{"front_text": "What is Helm?", "back_text": "...", "category": "KUBERNETES"}\n'
+        "{not json}\n"
+    )
+
+    response = client.post(
+        "/api/cards/bulk",
+        content=ndjson_payload,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 1
+    assert response.json()["results"][1]["status"] == "invalid"
+
+
+def test_bulk_import_reports_rows_that_are_not_objects(client):
+    """Testing - A JSON string row is invalid, not mistaken for a parse error."""
+    response = client.post(
+        "/api/cards/bulk",
+        content='"What is a pod?"\n{not json}\n',
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["invalid", "invalid"]
+    assert results[0]["detail"] == NOT_AN_OBJECT
+    assert results[1]["detail"].startswith("Invalid JSON")
+
+
+def test_bulk_import_payload_too_large(client):
+    """Testing - A body larger than the import limit is refused - should fail."""
+    with mock.patch("app.utils.card_import.BULK_IMPORT_MAX_BYTES", 64):
+        response = client.post(
+            "/api/cards/bulk",
+            content=b"[" + b" " * 100 + b"]",
+            headers={"Content-Type": "application/json"},
+        )
+
+    assert response.status_code == 413
+
+
+def test_bulk_import_unsupported_content_type(client):
+    """Testing - An unsupported content type is rejected - should fail."""
+    response = client.post(
+        "/api/cards/bulk", content=b"...", headers={"Content-Type": "text/plain"}
+    )
+
+    assert response.status_code == 415
@@ -0,0 +1,121 @@
+import gzip
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.models import FlipCard
+from app.tests.conftest import TestingSessionLocal
+from app.utils import bundles
+from app.utils.bundles import (
+    IMMUTABLE_CACHE_CONTROL,
+    DeckBundler,
+    ImmutableStaticFiles,
+    deck_bundler,
+)
+
+
+@pytest.fixture
+def bundle_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(deck_bundler, "directory", str(tmp_path))
+    return tmp_path
+
+
+def read_bundle(bundle_dir, entry) -> list[dict]:
+    with gzip.open(bundle_dir / entry["file"]) as bundle:
+        return [json.loads(line) for line in bundle]
+
+
+def test_manifest_builds_bundles(client, db_session, bundle_dir):
+    """Testing - Every deck gets a content-addressed gzip NDJSON bundle."""
+    db_session.add_all(
+        [
+            FlipCard(front_text="What is a VM?", back_text="...", category="AZURE"),
+            FlipCard(
+                front_text="What is a pod?", back_text="...", category="KUBERNETES"
+            ),
+        ]
+    )
+    db_session.commit()
+
+    response = client.get("/api/bundles/")
+
+    assert response.status_code == 200
+    bundles = response.json()["bundles"]
+    azure = bundles["AZURE"]
+    assert azure["count"] == 1
+    assert azure["url"] == f"/bundles/AZURE-{azure['sha256'][:16]}.ndjson.gz"
+    # The hash covers the file as downloaded, so clients can verify it.
+    for entry in bundles.values():
+        downloaded = (bundle_dir / entry["url"].rsplit("/", 1)[1]).read_bytes()
+        assert hashlib.sha256(downloaded).hexdigest() == entry["sha256"]
+        assert len(downloaded) == entry["size"]
+    assert read_bundle(bundle_dir, azure)[0]["front_text"] == "What is a VM?"
+    assert bundles["OOP"]["count"] == 0
+    assert bundles["all"]["count"] == 2
+    assert {card["category"] for card in read_bundle(bundle_dir, bundles["all"])} == {
+        "AZURE",
+        "KUBERNETES",
+    }
+
+
+def test_only_changed_bundles_are_rebuilt(client, bundle_dir):
+    """Testing - A write rebuilds its category bundle and "all", nothing else."""
+    first = client.get("/api/bundles/")
+    etag = first.headers["etag"]
+    assert (
+        client.get("/api/bundles/", headers={"If-None-Match": etag}).status_code == 304
+    )
+
+    client.post(
+        "/api/cards/",
+        json={"front_text": "What is Git?", "back_text": "...", "category": "GENERAL"},
+    )
+    second = client.get("/api/bundles/", headers={"If-None-Match": etag})
+
+    assert second.status_code == 200
+    before, after = first.json()["bundles"], second.json()["bundles"]
+    changed = {
+        name for name in after if after[name]["sha256"] != before[name]["sha256"]
+    }
+    assert changed == {"GENERAL", "all"}
+    assert (bundle_dir / before["GENERAL"]["file"]).exists()
+
+
+def test_worker_processes_share_one_build(db_session, tmp_path):
+    """Testing - Bundlers sharing a directory build each bundle once."""
+    db_session.add(
+        FlipCard(front_text="What is a VM?", back_text="...", category="AZURE")
+    )
+    db_session.commit()
+    # One bundler per worker process: only the file lock orders them.
+    workers = [DeckBundler(str(tmp_path)) for _ in range(4)]
+
+    def manifest(bundler):
+        with TestingSessionLocal() as db:
+            return bundler.manifest(db)
+
+    stream = bundles.stream_cards_ndjson
+    with mock.patch.object(bundles, "stream_cards_ndjson", side_effect=stream) as build:
+        with ThreadPoolExecutor(len(workers)) as pool:
+            manifests = list(pool.map(manifest, workers))
+
+    assert all(manifest == manifests[0] for manifest in manifests)
+    assert build.call_count == len(manifests[0]["bundles"]) - 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_bundles_are_served_immutable(tmp_path):
+    """Testing - Bundle files are served with a long-lived immutable policy."""
+    (tmp_path / "OOP-0123.ndjson.gz").write_bytes(gzip.compress(b"{}\n"))
+    app = FastAPI()
+    app.mount("/bundles", ImmutableStaticFiles(directory=tmp_path))
+
+    response = TestClient(app).get("/bundles/OOP-0123.ndjson.gz")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
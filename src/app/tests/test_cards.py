@@ -1,3 +1,5 @@
+import json
+
 from app.models import FlipCard
 
 
@@ -105,3 +107,152 @@ def test_delete_card_invalid_id(client):
 
     assert response.status_code == 404
     assert f"Card with ID {fake_card_id} not found!" in response.json()["detail"]
+
+
+def test_edit_card_invalid_data(client, db_session):
+    """Test - Invalid edits keep their 400 status, a missing card gets 404."""
+    card = FlipCard(front_text="What is a fork?", back_text="...", category="LINUX")
+    db_session.add(card)
+    db_session.commit()
+
+    invalid_category = client.patch(f"/api/cards/{card.id}", json={"category": "NOPE"})
+    assert invalid_category.status_code == 400
+    assert "not a valid category" in invalid_category.json()["detail"]
+
+    assert client.patch(f"/api/cards/{card.id}", json={}).status_code == 400
+    assert (
+        client.patch("/api/cards/999999", json={"category": "DSA"}).status_code == 404
+    )
+
+
+def test_read_cards_from_category_matches_response_model(client, db_session):
+    """Testing - The pre-encoded deck matches the FlipCardResponse schema - should pass."""
+    db_session.add_all(
+        [
+            FlipCard(
+                front_text="What is a VM?",
+                back_text="Virtual machine",
+                category="AZURE",
+            ),
+            FlipCard(
+                front_text="Каква е ролята на ls?",
+                back_text="Lists files",
+                category="LINUX",
+            ),
+            FlipCard(
+                front_text="What is AKS?", back_text="Managed k8s", category="AZURE"
+            ),
+        ]
+    )
+    db_session.commit()
+
+    response = client.get("/api/cards/AZURE")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [
+        {
+            "front_text": "What is a VM?",
+            "back_text": "Virtual machine",
+            "category": "AZURE",
+        },
+        {"front_text": "What is AKS?", "back_text": "Managed k8s", "category": "AZURE"},
+    ]
+    assert (
+        client.get("/api/cards/LINUX").json()[0]["front_text"]
+        == "Каква е ролята на ls?"
+    )
+
+
+def test_read_cards_from_category_not_modified(client):
+    """Testing - A matching If-None-Match gets 304 until the deck changes."""
+    card_data = {
+        "front_text": "What is a pod?",
+        "back_text": "...",
+        "category": "KUBERNETES",
+    }
+    client.post("/api/cards/", json=card_data)
+
+    response = client.get("/api/cards/KUBERNETES")
+    etag = response.headers["etag"]
+    assert "last-modified" in response.headers
+
+    cached = client.get("/api/cards/KUBERNETES", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    card_data["front_text"] = "What is a node?"
+    client.post("/api/cards/", json=card_data)
+
+    changed = client.get("/api/cards/KUBERNETES", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()) == 2
+
+
+def test_read_all_cards_if_modified_since(client):
+    """Testing - If-Modified-Since at the Last-Modified time gets 304."""
+    card_data = {"front_text": "What is grep?", "back_text": "...", "category": "LINUX"}
+    client.post("/api/cards/", json=card_data)
+
+    last_modified = client.get("/api/cards/").headers["last-modified"]
+    response = client.get("/api/cards/", headers={"If-Modified-Since": last_modified})
+
+    assert response.status_code == 304
+
+
+def test_read_cards_from_category_keyset_pagination(client, db_session):
+    """Testing - Pages follow the X-Next-Cursor header until the last page."""
+    db_session.add_all(
+        [
+            FlipCard(
+                front_text=f"Docker question {i}?", back_text="...", category="DOCKER"
+            )
+            for i in range(5)
+        ]
+    )
+    db_session.commit()
+
+    fronts = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/api/cards/DOCKER", params=params)
+        assert response.status_code == 200
+        fronts += [card["front_text"] for card in response.json()]
+        if "x-next-cursor" not in response.headers:
+            break
+        params = {"limit": 2, "after": response.headers["x-next-cursor"]}
+
+    assert fronts == [f"Docker question {i}?" for i in range(5)]
+
+
+def test_read_all_cards_ndjson_stream(client, db_session):
+    """Testing - Accept: application/x-ndjson streams one card per line."""
+    db_session.add_all(
+        [
+            FlipCard(front_text="What is a DAG?", back_text="...", category="DSA"),
+            FlipCard(front_text="What is HTTP?", back_text="...", category="WEB"),
+        ]
+    )
+    db_session.commit()
+
+    response = client.get("/api/cards/", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["front_text"] for line in lines] == ["What is a DAG?", "What is HTTP?"]
+    assert lines[0]["id"] < lines[1]["id"]
+    assert response.headers["vary"] == "Accept"
+
+    limited = client.get(
+        "/api/cards/",
+        params={"limit": 1},
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert [json.loads(line)["front_text"] for line in limited.text.splitlines()] == [
+        "What is a DAG?"
+    ]
+
+    # The JSON deck of the same URL varies on Accept too.
+    assert client.get("/api/cards/").headers["vary"] == "Accept"
@@ -0,0 +1,188 @@
+import asyncio
+import threading
+
+from unittest import mock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app import crud
+from app.database import get_async_db, to_async_url, to_sync_url
+from app.models import FlipCard
+from app.routes.cards_async import async_cards_router
+from app.tests.database_test import TEST_DATABASE_URL
+
+
+@pytest.fixture(scope="function")
+def async_app(test_db):
+    try:
+        engine = create_async_engine(
+            to_async_url(TEST_DATABASE_URL), poolclass=NullPool
+        )
+    except ImportError:
+        pytest.skip("async database driver is not installed")
+    AsyncTestingSession = async_sessionmaker(
+        engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_async_db():
+        async with AsyncTestingSession() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_cards_router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+@pytest.fixture(scope="function")
+def async_client(async_app):
+    with TestClient(async_app) as c:
+        yield c
+
+
+def test_async_create_and_read_cards(async_client):
+    """Testing - Cards created on the async path are returned by the deck read."""
+    card_data = {
+        "front_text": "What is asyncio?",
+        "back_text": "...",
+        "category": "WEB",
+    }
+
+    response = async_client.post("/api/cards/", json=card_data)
+    assert response.status_code == 200
+
+    response = async_client.get("/api/cards/WEB")
+    assert response.status_code == 200
+    assert response.json() == [card_data]
+
+    cached = async_client.get(
+        "/api/cards/WEB", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert cached.status_code == 304
+
+
+def test_async_edit_and_delete_card(async_client, db_session):
+    """Testing - Edit and delete work on the async path - should pass."""
+    card = FlipCard(front_text="What is a coroutine?", back_text="...", category="WEB")
+    db_session.add(card)
+    db_session.commit()
+
+    response = async_client.patch(f"/api/cards/{card.id}", json={"category": "DSA"})
+    assert response.status_code == 200
+    assert response.json()["category"] == "DSA"
+
+    assert async_client.delete(f"/api/cards/{card.id}").status_code == 200
+    assert async_client.delete(f"/api/cards/{card.id}").status_code == 404
+    assert async_client.get("/api/cards/").json() == []
+
+
+def test_async_pagination_and_stream(async_client, db_session):
+    """Testing - Keyset pages and the NDJSON stream work on the async path."""
+    db_session.add_all(
+        [
+            FlipCard(front_text=f"Async question {i}?", back_text="...", category="OOP")
+            for i in range(3)
+        ]
+    )
+    db_session.commit()
+
+    page = async_client.get("/api/cards/OOP", params={"limit": 2})
+    assert len(page.json()) == 2
+    assert "x-next-cursor" in page.headers
+
+    stream = async_client.get(
+        "/api/cards/OOP", headers={"Accept": "application/x-ndjson"}
+    )
+    assert len(stream.text.splitlines()) == 3
+    assert stream.headers["vary"] == "Accept"
+
+    stream = async_client.get(
+        "/api/cards/OOP",
+        params={"limit": 2},
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert len(stream.text.splitlines()) == 2
+
+
+def test_async_sample(async_client, db_session):
+    """Testing - Seeded samples work on the async path - should pass."""
+    db_session.add_all(
+        [
+            FlipCard(front_text=f"Async sample {i}?", back_text="...", category="DSA")
+            for i in range(20)
+        ]
+    )
+    db_session.commit()
+
+    first = async_client.get("/api/cards/DSA/sample", params={"n": 5, "seed": 1})
+    second = async_client.get("/api/cards/DSA/sample", params={"n": 5, "seed": 1})
+
+    assert first.status_code == 200
+    assert len(first.json()) == 5
+    assert first.json() == second.json()
+
+
+def test_async_concurrent_searches_on_a_cold_index(async_app, db_session):
+    """Testing - Concurrent searches share one index build without blocking the loop."""
+    db_session.add_all(
+        [
+            FlipCard(front_text=f"Async search {i}?", back_text="...", category="WEB")
+            for i in range(10)
+        ]
+    )
+    db_session.commit()
+    responses = []
+
+    async def search_concurrently():
+        transport = httpx.ASGITransport(app=async_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            searches = [
+                c.get("/api/cards/search", params={"q": "search"}) for _ in range(4)
+            ]
+            responses.extend(await asyncio.gather(*searches))
+
+    # A deadlock would freeze the event loop, so the scenario runs in its own
+    # thread and the test fails instead of hanging.
+    thread = threading.Thread(target=asyncio.run, args=(search_concurrently(),))
+    thread.daemon = True
+    thread.start()
+    thread.join(timeout=30)
+
+    assert not thread.is_alive(), "concurrent searches deadlocked"
+    assert [response.status_code for response in responses] == [200] * 4
+    assert all(len(response.json()["results"]) == 10 for response in responses)
+
+
+def test_async_writes_run_off_the_event_loop(async_client):
+    """Testing - Writes on the async path run in a worker thread - should pass."""
+    threads = []
+    create_card = crud.create_card
+
+    def record_thread(db, card_data):
+        threads.append(threading.get_ident())
+        return create_card(db, card_data)
+
+    card_data = {
+        "front_text": "What is a thread?",
+        "back_text": "...",
+        "category": "OOP",
+    }
+    with mock.patch.object(crud, "create_card", side_effect=record_thread):
+        response = async_client.post("/api/cards/", json=card_data)
+
+    assert response.status_code == 200
+    assert threads and threads[0] != async_client.portal.call(threading.get_ident)
+    assert async_client.get("/api/cards/OOP").json() == [card_data]
+
+
+def test_to_sync_url():
+    """Testing - Async URLs map back to the sync drivers - should pass."""
+    url = to_sync_url("postgresql+asyncpg://user:pw@db/flip?ssl=require")
+    assert url.drivername == "postgresql"
+    assert dict(url.query) == {"sslmode": "require"}
+    assert to_sync_url(to_async_url("sqlite:///flip.db")).drivername == "sqlite"
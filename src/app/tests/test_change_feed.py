@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+from app.crud import create_card, delete_card, edit_card
+from app.models import FlipCard
+from app.schemas import CardChangeEntry, CardEdit, ChangesPage, FlipCardCreate
+from app.utils.change_feed import ChangeHub, change_hub, emit_change, reset_event
+
+
+def parse_events(chunks: list[bytes]) -> list[dict]:
+    events = []
+    for chunk in chunks:
+        fields = dict(
+            line.split(": ", 1) for line in chunk.decode().splitlines() if ": " in line
+        )
+        if "event" in fields:
+            events.append({**fields, "data": json.loads(fields["data"])})
+    return events
+
+
+async def read_stream(stream, count: int) -> list[bytes]:
+    chunks = []
+    async for chunk in stream:
+        chunks.append(chunk)
+        if len(parse_events(chunks)) == count:
+            break
+    await stream.aclose()
+    return chunks
+
+
+def test_writes_are_pushed_to_subscribers_after_commit(db_session):
+    """Testing - Created, edited and deleted cards reach the subscribers."""
+
+    async def scenario():
+        everything = change_hub.subscribe()
+        oop = change_hub.subscribe("OOP")
+        dsa = change_hub.subscribe("DSA")
+
+        # Events of a rolled back transaction are never published.
+        db_session.add(FlipCard(front_text="Gone?", back_text="A", category="OOP"))
+        db_session.flush()
+        emit_change(db_session, reset_event(["OOP"], "test"))
+        db_session.rollback()
+
+        card = create_card(
+            db_session, FlipCardCreate(front_text="Q?", back_text="A", category="OOP")
+        )
+        card_id = db_session.query(FlipCard.id).filter_by(front_text="Q?").scalar()
+        edit_card(db_session, card_id, CardEdit(category="DSA"))
+        delete_card(db_session, card_id)
+        await asyncio.sleep(0)
+
+        streams = [change_hub.stream(s) for s in (everything, oop, dsa)]
+        return card, [parse_events(await read_stream(s, 3)) for s in streams[:1]] + [
+            parse_events(await read_stream(s, 2)) for s in streams[1:]
+        ]
+
+    card, (everything, oop, dsa) = asyncio.run(scenario())
+
+    assert [(e["event"], e["id"]) for e in everything] == [
+        ("card.created", "1"),
+        ("card.updated", "3"),
+        ("card.deleted", "4"),
+    ]
+    assert everything[0]["data"]["front_text"] == card.front_text
+    assert everything[1]["data"]["category"] == "DSA"
+    assert everything[2]["data"] == {
+        "seq": 4,
+        "op": "delete",
+        "id": everything[0]["data"]["id"],
+        "category": "DSA",
+    }
+    # Moving the card out of OOP is pushed to OOP subscribers too.
+    assert [e["event"] for e in oop] == ["card.created", "card.updated"]
+    assert [e["event"] for e in dsa] == ["card.updated", "card.deleted"]
+    assert change_hub.stats()["subscribers"] == 0
+
+
+def test_stream_replays_missed_changes_first():
+    """Testing - A reconnecting client gets the missed changes once."""
+    hub = ChangeHub()
+    replay = ChangesPage(
+        changes=[
+            CardChangeEntry(seq=5, op="upsert", id=1, front_text="Q?", back_text="A"),
+            CardChangeEntry(seq=6, op="delete", id=2),
+        ],
+        since=6,
+        has_more=False,
+    )
+
+    async def scenario():
+        subscription = hub.subscribe()
+        hub.publish(
+            {"event": "card.deleted", "categories": ["OOP"], "data": {"seq": 6}}
+        )
+        hub.publish(
+            {"event": "card.created", "categories": ["OOP"], "data": {"seq": 7}}
+        )
+        return await read_stream(hub.stream(subscription, replay), 3)
+
+    chunks = asyncio.run(scenario())
+
+    assert chunks[0] == b"retry: 3000\n\n"
+    assert [(e["event"], e["id"]) for e in parse_events(chunks)] == [
+        ("card.updated", "5"),
+        ("card.deleted", "6"),
+        ("card.created", "7"),
+    ]
+
+
+def test_slow_subscriber_is_reset():
+    """Testing - A client that falls behind gets a reset and is disconnected."""
+    hub = ChangeHub(queue_size=2)
+
+    async def scenario():
+        subscription = hub.subscribe()
+        for seq in range(1, 5):
+            hub.publish(
+                {"event": "card.created", "categories": [], "data": {"seq": seq}}
+            )
+        await asyncio.sleep(0)
+        return [chunk async for chunk in hub.stream(subscription)]
+
+    events = parse_events(asyncio.run(scenario()))
+
+    assert [e["event"] for e in events] == ["reset"]
+    assert events[0]["data"] == {"reason": "overflow"}
+    assert hub.stats()["overflows"] == 1
+    assert hub.stats()["subscribers"] == 0
+
+
+def test_change_feed_rejects_unknown_category(client):
+    """Testing - Subscribing to an unknown category - should fail."""
+    response = client.get("/api/cards/events", params={"category": "NOPE"})
+
+    assert response.status_code == 422
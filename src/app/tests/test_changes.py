@@ -0,0 +1,81 @@
+def create(client, front_text: str, category: str = "OOP") -> None:
+    response = client.post(
+        "/api/cards/",
+        json={"front_text": front_text, "back_text": "...", "category": category},
+    )
+    assert response.status_code == 200
+
+
+def test_changes_from_zero_return_every_card(client):
+    """Testing - Syncing from 0 returns every card as an upsert - should pass."""
+    create(client, "What is a class?")
+    create(client, "What is a graph?", category="DSA")
+
+    page = client.get("/api/cards/changes").json()
+
+    assert [(c["op"], c["front_text"]) for c in page["changes"]] == [
+        ("upsert", "What is a class?"),
+        ("upsert", "What is a graph?"),
+    ]
+    assert page["changes"][0]["updated_at"] is not None
+    assert page["since"] == 2
+    assert page["has_more"] is False
+    assert client.get("/api/cards/changes", params={"since": 2}).json()["changes"] == []
+
+
+def test_changes_report_edits_and_deletes_once(client):
+    """Testing - Each changed card appears once with its latest state."""
+    create(client, "What is a mixin?")
+    create(client, "What is a trait?")
+    since = client.get("/api/cards/changes").json()["since"]
+
+    client.patch("/api/cards/1", json={"back_text": "A reusable class"})
+    client.patch("/api/cards/1", json={"back_text": "A reusable base class"})
+    client.delete("/api/cards/2")
+
+    page = client.get("/api/cards/changes", params={"since": since}).json()
+    assert [(c["id"], c["op"]) for c in page["changes"]] == [
+        (1, "upsert"),
+        (2, "delete"),
+    ]
+    assert page["changes"][0]["back_text"] == "A reusable base class"
+    assert page["changes"][1]["front_text"] is None
+
+
+def test_changes_by_category_and_pagination(client):
+    """Testing - Moving a card is a delete in the old category - should pass."""
+    create(client, "What is a queue?")
+    create(client, "What is a stack?")
+    client.patch("/api/cards/1", json={"category": "DSA"})
+
+    oop = client.get("/api/cards/changes", params={"category": "OOP"}).json()
+    dsa = client.get("/api/cards/changes", params={"category": "DSA"}).json()
+    assert [(c["id"], c["op"]) for c in oop["changes"]] == [
+        (2, "upsert"),
+        (1, "delete"),
+    ]
+    assert [(c["id"], c["op"]) for c in dsa["changes"]] == [(1, "upsert")]
+
+    first = client.get("/api/cards/changes", params={"limit": 2}).json()
+    assert first["has_more"] is True
+    rest = client.get(
+        "/api/cards/changes", params={"since": first["since"], "limit": 2}
+    ).json()
+    assert rest["has_more"] is False
+    assert [c["id"] for c in rest["changes"]] == [1]
+
+
+def test_bulk_import_is_logged(client):
+    """Testing - Cards created by a bulk import appear in the change log."""
+    cards = [
+        {"front_text": f"Imported {i}?", "back_text": "...", "category": "WEB"}
+        for i in range(3)
+    ]
+    client.post("/api/cards/bulk", json=cards)
+
+    page = client.get("/api/cards/changes", params={"category": "WEB"}).json()
+    assert sorted(c["front_text"] for c in page["changes"]) == [
+        "Imported 0?",
+        "Imported 1?",
+        "Imported 2?",
+    ]
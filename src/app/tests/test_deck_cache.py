@@ -0,0 +1,88 @@
+from app.models import FlipCard
+from app.utils.deck_cache import DeckCache, deck_cache
+from app.utils.ttl_cache import TTLCache
+
+
+def test_deck_cache_evicts_least_recently_used():
+    """Testing - The least recently used deck is evicted first - should pass."""
+    cache = DeckCache(max_entries=2, ttl=60)
+    cache.set("OOP", ["oop"])
+    cache.set("DSA", ["dsa"])
+    cache.get("OOP")
+    cache.set("WEB", ["web"])
+
+    assert cache.get("DSA") is None
+    assert cache.get("OOP") == ["oop"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_deck_cache_expires_entries():
+    """Testing - Entries older than the TTL are treated as misses - should pass."""
+    cache = DeckCache(max_entries=2, ttl=0)
+    cache.set("OOP", ["oop"])
+
+    assert cache.get("OOP") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_ttl_cache_entries_can_expire_sooner():
+    """Testing - A per-entry TTL overrides the cache TTL - should pass."""
+    cache = TTLCache(max_entries=2, ttl=60)
+    cache.set("short", "url", ttl=0)
+    cache.set("long", "url")
+
+    assert cache.get("short") is None
+    assert cache.get("long") == "url"
+    assert "invalidations" not in cache.stats()
+
+
+def test_deck_cache_ignores_stale_loads():
+    """Testing - A load started before an invalidation is not stored."""
+    cache = DeckCache(max_entries=2, ttl=60)
+    generation = cache.generation("OOP")
+    cache.invalidate("OOP")
+
+    assert not cache.set("OOP", ["stale"], generation)
+    assert cache.get("OOP") is None
+
+
+def test_read_category_is_served_from_cache(client):
+    """Testing - Repeated category reads hit the cache until a card is created."""
+    card_data = {"front_text": "What is SOLID?", "back_text": "...", "category": "OOP"}
+
+    hits = deck_cache.stats()["hits"]
+    assert client.get("/api/cards/OOP").json() == []
+    assert client.get("/api/cards/OOP").json() == []
+    assert deck_cache.stats()["hits"] == hits + 1
+
+    client.post("/api/cards/", json=card_data)
+
+    assert len(client.get("/api/cards/OOP").json()) == 1
+    assert len(client.get("/api/cards/").json()) == 1
+
+
+def test_edit_card_invalidates_old_and_new_category(client, db_session):
+    """Testing - Moving a card drops both the old and the new category deck."""
+    card_data = {"front_text": "What is a heap?", "back_text": "...", "category": "OOP"}
+    client.post("/api/cards/", json=card_data)
+    card_id = db_session.query(FlipCard.id).scalar()
+
+    assert len(client.get("/api/cards/OOP").json()) == 1
+    assert client.get("/api/cards/DSA").json() == []
+
+    response = client.patch(f"/api/cards/{card_id}", json={"category": "DSA"})
+    assert response.status_code == 200
+
+    assert client.get("/api/cards/OOP").json() == []
+    assert len(client.get("/api/cards/DSA").json()) == 1
+
+
+def test_cache_metrics_route(client):
+    """Testing - Cache counters are exposed on the metrics route - should pass."""
+    misses = deck_cache.stats()["misses"]
+    client.get("/api/cards/WEB")
+
+    response = client.get("/api/metrics/cache")
+
+    assert response.status_code == 200
+    assert response.json()["misses"] == misses + 1
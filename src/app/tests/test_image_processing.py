@@ -0,0 +1,73 @@
+import io
+from unittest import mock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from app.main import app
+from app.utils.image_processing import (
+    ImageProcessor,
+    ImageTooLargeError,
+    image_processor,
+    transform_image,
+)
+
+
+def make_image(size: tuple[int, int], format: str = "JPEG", mode: str = "RGB") -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, size, color="red" if mode != "P" else 1).save(output, format=format)
+    return output.getvalue()
+
+
+@pytest.fixture
+def processor():
+    processor = ImageProcessor(max_workers=1, max_pending=1, timeout=30)
+    yield processor
+    processor.shutdown()
+
+
+def test_transform_image_downscales_jpeg():
+    """Testing - A large JPEG fits the bounding box after processing - should pass."""
+    result = Image.open(io.BytesIO(transform_image(make_image((4000, 3000)))))
+
+    assert result.format == "JPEG"
+    assert result.size == (300, 225)
+
+
+def test_transform_image_converts_palette_png():
+    """Testing - Palette images are converted to RGB JPEG - should pass."""
+    result = Image.open(io.BytesIO(transform_image(make_image((50, 50), "PNG", "P"))))
+
+    assert result.format == "JPEG"
+    assert result.mode == "RGB"
+
+
+def test_transform_image_rejects_decompression_bombs():
+    """Testing - Images over the pixel limit are rejected before decoding."""
+    with pytest.raises(ImageTooLargeError):
+        transform_image(make_image((100, 100), "PNG"), max_pixels=5000)
+
+
+def test_processor_runs_jobs_in_worker_process(processor):
+    """Testing - Jobs run in the pool and errors map to HTTP errors - should pass."""
+    result = processor.process(make_image((1200, 600)), max_size=(100, 100))
+    assert Image.open(io.BytesIO(result)).size == (100, 50)
+
+    with pytest.raises(HTTPException) as too_large:
+        processor.process(make_image((100, 100), "PNG"), max_pixels=5000)
+    assert too_large.value.status_code == 413
+
+    with pytest.raises(HTTPException) as invalid:
+        processor.process(b"not an image")
+    assert invalid.value.status_code == 400
+
+
+def test_worker_processes_stop_on_app_shutdown():
+    """Testing - The application shutdown hook stops the image workers."""
+    with mock.patch.object(image_processor, "shutdown") as shutdown:
+        with TestClient(app):
+            pass
+
+    shutdown.assert_called_once_with()
@@ -0,0 +1,42 @@
+from app.utils.metrics import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text():
+    """Testing - Counters and histograms render in the text format - should pass."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("status",))
+    latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    requests.inc(status=200)
+    requests.inc(status=200)
+    latency.observe(0.5)
+
+    text = registry.render()
+
+    assert 'requests_total{status="200"} 2' in text
+    assert 'latency_seconds_bucket{le="0.1"} 0' in text
+    assert 'latency_seconds_bucket{le="1.0"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 1' in text
+    assert "latency_seconds_count 1" in text
+
+
+def test_metrics_route_reports_request_spans(client):
+    """Testing - A deck read shows up with its route, status and spans."""
+    client.get("/api/cards/OOP")
+    client.get("/no/such/route")
+
+    response = client.get("/metrics")
+    text = response.text
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_requests_total{method="GET",route="/api/cards/{category}",status="200"}'
+        in text
+    )
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"}' in text
+    for span_name in ("db", "serialize"):
+        assert (
+            f'http_request_span_seconds_count{{route="/api/cards/{{category}}",'
+            f'span="{span_name}"}}' in text
+        )
+    assert 'db_query_duration_seconds_count{statement="SELECT"}' in text
@@ -0,0 +1,97 @@
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+
+from app.migrations.runner import run_migrations
+from app.models import Base, CardChange, FlipCard
+
+CATEGORY_INDEXES = {"ix_flipcards_category_id", "ix_flipcards_category_front_text"}
+
+
+@pytest.fixture
+def fresh_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    yield engine
+    engine.dispose()
+
+
+def flipcards_indexes(engine) -> set[str]:
+    return {index["name"] for index in inspect(engine).get_indexes("flipcards")}
+
+
+def test_migrations_create_schema_once(fresh_engine):
+    """Testing - Pending migrations run once and are recorded - should pass."""
+    assert run_migrations(fresh_engine) == ["0001", "0002", "0003", "0004", "0005"]
+    assert run_migrations(fresh_engine) == []
+
+    assert CATEGORY_INDEXES <= flipcards_indexes(fresh_engine)
+    assert "deck_versions" in inspect(fresh_engine).get_table_names()
+
+
+def test_migrations_build_the_model_schema(fresh_engine, tmp_path):
+    """Testing - A fresh database gets the same tables as the models declare."""
+    run_migrations(fresh_engine)
+    models_engine = create_engine(f"sqlite:///{tmp_path / 'models.db'}")
+    Base.metadata.create_all(bind=models_engine)
+
+    def schema(engine) -> dict:
+        inspector = inspect(engine)
+        return {
+            table: (
+                {
+                    column["name"]: str(column["type"])
+                    for column in inspector.get_columns(table)
+                },
+                sorted(
+                    (index["name"], index["column_names"], bool(index["unique"]))
+                    for index in inspector.get_indexes(table)
+                ),
+            )
+            for table in Base.metadata.tables
+        }
+
+    assert schema(fresh_engine) == schema(models_engine)
+    models_engine.dispose()
+
+
+def test_migrations_add_indexes_to_existing_table(fresh_engine):
+    """Testing - A table created before the indexes existed gets them added."""
+    FlipCard.__table__.create(bind=fresh_engine)
+    with fresh_engine.begin() as connection:
+        for index in FlipCard.__table__.indexes:
+            if index.name in CATEGORY_INDEXES:
+                index.drop(bind=connection)
+    assert not CATEGORY_INDEXES & flipcards_indexes(fresh_engine)
+
+    run_migrations(fresh_engine)
+
+    assert CATEGORY_INDEXES <= flipcards_indexes(fresh_engine)
+
+
+def test_migrations_upgrade_existing_rows(fresh_engine):
+    """Testing - Existing cards get a due schedule and a change log entry."""
+    with fresh_engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE flipcards (id INTEGER PRIMARY KEY, "
+                "front_text VARCHAR NOT NULL UNIQUE, back_text VARCHAR, "
+                "category VARCHAR(10) NOT NULL)"
+            )
+        )
+        connection.execute(
+            text("INSERT INTO flipcards VALUES (1, 'Old card?', '...', 'OOP')")
+        )
+
+    run_migrations(fresh_engine)
+
+    assert "ix_flipcards_category_due_at" in flipcards_indexes(fresh_engine)
+    with fresh_engine.connect() as connection:
+        card = connection.execute(select(FlipCard.__table__)).one()
+    assert card.due_at is not None
+    assert card.ease_factor == 2.5
+    assert (card.interval_days, card.repetitions, card.lapses) == (0, 0, 0)
+    assert card.last_reviewed_at is None
+    assert card.updated_at is not None
+
+    with fresh_engine.connect() as connection:
+        change = connection.execute(select(CardChange.__table__)).one()
+    assert (change.seq, change.card_id, change.category) == (1, 1, "OOP")
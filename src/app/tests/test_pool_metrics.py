@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.tests.database_test import TEST_DATABASE_URL
+from app.utils.pool_metrics import InstrumentedQueuePool, PoolMetrics, instrument_pool
+
+
+@pytest.fixture
+def small_engine():
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_pool_metrics_count_checkouts_and_timeouts(small_engine):
+    """Testing - Checkouts are timed and an exhausted pool counts a timeout."""
+    metrics = PoolMetrics("test", slow_checkout_ms=10_000)
+    instrument_pool(small_engine.pool, metrics)
+
+    with small_engine.connect():
+        assert metrics.stats(small_engine.pool)["in_use"] == 1
+        with pytest.raises(PoolTimeoutError):
+            small_engine.connect()
+
+    stats = metrics.stats(small_engine.pool)
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["connects"] == 1
+    assert stats["in_use"] == 0
+    assert stats["checkout_wait_seconds"]["count"] == 2
+
+
+def test_pool_metrics_warn_on_slow_checkout(small_engine, capsys):
+    """Testing - Checkouts over the threshold are counted and reported."""
+    metrics = PoolMetrics("test", slow_checkout_ms=0)
+    instrument_pool(small_engine.pool, metrics)
+
+    with small_engine.connect():
+        pass
+
+    assert metrics.stats(small_engine.pool)["slow_checkouts"] == 1
+    assert "Slow test pool checkout" in capsys.readouterr().out
+
+
+def test_pool_metrics_survive_dispose(small_engine):
+    """Testing - Metrics stay attached when the engine re-creates its pool."""
+    metrics = PoolMetrics("test", slow_checkout_ms=10_000)
+    instrument_pool(small_engine.pool, metrics)
+    small_engine.dispose()
+
+    with small_engine.connect():
+        pass
+
+    assert metrics.stats(small_engine.pool)["connects"] == 1
+
+
+def test_pool_metrics_route(client):
+    """Testing - Pool gauges are exposed on the metrics route - should pass."""
+    response = client.get("/api/metrics/pool")
+
+    assert response.status_code == 200
+    assert {"in_use", "overflow", "timeouts", "checkout_wait_seconds"} <= set(
+        response.json()["sync"]
+    )
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+
+from app import crud
+from app.models import FlipCard
+from app.utils.scheduler import MIN_EASE_FACTOR, ReviewState, next_review
+
+NOW = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_next_review_grows_interval_on_good_answers():
+    """Testing - SM-2 intervals go 1, 6, then interval times ease - should pass."""
+    state = ReviewState()
+    intervals = []
+    for _ in range(4):
+        state, due_at = next_review(state, 4, NOW)
+        intervals.append(state.interval_days)
+
+    assert intervals == [1, 6, 15, 38]
+    assert due_at == NOW + timedelta(days=38)
+    assert state.ease_factor == 2.5
+
+
+def test_next_review_resets_on_failed_answer():
+    """Testing - A failed answer restarts the card and lowers the ease."""
+    state = ReviewState(ease_factor=1.4, interval_days=30, repetitions=5)
+
+    state, due_at = next_review(state, 1, NOW)
+
+    assert state.repetitions == 0
+    assert state.interval_days == 1
+    assert state.lapses == 1
+    assert state.ease_factor == MIN_EASE_FACTOR
+    assert due_at == NOW + timedelta(days=1)
+
+
+def test_review_queue_returns_due_cards_of_category(client, db_session):
+    """Testing - Only due cards of the category are returned, most overdue first."""
+    db_session.add_all(
+        [
+            FlipCard(front_text="Due later?", back_text="...", category="OOP"),
+            FlipCard(
+                front_text="Due first?",
+                back_text="...",
+                category="OOP",
+                due_at=NOW - timedelta(days=2),
+            ),
+            FlipCard(
+                front_text="Not due?",
+                back_text="...",
+                category="OOP",
+                due_at=datetime.now(timezone.utc) + timedelta(days=3),
+            ),
+            FlipCard(front_text="Other deck?", back_text="...", category="DSA"),
+        ]
+    )
+    db_session.commit()
+
+    response = client.get("/api/review/next", params={"category": "OOP"})
+
+    assert response.status_code == 200
+    assert [card["front_text"] for card in response.json()] == [
+        "Due first?",
+        "Due later?",
+    ]
+    limited = client.get("/api/review/next", params={"category": "OOP", "limit": 1})
+    assert len(limited.json()) == 1
+
+
+def test_answer_card_schedules_next_review(client, db_session):
+    """Testing - Answering a card moves it out of the queue - should pass."""
+    card = FlipCard(front_text="What is SM-2?", back_text="...", category="GENERAL")
+    db_session.add(card)
+    db_session.commit()
+
+    response = client.post(f"/api/review/{card.id}", json={"quality": 5})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["repetitions"] == 1
+    assert data["interval_days"] == 1
+    assert data["ease_factor"] == 2.6
+    assert client.get("/api/review/next", params={"category": "GENERAL"}).json() == []
+
+
+def test_answer_card_validation(client):
+    """Testing - Unknown cards and out-of-range grades are rejected."""
+    assert client.post("/api/review/999", json={"quality": 3}).status_code == 404
+    assert client.post("/api/review/1", json={"quality": 6}).status_code == 422
+
+
+def test_record_review_with_explicit_time(db_session):
+    """Testing - The due time is computed from the time of the answer."""
+    card = FlipCard(front_text="What is a lapse?", back_text="...", category="DSA")
+    db_session.add(card)
+    db_session.commit()
+
+    reviewed = crud.record_review(db_session, card.id, 2, now=NOW)
+
+    assert reviewed.lapses == 1
+    assert reviewed.due_at.replace(tzinfo=timezone.utc) == NOW + timedelta(days=1)
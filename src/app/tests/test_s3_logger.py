@@ -0,0 +1,142 @@
+import json
+import threading
+
+from app.utils.log_spool import LogSpool
+from app.utils.s3_logger import S3Logger
+
+
+def make_logger(fake_s3, **kwargs):
+    logger = S3Logger(**kwargs)
+    logger.s3_client = fake_s3
+    return logger
+
+
+def test_log_action_batches_records_into_one_object(fake_s3):
+    """Testing - Queued records are shipped as a single NDJSON object - should pass."""
+    logger = make_logger(fake_s3, batch_size=100, flush_interval=60)
+
+    for i in range(10):
+        logger.log_action("card_read", {"card_id": i})
+
+    assert logger.flush()
+    logger.close()
+
+    assert len(fake_s3.objects) == 1
+    key, body = next(iter(fake_s3.objects.items()))
+    assert key.startswith("logs/batch_") and key.endswith(".ndjson")
+    lines = [json.loads(line) for line in body.decode("utf-8").splitlines()]
+    assert [line["details"]["card_id"] for line in lines] == list(range(10))
+    assert logger.stats()["records_shipped"] == 10
+
+
+def test_log_action_ships_when_batch_is_full(fake_s3):
+    """Testing - A full batch is shipped without an explicit flush - should pass."""
+    logger = make_logger(fake_s3, batch_size=5, flush_interval=60)
+
+    for i in range(10):
+        logger.log_action("card_read", {"card_id": i})
+
+    logger.close()
+
+    assert len(fake_s3.objects) == 2
+    assert logger.stats()["batches_shipped"] == 2
+
+
+def test_log_action_drops_when_queue_is_full(fake_s3):
+    """Testing - Records are dropped, not blocked on, when the queue is full."""
+    release = threading.Event()
+    original_put = fake_s3.put_object
+
+    def slow_put_object(**kwargs):
+        release.wait(5)
+        original_put(**kwargs)
+
+    fake_s3.put_object = slow_put_object
+    logger = make_logger(fake_s3, max_queue_size=5, batch_size=1, flush_interval=60)
+
+    for i in range(50):
+        logger.log_action("card_read", {"card_id": i})
+
+    stats = logger.stats()
+    release.set()
+    logger.close()
+
+    assert stats["dropped"] > 0
+    assert stats["backpressure_events"] > 0
+    assert stats["enqueued"] + stats["dropped"] == 50
+
+
+def test_log_action_counts_upload_errors(fake_s3):
+    """Testing - A failed upload is counted instead of raising - should pass."""
+    fake_s3.fail = True
+    logger = make_logger(fake_s3, batch_size=100, flush_interval=60)
+
+    logger.log_action("card_read", {"card_id": 1})
+    logger.close()
+
+    assert logger.stats()["upload_errors"] == 1
+    assert logger.stats()["records_lost"] == 1
+
+
+def test_spooled_records_survive_s3_outage(fake_s3, tmp_path):
+    """Testing - Spooled records stay on disk while S3 is down and replay later."""
+    fake_s3.fail = True
+    logger = make_logger(fake_s3, batch_size=100, spool_dir=str(tmp_path))
+
+    for i in range(3):
+        logger.log_action("card_created", {"card_id": i})
+
+    assert not logger.flush(timeout=0.5)
+    logger.close()
+
+    assert fake_s3.objects == {}
+    assert len(list(tmp_path.glob("*.ndjson"))) == 1
+
+    fake_s3.fail = False
+    restarted = make_logger(fake_s3, batch_size=100, spool_dir=str(tmp_path))
+    restarted.start()
+    assert restarted.flush()
+    restarted.close()
+
+    assert list(tmp_path.iterdir()) == []
+    body = b"".join(fake_s3.objects.values()).decode("utf-8")
+    assert [json.loads(line)["details"]["card_id"] for line in body.splitlines()] == [
+        0,
+        1,
+        2,
+    ]
+
+
+def test_spooled_records_are_on_disk_before_log_action_returns(fake_s3, tmp_path):
+    """Testing - A spooled record outlives a full queue and a stalled shipper."""
+    logger = make_logger(
+        fake_s3, max_queue_size=1, batch_size=100, spool_dir=str(tmp_path)
+    )
+    # A shipper that never runs, as if the process died right after logging.
+    logger._ensure_worker = lambda: None
+    logger.spool = LogSpool(str(tmp_path))
+
+    for i in range(3):
+        logger.log_action("card_created", {"card_id": i})
+
+    stats = logger.stats()
+    assert stats["dropped"] == 0
+    assert stats["enqueued"] == 1
+    assert stats["spooled_only"] == 2
+    (segment,) = tmp_path.glob("*.open")
+    lines = segment.read_text().splitlines()
+    assert [json.loads(line)["details"]["card_id"] for line in lines] == [0, 1, 2]
+
+
+def test_spool_recovers_segment_of_dead_process(fake_s3, tmp_path):
+    """Testing - An open segment left by a crashed process is replayed on startup."""
+    orphan = tmp_path / "segment_999999_1.open"
+    orphan.write_bytes(b'{"action": "card_deleted"}\n{"action": "card_')
+
+    logger = make_logger(fake_s3, spool_dir=str(tmp_path))
+    logger.start()
+    assert logger.flush()
+    logger.close()
+
+    assert list(fake_s3.objects.values()) == [b'{"action": "card_deleted"}\n']
+    assert list(tmp_path.iterdir()) == []
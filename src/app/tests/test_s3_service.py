@@ -0,0 +1,97 @@
+import io
+import os
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from PIL import Image
+from starlette.datastructures import Headers
+
+from app.utils.s3 import S3Service
+
+
+def make_upload(data: bytes, filename: str, content_type: str) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(data),
+        filename=filename,
+        headers=Headers({"content-type": content_type}),
+    )
+
+
+def make_png(size=(800, 600)) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", size, color="blue").save(output, format="PNG")
+    return output.getvalue()
+
+
+@pytest.fixture
+def s3_service(fake_s3):
+    service = S3Service()
+    service.bucket_name = "test-bucket"
+    service.s3_client = fake_s3
+    return service
+
+
+def test_upload_image_stores_renditions_once(s3_service, fake_s3):
+    """Testing - Re-uploading the same image reuses its renditions - should pass."""
+    image = make_png()
+
+    first = s3_service.upload_image(
+        make_upload(image, "icon.png", "image/png"), "icons"
+    )
+    uploads = fake_s3.puts
+    second = s3_service.upload_image(
+        make_upload(image, "copy.png", "image/png"), "icons"
+    )
+
+    assert first == second
+    assert uploads == len(S3Service.RENDITIONS)
+    assert fake_s3.puts == uploads
+    assert set(first) == {"thumb-96.jpeg", "card-300.jpeg", "card-300.webp"}
+
+    webp_key = first["card-300.webp"].split(".com/")[1]
+    assert Image.open(io.BytesIO(fake_s3.objects[webp_key])).size == (300, 225)
+    assert fake_s3.metadata[webp_key]["ContentType"] == "image/webp"
+    assert "immutable" in fake_s3.metadata[webp_key]["CacheControl"]
+
+
+def test_upload_file_is_content_addressed(s3_service, fake_s3):
+    """Testing - Identical files share one key and differing files do not."""
+    svg = b"<svg xmlns='http://www.w3.org/2000/svg'/>"
+
+    first = s3_service.upload_file(make_upload(svg, "a.svg", "image/svg+xml"), "icons")
+    second = s3_service.upload_file(make_upload(svg, "b.svg", "image/svg+xml"), "icons")
+    other = s3_service.upload_file(
+        make_upload(svg + b" ", "a.svg", "image/svg+xml"), "icons"
+    )
+
+    assert first == second != other
+    assert fake_s3.puts == 2
+
+
+def test_upload_file_streams_in_parts(s3_service, fake_s3):
+    """Testing - Large files are uploaded part by part - should pass."""
+    from boto3.s3.transfer import TransferConfig
+
+    s3_service.MAX_FILE_SIZE = 10 * 1024 * 1024
+    s3_service._transfer_config = TransferConfig(multipart_chunksize=1024 * 1024)
+    data = os.urandom(3 * 1024 * 1024 + 10)
+
+    url = s3_service.upload_file(
+        make_upload(data, "deck.pdf", "application/pdf"), "media"
+    )
+
+    key = url.split(".com/")[1]
+    assert fake_s3.objects[key] == data
+    assert fake_s3.parts[key] == 4
+
+
+def test_upload_file_rejects_oversized_files_while_reading(s3_service, fake_s3):
+    """Testing - A file over the limit fails without being uploaded - should pass."""
+    s3_service.MAX_FILE_SIZE = 1024
+    upload = make_upload(b"x" * 4096, "big.png", "image/png")
+
+    with pytest.raises(HTTPException) as error:
+        s3_service.upload_file(upload, "media")
+
+    assert error.value.status_code == 413
+    assert fake_s3.puts == 0
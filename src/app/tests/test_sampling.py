@@ -0,0 +1,69 @@
+from app.models import FlipCard
+from app.utils.deck_cache import card_ids_cache
+
+
+def add_cards(db_session, count: int, category: str = "DSA") -> None:
+    db_session.add_all(
+        [
+            FlipCard(
+                front_text=f"{category} sample {i}?", back_text="...", category=category
+            )
+            for i in range(count)
+        ]
+    )
+    db_session.commit()
+
+
+def test_sample_returns_distinct_cards_of_category(client, db_session):
+    """Testing - A sample holds n distinct cards of the category - should pass."""
+    add_cards(db_session, 30)
+    add_cards(db_session, 5, category="OOP")
+
+    response = client.get("/api/cards/DSA/sample", params={"n": 10})
+
+    assert response.status_code == 200
+    cards = response.json()
+    assert len(cards) == 10
+    assert len({card["front_text"] for card in cards}) == 10
+    assert {card["category"] for card in cards} == {"DSA"}
+
+
+def test_sample_with_seed_is_reproducible(client, db_session):
+    """Testing - The same seed returns the same cards in the same order."""
+    add_cards(db_session, 50)
+
+    first = client.get("/api/cards/DSA/sample", params={"n": 5, "seed": 42}).json()
+    second = client.get("/api/cards/DSA/sample", params={"n": 5, "seed": 42}).json()
+    other = client.get("/api/cards/DSA/sample", params={"n": 5, "seed": 7}).json()
+
+    assert first == second
+    assert first != other
+
+
+def test_sample_of_small_or_empty_deck(client, db_session):
+    """Testing - n larger than the deck returns the whole deck; empty gives []."""
+    add_cards(db_session, 3)
+
+    assert len(client.get("/api/cards/DSA/sample", params={"n": 10}).json()) == 3
+    assert client.get("/api/cards/WEB/sample").json() == []
+    assert client.get("/api/cards/DSA/sample", params={"n": 0}).status_code == 422
+
+
+def test_sample_sees_created_and_deleted_cards(client, db_session):
+    """Testing - The cached id array follows creates and deletes - should pass."""
+    add_cards(db_session, 2)
+    client.get("/api/cards/DSA/sample")
+    assert list(card_ids_cache.get("DSA").ids) == [1, 2]
+
+    client.post(
+        "/api/cards/",
+        json={"front_text": "New sample?", "back_text": "...", "category": "DSA"},
+    )
+    client.delete("/api/cards/1")
+
+    cards = client.get("/api/cards/DSA/sample", params={"n": 10}).json()
+    assert sorted(card["front_text"] for card in cards) == [
+        "DSA sample 1?",
+        "New sample?",
+    ]
+    assert list(card_ids_cache.get("DSA").ids) == [2, 3]
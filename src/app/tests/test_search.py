@@ -0,0 +1,154 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.crud import search_query
+from app.models import FlipCard
+from app.tests.database_test import engine
+from app.utils.search_index import InvertedIndex
+
+postgres_only = pytest.mark.skipif(
+    engine.dialect.name != "postgresql", reason="needs the PostgreSQL test database"
+)
+
+
+def make_index(*cards) -> InvertedIndex:
+    return InvertedIndex.build(
+        SimpleNamespace(id=i, category=c, front_text=f, back_text=b)
+        for i, (c, f, b) in enumerate(cards, start=1)
+    )
+
+
+def test_inverted_index_ranks_front_matches_first():
+    """Testing - Front text matches outrank back text matches - should pass."""
+    index = make_index(
+        ("DOCKER", "What is an image?", "A docker template"),
+        ("DOCKER", "What is docker?", "A container runtime"),
+        ("LINUX", "What is a shell?", "A command interpreter"),
+    )
+
+    assert [card_id for card_id, _ in index.search("docker")] == [2, 1]
+    assert [card_id for card_id, _ in index.search("what docker")] == [2, 1]
+    assert index.search("docker shell") == []
+
+
+def test_inverted_index_tolerates_typos_and_filters():
+    """Testing - Misspelled terms match similar ones; category filters apply."""
+    index = make_index(
+        ("KUBERNETES", "What is kubernetes?", "An orchestrator"),
+        ("DOCKER", "Docker vs kubernetes?", "..."),
+    )
+
+    assert {card_id for card_id, _ in index.search("kubernets")} == {1, 2}
+    assert index.search("kubernets", category="DOCKER")[0][0] == 2
+    assert index.search("xyzzy") == []
+
+
+def test_inverted_index_pagination():
+    """Testing - Pages of equal scores are ordered by id - should pass."""
+    index = make_index(*[("OOP", f"Class question {i}?", "...") for i in range(5)])
+
+    assert [card_id for card_id, _ in index.search("class", limit=2)] == [1, 2]
+    assert [card_id for card_id, _ in index.search("class", offset=4)] == [5]
+
+
+def test_search_route(client, db_session):
+    """Testing - Search returns ranked pages and sees new cards - should pass."""
+    db_session.add_all(
+        [
+            FlipCard(
+                front_text=f"Polymorphism question {i}?",
+                back_text="...",
+                category="OOP",
+            )
+            for i in range(3)
+        ]
+        + [FlipCard(front_text="What is a heap?", back_text="A tree", category="DSA")]
+    )
+    db_session.commit()
+
+    response = client.get("/api/cards/search", params={"q": "polymorphsm", "limit": 2})
+    assert response.status_code == 200
+    page = response.json()
+    assert [hit["front_text"] for hit in page["results"]] == [
+        "Polymorphism question 0?",
+        "Polymorphism question 1?",
+    ]
+    assert page["next_offset"] == 2
+    assert page["results"][0]["score"] > 0
+
+    client.post(
+        "/api/cards/",
+        json={"front_text": "What is a trie?", "back_text": "...", "category": "DSA"},
+    )
+    page = client.get(
+        "/api/cards/search", params={"q": "what", "category": "DSA"}
+    ).json()
+    assert [hit["front_text"] for hit in page["results"]] == [
+        "What is a heap?",
+        "What is a trie?",
+    ]
+    assert page["next_offset"] is None
+
+
+def test_search_query_uses_postgres_indexes():
+    """Testing - The PostgreSQL query matches the search vector and trigrams."""
+    sql = str(
+        search_query("kubernets", category="DOCKER", limit=5, offset=10).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert "websearch_to_tsquery" in sql
+    assert "flipcards.search_vector @@" in sql
+    assert "<%% flipcards.front_text" in sql
+    assert "flipcards.category = " in sql
+
+
+@postgres_only
+def test_search_route_postgres(client, db_session):
+    """Testing - Full-text, phrase and typo searches on PostgreSQL - should pass."""
+    db_session.add_all(
+        [
+            FlipCard(
+                front_text="What is kubernetes?",
+                back_text="A container orchestrator",
+                category="KUBERNETES",
+            ),
+            FlipCard(
+                front_text="What is a pod?",
+                back_text="The smallest kubernetes unit",
+                category="KUBERNETES",
+            ),
+            FlipCard(
+                front_text="What is docker?",
+                back_text="A container runtime",
+                category="DOCKER",
+            ),
+        ]
+    )
+    db_session.commit()
+
+    def search(**params) -> list[str]:
+        response = client.get("/api/cards/search", params=params)
+        assert response.status_code == 200
+        return [hit["front_text"] for hit in response.json()["results"]]
+
+    # Front text matches outrank back text matches.
+    assert search(q="kubernetes") == ["What is kubernetes?", "What is a pod?"]
+    assert search(q="kuberntes") == ["What is kubernetes?"]
+    assert search(q='"container runtime"') == ["What is docker?"]
+    assert search(q="container -docker") == ["What is kubernetes?"]
+    assert search(q="container", category="DOCKER") == ["What is docker?"]
+
+
+def test_search_route_validation(client):
+    """Testing - Empty queries and unknown categories are rejected."""
+    assert client.get("/api/cards/search", params={"q": ""}).status_code == 422
+    assert (
+        client.get(
+            "/api/cards/search", params={"q": "x", "category": "NOPE"}
+        ).status_code
+        == 422
+    )
@@ -0,0 +1,42 @@
+from unittest import mock
+
+from app import server
+from app.tests.database_test import TestingSessionLocal, engine
+from app.utils.deck_cache import ALL_CARDS_KEY, deck_cache
+from app.utils.warmup import warm_up
+
+
+def test_gunicorn_options_preload_one_worker_per_core():
+    """Testing - The production server preloads the app and uses every core."""
+    with (
+        mock.patch.object(server, "SERVER_WORKERS", 0),
+        mock.patch.object(server.os, "cpu_count", return_value=6),
+    ):
+        options = server.gunicorn_options()
+
+    assert options["workers"] == 6
+    assert options["preload_app"] is True
+    assert options["worker_class"] == "uvicorn.workers.UvicornWorker"
+    assert options["graceful_timeout"] == server.SERVER_GRACEFUL_TIMEOUT
+
+    with mock.patch.object(server, "SERVER_WORKERS", 3):
+        assert server.gunicorn_options()["workers"] == 3
+
+
+def test_warm_up_fills_pool_and_deck_cache(client):
+    """Testing - Warm-up opens connections and caches every deck."""
+    client.post(
+        "/api/cards/",
+        json={"front_text": "What is a fork?", "back_text": "...", "category": "LINUX"},
+    )
+    deck_cache.clear()
+
+    result = warm_up(engine, TestingSessionLocal, pool_size=2)
+
+    assert result["connections"] == 2
+    assert result["decks"] == 10
+    assert deck_cache.get("LINUX").count == 1
+    assert deck_cache.get(ALL_CARDS_KEY).count == 1
+    assert deck_cache.get("OOP").count == 0
+    # The route is served from the warm cache.
+    assert client.get("/api/cards/LINUX").json()[0]["front_text"] == "What is a fork?"
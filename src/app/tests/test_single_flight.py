@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from app import crud
+from app.utils.deck_cache import DeckPayload
+from app.utils.single_flight import SingleFlight, single_flight
+
+CALLERS = 8
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_concurrent_loads_are_coalesced():
+    """Testing - Concurrent callers of one key share a single load."""
+    flight = SingleFlight()
+    release = threading.Event()
+    loads = []
+
+    def load():
+        loads.append(1)
+        release.wait(5)
+        return "deck"
+
+    with ThreadPoolExecutor(CALLERS) as pool:
+        futures = [
+            pool.submit(flight.do, ("deck", "OOP"), load) for _ in range(CALLERS)
+        ]
+        wait_for(lambda: flight.stats()["deck"]["coalesced"] == CALLERS - 1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["deck"] * CALLERS
+    assert len(loads) == 1
+    assert flight.stats() == {
+        "deck": {"loads": 1, "coalesced": CALLERS - 1, "errors": 0, "in_flight": 0}
+    }
+    # Nothing is kept: the next call loads again.
+    assert flight.do(("deck", "OOP"), lambda: "fresh") == "fresh"
+
+
+def test_failed_load_is_raised_to_every_caller():
+    """Testing - Waiters get the error of the shared load - should fail."""
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def load():
+        release.wait(5)
+        raise RuntimeError("database is down")
+
+    with ThreadPoolExecutor(2) as pool:
+        futures = [pool.submit(flight.do, ("deck", "DSA"), load) for _ in range(2)]
+        wait_for(lambda: flight.stats()["deck"]["coalesced"] == 1)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="database is down"):
+                future.result()
+
+    assert flight.stats()["deck"]["errors"] == 1
+
+
+def test_async_loads_are_coalesced():
+    """Testing - Concurrent coroutines share one load; cancelled waiters do not stop it."""
+    flight = SingleFlight()
+    loads = []
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return "deck"
+
+    async def scenario():
+        callers = [
+            asyncio.ensure_future(flight.do_async(("deck", "WEB"), load))
+            for _ in range(CALLERS)
+        ]
+        await asyncio.sleep(0)
+        callers[1].cancel()
+        return await asyncio.gather(*callers, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert results[:1] + results[2:] == ["deck"] * (CALLERS - 1)
+    assert len(loads) == 1
+    assert flight.stats()["deck"]["coalesced"] == CALLERS - 1
+
+
+def test_cold_deck_reads_run_one_query(db_session):
+    """Testing - Concurrent cache misses of a deck run its query once."""
+    release = threading.Event()
+
+    def slow_load(db, category=None, version=None):
+        release.wait(5)
+        return DeckPayload(body=b"[]", count=0, version=version)
+
+    before = single_flight.stats().get("deck", {"loads": 0, "coalesced": 0})
+    with mock.patch.object(crud, "load_deck_json", side_effect=slow_load) as load:
+        with ThreadPoolExecutor(CALLERS) as pool:
+            futures = [
+                pool.submit(crud.get_deck_json, db_session, "LINUX", 7)
+                for _ in range(CALLERS)
+            ]
+            wait_for(
+                lambda: single_flight.stats()["deck"]["coalesced"]
+                == before["coalesced"] + CALLERS - 1
+            )
+            release.set()
+            decks = [future.result() for future in futures]
+
+    assert load.call_count == 1
+    assert all(deck is decks[0] for deck in decks)
+    assert single_flight.stats()["deck"]["loads"] == before["loads"] + 1
+    # The shared load filled the cache for later readers.
+    assert crud.get_deck_json(db_session, "LINUX", 7) is decks[0]
+
+
+def test_single_flight_metrics_route(client):
+    """Testing - The single-flight counters are exposed - should pass."""
+    client.get("/api/cards/OOP")
+
+    response = client.get("/api/metrics/single-flight")
+
+    assert response.status_code == 200
+    assert response.json()["deck"]["loads"] >= 1
@@ -0,0 +1,55 @@
+import threading
+
+from app.config import (
+    AWS_ACCESS_KEY,
+    AWS_REGION,
+    AWS_SECRET_KEY,
+    S3_CONNECT_TIMEOUT,
+    S3_ENDPOINT_URL,
+    S3_MAX_ATTEMPTS,
+    S3_MAX_POOL_CONNECTIONS,
+    S3_READ_TIMEOUT,
+)
+
+# boto3 is imported and the client built on first use, not at import time, so
+# starting a worker (or a test run) does not pay for it.
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    Returns the S3 client shared by every service in the process.
+
+    The client is created once, on first use, from its own boto3 session.
+    boto3 clients are thread-safe, so the log shipper threads and request
+    handlers can share it.
+
+    Returns:
+        botocore.client.S3: The shared client.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = _create_s3_client()
+    return _s3_client
+
+
+def _create_s3_client():
+    import boto3.session
+    from botocore.config import Config
+
+    session = boto3.session.Session(
+        aws_access_key_id=AWS_ACCESS_KEY,
+        aws_secret_access_key=AWS_SECRET_KEY,
+        region_name=AWS_REGION,
+    )
+    config = Config(
+        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+        retries={"max_attempts": S3_MAX_ATTEMPTS, "mode": "standard"},
+        connect_timeout=S3_CONNECT_TIMEOUT,
+        read_timeout=S3_READ_TIMEOUT,
+        tcp_keepalive=True,
+    )
+    return session.client("s3", config=config, endpoint_url=S3_ENDPOINT_URL or None)
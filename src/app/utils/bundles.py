@@ -0,0 +1,196 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows, where the launcher runs a single process anyway
+    fcntl = None
+
+from sqlalchemy.orm import Session
+from starlette.staticfiles import StaticFiles
+
+from app.config import BUNDLE_DIR, BUNDLE_KEEP
+from app.crud import get_deck_versions, stream_cards_ndjson
+
+DEFAULT_BUNDLE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", "bundles"
+)
+# Bundle name of the whole table.
+ALL_BUNDLE = "all"
+# Held by the process rebuilding bundles, so workers never build concurrently.
+LOCK_FILE = ".build.lock"
+BUNDLE_URL_PREFIX = "/bundles"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """
+    Serves files whose names change with their content, so browsers and the
+    CDN may cache them forever.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
+class DeckBundler:
+    """
+    Builds gzip-compressed NDJSON snapshots of every deck for offline study.
+
+    Each bundle is named after the SHA-256 of its file, the gzip bytes a
+    client downloads and can verify, and is only rebuilt when the version of
+    its deck changed. The bundle of the whole table is
+    the concatenation of the category bundles (a valid multi-member gzip
+    file), so it is never re-encoded. Every bundle has a small `<name>.json`
+    record next to it, so the worker processes of one node share the files
+    instead of each building their own: rebuilds hold an exclusive lock on
+    `LOCK_FILE`, and files are written under temporary names and renamed
+    into place, so a reader never sees a half-written one.
+    """
+
+    def __init__(self, directory: str = BUNDLE_DIR or DEFAULT_BUNDLE_DIR):
+        self.directory = directory
+        self.keep = BUNDLE_KEEP
+        self._lock = threading.Lock()
+
+    def manifest(self, db: Session) -> dict:
+        """
+        Returns the current bundle of every category and of the whole table,
+        building the ones whose deck changed since they were built.
+
+        Args:
+            db (Session): The database session used to interact with the database.
+
+        Returns:
+            dict: The total `version` and, per bundle name, its `url`,
+            `sha256`, deck `version`, card `count` and compressed `size`.
+        """
+        versions = get_deck_versions(db)
+        with self._build_lock():
+            bundles = {
+                category: self._category_bundle(db, category, version)
+                for category, version in versions.items()
+            }
+            bundles[ALL_BUNDLE] = self._all_bundle(bundles)
+        return {"version": sum(versions.values()), "bundles": bundles}
+
+    @contextmanager
+    def _build_lock(self) -> Iterator[None]:
+        # The thread lock orders the threads of this process, the file lock
+        # the worker processes sharing the directory.
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if fcntl is None:
+                yield
+                return
+            with open(self._path(LOCK_FILE), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _category_bundle(self, db: Session, category: str, version: int) -> dict:
+        entry = self._read_entry(category)
+        if entry is not None and entry["version"] == version:
+            return entry
+
+        count = 0
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as tmp:
+            try:
+                with gzip.GzipFile(fileobj=tmp, mode="wb", mtime=0) as bundle:
+                    for chunk in stream_cards_ndjson(db.get_bind(), category=category):
+                        bundle.write(chunk)
+                        count += chunk.count(b"\n")
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
+
+        entry = {"version": version, "count": count}
+        return self._publish(category, tmp.name, self._sha256(tmp.name), entry)
+
+    def _all_bundle(self, bundles: dict) -> dict:
+        version = sum(entry["version"] for entry in bundles.values())
+        entry = self._read_entry(ALL_BUNDLE)
+        if entry is not None and entry["version"] == version:
+            return entry
+
+        digest = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as tmp:
+            for category, category_entry in sorted(bundles.items()):
+                with open(self._path(category_entry["file"]), "rb") as part:
+                    while chunk := part.read(1024 * 1024):
+                        digest.update(chunk)
+                        tmp.write(chunk)
+
+        entry = {
+            "version": version,
+            "count": sum(entry["count"] for entry in bundles.values()),
+        }
+        return self._publish(ALL_BUNDLE, tmp.name, digest.hexdigest(), entry)
+
+    def _publish(self, name: str, tmp_path: str, sha256: str, entry: dict) -> dict:
+        file = f"{name}-{sha256[:16]}.ndjson.gz"
+        os.replace(tmp_path, self._path(file))
+        entry = {
+            **entry,
+            "file": file,
+            "url": f"{BUNDLE_URL_PREFIX}/{file}",
+            "sha256": sha256,
+            "size": os.path.getsize(self._path(file)),
+        }
+        self._write_entry(name, entry)
+        self._prune(name)
+        return entry
+
+    def _sha256(self, path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            while chunk := file.read(1024 * 1024):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _read_entry(self, name: str) -> dict | None:
+        try:
+            with open(self._path(f"{name}.json")) as record:
+                entry = json.load(record)
+        except (OSError, ValueError):
+            return None
+        return entry if os.path.exists(self._path(entry["file"])) else None
+
+    def _write_entry(self, name: str, entry: dict) -> None:
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as record:
+            json.dump(entry, record)
+        os.replace(record.name, self._path(f"{name}.json"))
+
+    def _prune(self, name: str) -> None:
+        # Keeps the newest bundles, so clients with an older manifest can
+        # still download what it points to.
+        files = [
+            file
+            for file in os.listdir(self.directory)
+            if file.startswith(f"{name}-") and file.endswith(".ndjson.gz")
+        ]
+        files.sort(key=lambda file: os.path.getmtime(self._path(file)), reverse=True)
+        for file in files[self.keep :]:
+            os.unlink(self._path(file))
+
+    def _path(self, file: str) -> str:
+        return os.path.join(self.directory, file)
+
+
+deck_bundler = DeckBundler()
@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+
+from fastapi import HTTPException, Request
+from pydantic import ValidationError
+
+from app.config import BULK_IMPORT_MAX_BYTES, BULK_IMPORT_MAX_ROWS
+from app.schemas import FlipCardCreate
+
+JSON_TYPES = {"application/json"}
+NDJSON_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+CSV_TYPES = {"text/csv", "application/csv"}
+NOT_AN_OBJECT = "Expected an object with front_text, back_text and category."
+
+
+class RowError(str):
+    """The reason a row could not be parsed at all, e.g. a malformed NDJSON line."""
+
+
+async def read_payload(request: Request) -> bytes:
+    """
+    Reads a bulk import body, refusing it as soon as it exceeds
+    BULK_IMPORT_MAX_BYTES.
+
+    The declared Content-Length is checked first; the body is then read in
+    chunks, so a chunked upload without one cannot exhaust memory either.
+
+    Raises:
+        HTTPException: If the body is larger than BULK_IMPORT_MAX_BYTES.
+    """
+    max_bytes = BULK_IMPORT_MAX_BYTES
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Payload too large. Maximum is {max_bytes} bytes per import.",
+    )
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise too_large
+    return bytes(body)
+
+
+def parse_cards_payload(body: bytes, content_type: str) -> list[FlipCardCreate | str]:
+    """
+    Parses a bulk import payload into cards.
+
+    Supports a JSON array, NDJSON (one object per line) and CSV with a
+    `front_text,back_text,category` header, selected by the Content-Type.
+
+    Args:
+        body (bytes): The raw request body.
+        content_type (str): The Content-Type header of the request.
+
+    Returns:
+        list[FlipCardCreate | str]: Per row, the parsed card or the reason it is invalid.
+
+    Raises:
+        HTTPException: If the payload cannot be decoded at all, the content type is
+        not supported, or it has more rows than BULK_IMPORT_MAX_ROWS.
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise HTTPException(
+            status_code=400, detail="Payload is not valid UTF-8."
+        ) from e
+
+    if media_type in JSON_TYPES:
+        try:
+            records = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}") from e
+        if not isinstance(records, list):
+            raise HTTPException(
+                status_code=400, detail="Expected a JSON array of cards."
+            )
+    elif media_type in NDJSON_TYPES:
+        records = [
+            _parse_ndjson_line(line) for line in text.splitlines() if line.strip()
+        ]
+    elif media_type in CSV_TYPES:
+        records = list(csv.DictReader(io.StringIO(text)))
+    else:
+        raise HTTPException(
+            status_code=415,
+            detail="Unsupported content type. Use application/json, "
+            "application/x-ndjson or text/csv.",
+        )
+
+    if len(records) > BULK_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many cards. Maximum is {BULK_IMPORT_MAX_ROWS} per import.",
+        )
+
+    return [_to_card(record) for record in records]
+
+
+def _parse_ndjson_line(line: str):
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        return RowError(f"Invalid JSON: {e}")
+
+
+def _to_card(record) -> FlipCardCreate | str:
+    if isinstance(record, RowError):
+        return str(record)
+    if not isinstance(record, dict):
+        return NOT_AN_OBJECT
+    try:
+        return FlipCardCreate.model_validate(record)
+    except ValidationError as e:
+        return "; ".join(
+            f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+            for error in e.errors()
+        )
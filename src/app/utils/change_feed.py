@@ -0,0 +1,378 @@
+import asyncio
+import json
+import select
+import threading
+from collections.abc import AsyncIterator
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.config import (
+    CHANGE_FEED_HEARTBEAT,
+    CHANGE_FEED_PG_BRIDGE,
+    CHANGE_FEED_QUEUE_SIZE,
+)
+from app.schemas import CardChangeEntry, ChangesPage
+
+CARD_CREATED = "card.created"
+CARD_UPDATED = "card.updated"
+CARD_DELETED = "card.deleted"
+# Tells the client to catch up through /api/cards/changes and reconnect.
+RESET = "reset"
+
+NOTIFY_CHANNEL = "card_changes"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+NOTIFY_MAX_PAYLOAD = 7999
+# Session.info key of the events waiting for their transaction to commit.
+PENDING_EVENTS_KEY = "change_feed_events"
+# Reconnection delay suggested to EventSource clients, in milliseconds.
+RETRY_MS = 3000
+
+
+def card_event(
+    event_type: str, seq: int, card, previous_category: str | None = None
+) -> dict:
+    """
+    Builds the event of a created, updated or deleted card.
+
+    The data is the card's change log entry, as returned by the delta sync
+    endpoint, so clients apply pushed and pulled changes the same way.
+
+    Args:
+        event_type (str): CARD_CREATED, CARD_UPDATED or CARD_DELETED.
+        seq (int): The change log sequence number of the change.
+        card (FlipCard): The card, as committed.
+        previous_category (str | None): The category the card was moved out of.
+
+    Returns:
+        dict: The event name, the categories it concerns and its data.
+    """
+    category = getattr(card.category, "value", card.category)
+    categories = [category]
+    previous_category = getattr(previous_category, "value", previous_category)
+    if previous_category is not None and previous_category != category:
+        categories.append(previous_category)
+
+    if event_type == CARD_DELETED:
+        entry = CardChangeEntry(seq=seq, op="delete", id=card.id, category=category)
+    else:
+        entry = CardChangeEntry(
+            seq=seq,
+            op="upsert",
+            id=card.id,
+            front_text=card.front_text,
+            back_text=card.back_text,
+            category=category,
+            updated_at=card.updated_at,
+        )
+    return {
+        "event": event_type,
+        "categories": categories,
+        "data": entry.model_dump(mode="json", exclude_none=True),
+    }
+
+
+def reset_event(categories, reason: str) -> dict:
+    """
+    Builds an event asking the clients of some categories to resync.
+    """
+    return {
+        "event": RESET,
+        "categories": sorted(getattr(c, "value", c) for c in categories),
+        "data": {"reason": reason},
+    }
+
+
+def format_event(event: dict) -> bytes:
+    """
+    Encodes an event in the text/event-stream format, with the change log
+    sequence number as its id so reconnecting clients send it back as
+    Last-Event-ID.
+    """
+    lines = []
+    if "seq" in event["data"]:
+        lines.append(f"id: {event['data']['seq']}")
+    lines.append(f"event: {event['event']}")
+    lines.append(f"data: {json.dumps(event['data'], separators=(',', ':'))}")
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+class Subscription:
+    """
+    The event queue of one connected client, owned by its event loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, category, queue_size: int):
+        self.loop = loop
+        self.category = category
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def matches(self, event: dict) -> bool:
+        return self.category is None or self.category in event["categories"]
+
+    def put(self, event: dict) -> None:
+        # Runs on the subscription's loop. A client that cannot keep up gets
+        # a reset instead of an unbounded backlog.
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(reset_event([], "overflow"))
+
+
+class ChangeHub:
+    """
+    In-process broadcast of card change events to Server-Sent Events clients.
+
+    Events are published after their transaction commits, from any thread,
+    and handed to the event loop of every matching subscription. Each
+    subscription has a bounded queue; a client that falls behind is sent a
+    reset and disconnected rather than slowing down the writers.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = CHANGE_FEED_QUEUE_SIZE,
+        heartbeat: float = CHANGE_FEED_HEARTBEAT,
+    ):
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._stats = {"published": 0, "delivered": 0, "overflows": 0}
+
+    def subscribe(self, category: str | None = None) -> Subscription:
+        """
+        Registers a client for the events of one category, or of every card.
+
+        Must be called from the event loop that will read the events.
+        """
+        subscription = Subscription(
+            asyncio.get_running_loop(), category, self.queue_size
+        )
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+            if subscription.overflowed:
+                self._stats["overflows"] += 1
+
+    def publish(self, event: dict) -> None:
+        """
+        Delivers an event to every matching subscription. Thread-safe.
+        """
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions if s.matches(event)]
+            self._stats["published"] += 1
+            self._stats["delivered"] += len(subscriptions)
+
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                # The loop of the subscription is closed.
+                self.unsubscribe(subscription)
+
+    async def stream(
+        self, subscription: Subscription, replay: ChangesPage | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Yields the events of a subscription in the text/event-stream format.
+
+        The changes a reconnecting client missed (`replay`) are sent first;
+        live events already covered by the replay are skipped. A comment is
+        sent every `heartbeat` seconds so proxies keep the connection open.
+        The subscription is removed when the client disconnects.
+
+        Args:
+            subscription (Subscription): The client's subscription.
+            replay (ChangesPage | None): The changes after the client's
+                Last-Event-ID.
+        """
+        try:
+            yield f"retry: {RETRY_MS}\n\n".encode()
+
+            last_seq = 0
+            if replay is not None:
+                for entry in replay.changes:
+                    event_type = CARD_DELETED if entry.op == "delete" else CARD_UPDATED
+                    data = entry.model_dump(mode="json", exclude_none=True)
+                    yield format_event({"event": event_type, "data": data})
+                if replay.has_more:
+                    yield format_event(reset_event([], "replay_limit"))
+                    return
+                last_seq = replay.since
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(), self.heartbeat
+                    )
+                except TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+
+                if event["data"].get("seq", last_seq + 1) <= last_seq:
+                    continue
+                yield format_event(event)
+                if event["event"] == RESET:
+                    return
+        finally:
+            self.unsubscribe(subscription)
+
+    def stats(self) -> dict:
+        """
+        Returns the number of connected clients and the event counters.
+        """
+        with self._lock:
+            return {"subscribers": len(self._subscriptions), **self._stats}
+
+
+class PgNotifyBridge:
+    """
+    Relays change events between worker processes and nodes through
+    PostgreSQL LISTEN/NOTIFY.
+
+    Writers NOTIFY inside their transaction, so an event is only delivered
+    if the change commits, in commit order. A background thread of every
+    worker LISTENs on a dedicated connection and publishes what it receives
+    to the local hub.
+    """
+
+    # Seconds between checks of the stop flag while the channel is idle.
+    POLL_INTERVAL = 5.0
+    # Seconds to wait before reconnecting after the connection failed.
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, hub: ChangeHub, enabled: bool = CHANGE_FEED_PG_BRIDGE):
+        self.hub = hub
+        self.enabled = enabled
+        self.channel = NOTIFY_CHANNEL
+        self._engine: Engine | None = None
+        self._listener: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def active_for(self, db: Session) -> bool:
+        return self.enabled and db.get_bind().dialect.name == "postgresql"
+
+    def notify(self, db: Session, event: dict) -> None:
+        """
+        Sends an event to every listening worker when the transaction of `db`
+        commits.
+
+        Card fields that would not fit in a NOTIFY payload are left out and
+        the event is marked `truncated`; clients fetch the card through the
+        delta sync endpoint.
+        """
+        payload = json.dumps(event, separators=(",", ":"))
+        if len(payload.encode()) > NOTIFY_MAX_PAYLOAD:
+            data = {
+                key: event["data"][key]
+                for key in ("seq", "op", "id", "category")
+                if key in event["data"]
+            }
+            payload = json.dumps(
+                {**event, "data": {**data, "truncated": True}}, separators=(",", ":")
+            )
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": self.channel, "payload": payload},
+        )
+
+    def start(self, engine: Engine) -> None:
+        """
+        Starts the listener thread. Called from the application startup hook.
+        """
+        if not self.enabled:
+            return
+        if engine.dialect.name != "postgresql":
+            print("⚠️ CHANGE_FEED_PG_BRIDGE needs PostgreSQL; events stay in-process")
+            return
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._engine = engine
+        self._stop.clear()
+        self._listener = threading.Thread(
+            target=self._run, name="change-feed-listener", daemon=True
+        )
+        self._listener.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stops the listener thread. Called from the application shutdown hook.
+        """
+        self._stop.set()
+        if self._listener is not None:
+            self._listener.join(timeout)
+            self._listener = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                print(f"❌ Error listening for change events: {e}")
+                self._stop.wait(self.RECONNECT_DELAY)
+
+    def _listen(self) -> None:
+        # A connection of its own, taken out of the pool for good.
+        connection = self._engine.raw_connection()
+        connection.detach()
+        try:
+            listener = connection.driver_connection
+            listener.autocommit = True
+            with listener.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+
+            while not self._stop.is_set():
+                readable, _, _ = select.select([listener], [], [], self.POLL_INTERVAL)
+                if not readable:
+                    continue
+                listener.poll()
+                while listener.notifies:
+                    notification = listener.notifies.pop(0)
+                    self.hub.publish(json.loads(notification.payload))
+        finally:
+            connection.close()
+
+
+change_hub = ChangeHub()
+pg_bridge = PgNotifyBridge(change_hub)
+
+
+def emit_change(db: Session, event: dict) -> None:
+    """
+    Publishes a change event once the current transaction of `db` commits.
+
+    With the PostgreSQL bridge the event is sent with NOTIFY and reaches
+    every worker; otherwise it is kept on the session and published to the
+    subscribers of this process after the commit. Nothing is published if
+    the transaction rolls back.
+    """
+    if pg_bridge.active_for(db):
+        pg_bridge.notify(db, event)
+    else:
+        db.info.setdefault(PENDING_EVENTS_KEY, []).append(event)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    for pending in session.info.pop(PENDING_EVENTS_KEY, ()):
+        change_hub.publish(pending)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending_events(session: Session, transaction) -> None:
+    # Events still pending when the outermost transaction ends belong to a
+    # transaction that was rolled back or closed without committing.
+    if transaction.parent is None:
+        session.info.pop(PENDING_EVENTS_KEY, None)
@@ -0,0 +1,94 @@
+from array import array
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from app.config import DECK_CACHE_MAX_ENTRIES, DECK_CACHE_TTL
+from app.utils.ttl_cache import TTLCache
+
+# Cache key for the deck returned by `get_all_cards`.
+ALL_CARDS_KEY = "__all__"
+
+
+@dataclass(frozen=True)
+class DeckPayload:
+    """A deck encoded as a JSON array, ready to be sent as a response body."""
+
+    body: bytes
+    count: int
+    version: int | None = None
+
+
+@dataclass(frozen=True)
+class CardIds:
+    """The ids of a deck, in id order, as of a deck version."""
+
+    ids: array
+    version: int
+
+
+class DeckCache(TTLCache):
+    """
+    Thread-safe LRU cache of serialized decks keyed by category.
+
+    Every key carries a generation counter that is bumped on invalidation.
+    A loader reads the generation before querying the database and passes it
+    to `set`, so a result computed before a concurrent write is never stored.
+    """
+
+    def __init__(
+        self, max_entries: int = DECK_CACHE_MAX_ENTRIES, ttl: float = DECK_CACHE_TTL
+    ):
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self._generations: dict[str, int] = {}
+        self._stats["invalidations"] = 0
+
+    def generation(self, key) -> int:
+        """
+        Returns the current generation of a key, to be passed back to `set`.
+        """
+        with self._lock:
+            return self._generations.get(self._key(key), 0)
+
+    def set(self, key, value: Any, generation: int | None = None) -> bool:
+        """
+        Stores a value unless the key was invalidated since `generation`.
+
+        Returns:
+            bool: True if the value was stored.
+        """
+        key = self._key(key)
+        with self._lock:
+            if generation is not None and self._generations.get(key, 0) != generation:
+                return False
+
+            self._store(key, value, self.ttl)
+            return True
+
+    def invalidate(self, *keys) -> None:
+        """
+        Drops the given keys and bumps their generation.
+        """
+        with self._lock:
+            for key in {self._key(key) for key in keys}:
+                self._generations[key] = self._generations.get(key, 0) + 1
+                self._entries.pop(key, None)
+                self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """
+        Drops every entry, e.g. between tests.
+        """
+        with self._lock:
+            for key in self._entries:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.clear()
+
+    @staticmethod
+    def _key(key) -> str:
+        return key.value if isinstance(key, Enum) else str(key)
+
+
+deck_cache = DeckCache()
+# Id arrays used to sample random cards, keyed like `deck_cache`.
+card_ids_cache = DeckCache()
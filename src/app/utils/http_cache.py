@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+
+
+def make_etag(deck: str, version: int) -> str:
+    """
+    Builds the ETag of a deck from its name and version counter.
+    """
+    return f'"{deck}-{version}"'
+
+
+def format_http_date(value: datetime) -> str:
+    """
+    Formats a datetime as an HTTP date, treating naive values as UTC.
+    """
+    return format_datetime(_as_utc(value), usegmt=True)
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None
+) -> bool:
+    """
+    Checks the conditional request headers against the current deck version.
+
+    If-None-Match takes precedence over If-Modified-Since, as in RFC 9110.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): The current ETag of the deck.
+        last_modified (datetime | None): When the deck last changed, if known.
+
+    Returns:
+        bool: True if the client copy is current and a 304 can be sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have second precision.
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,295 @@
+import asyncio
+import io
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+from PIL import Image
+
+from app.config import (
+    IMAGE_MAX_PENDING,
+    IMAGE_MAX_PIXELS,
+    IMAGE_TIMEOUT,
+    IMAGE_WORKERS,
+)
+
+
+class ImageTooLargeError(ValueError):
+    """The image has more pixels than the decompression-bomb guard allows."""
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """
+    One derived version of an uploaded image.
+
+    The file name encodes the size and format, so changing a rendition
+    produces new object keys instead of overwriting cached ones.
+    """
+
+    name: str
+    max_size: tuple[int, int]
+    format: str = "JPEG"
+    quality: int = 85
+
+    @property
+    def filename(self) -> str:
+        return f"{self.name}-{self.max_size[0]}.{FORMAT_EXTENSIONS[self.format]}"
+
+    @property
+    def content_type(self) -> str:
+        return f"image/{FORMAT_EXTENSIONS[self.format]}"
+
+
+FORMAT_EXTENSIONS = {"JPEG": "jpeg", "WEBP": "webp", "PNG": "png"}
+
+DEFAULT_RENDITIONS = (
+    Rendition("thumb", (96, 96)),
+    Rendition("card", (300, 300)),
+    Rendition("card", (300, 300), format="WEBP", quality=80),
+)
+
+
+def open_image(image_data: bytes, max_pixels: int, draft_size: tuple[int, int]):
+    """
+    Opens an image after checking its pixel count against `max_pixels`.
+
+    Only the header is read before the check, so a decompression bomb is
+    rejected without being decoded. JPEGs are decoded with `draft()`, which lets
+    libjpeg scale by 1/2, 1/4 or 1/8 while decoding instead of resizing full
+    pixels afterwards.
+
+    Raises:
+        ImageTooLargeError: If the image has more than `max_pixels` pixels.
+    """
+    try:
+        image = Image.open(io.BytesIO(image_data))
+    except Image.DecompressionBombError as e:
+        raise ImageTooLargeError(str(e)) from e
+
+    width, height = image.size
+    if width * height > max_pixels:
+        raise ImageTooLargeError(
+            f"Image is {width}x{height} pixels, the limit is {max_pixels} pixels"
+        )
+
+    if image.format == "JPEG":
+        image.draft("RGB", draft_size)
+
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    return image
+
+
+def encode_image(image, max_size: tuple[int, int], format: str, quality: int) -> bytes:
+    if image.size[0] > max_size[0] or image.size[1] > max_size[1]:
+        image = image.copy()
+        image.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+    output = io.BytesIO()
+    image.save(output, format=format, quality=quality, optimize=True)
+    return output.getvalue()
+
+
+def transform_image(
+    image_data: bytes,
+    max_size: tuple[int, int] = (300, 300),
+    quality: int = 90,
+    max_pixels: int = IMAGE_MAX_PIXELS,
+) -> bytes:
+    """
+    Decodes, downscales and re-encodes an image as an optimized JPEG.
+
+    Runs in the worker processes of `ImageProcessor`.
+
+    Args:
+        image_data (bytes): The raw image file.
+        max_size (tuple[int, int]): The bounding box of the output image.
+        quality (int): JPEG quality of the output.
+        max_pixels (int): Largest accepted width * height.
+
+    Returns:
+        bytes: The processed image as JPEG.
+
+    Raises:
+        ImageTooLargeError: If the image has more than `max_pixels` pixels.
+    """
+    image = open_image(image_data, max_pixels, max_size)
+    return encode_image(image, max_size, "JPEG", quality)
+
+
+def render_renditions(
+    image_data: bytes,
+    renditions: tuple[Rendition, ...] = DEFAULT_RENDITIONS,
+    max_pixels: int = IMAGE_MAX_PIXELS,
+) -> dict[str, bytes]:
+    """
+    Decodes an image once and encodes every rendition from it.
+
+    Runs in the worker processes of `ImageProcessor`.
+
+    Args:
+        image_data (bytes): The raw image file.
+        renditions (tuple[Rendition, ...]): The renditions to produce.
+        max_pixels (int): Largest accepted width * height.
+
+    Returns:
+        dict[str, bytes]: The encoded renditions keyed by their file name.
+
+    Raises:
+        ImageTooLargeError: If the image has more than `max_pixels` pixels.
+    """
+    largest = max(
+        (rendition.max_size for rendition in renditions),
+        key=lambda size: size[0] * size[1],
+    )
+    image = open_image(image_data, max_pixels, largest)
+    image.load()
+    return {
+        rendition.filename: encode_image(
+            image, rendition.max_size, rendition.format, rendition.quality
+        )
+        for rendition in renditions
+    }
+
+
+class ImageProcessor:
+    """
+    Runs CPU-bound image transforms in a bounded pool of worker processes.
+
+    At most `max_workers + max_pending` jobs are admitted at once; callers
+    beyond that get a 503 instead of queueing without bound. A job that does
+    not finish within `timeout` seconds fails with a 504; its worker finishes
+    the job in the background and is then reused.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = IMAGE_WORKERS,
+        max_pending: int = IMAGE_MAX_PENDING,
+        timeout: float = IMAGE_TIMEOUT,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Workers are spawned, not forked: the API process runs threads.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _submit(self, wait: bool, fn, *args, **kwargs) -> Future:
+        acquired = (
+            self._slots.acquire(timeout=self.timeout)
+            if wait
+            else self._slots.acquire(blocking=False)
+        )
+        if not acquired:
+            raise HTTPException(
+                status_code=503, detail="Image processing is busy, try again later."
+            )
+        try:
+            future = self._get_executor().submit(fn, *args, **kwargs)
+        except BrokenProcessPool as e:
+            self._slots.release()
+            raise self._error(e) from e
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _reset(self, wait: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _error(self, error: Exception) -> HTTPException:
+        if isinstance(error, ImageTooLargeError):
+            return HTTPException(status_code=413, detail=str(error))
+        if isinstance(error, BrokenProcessPool):
+            self._reset()
+            return HTTPException(
+                status_code=503, detail="Image processing is restarting."
+            )
+        return HTTPException(
+            status_code=400, detail=f"Error processing image: {str(error)}"
+        )
+
+    def process(self, image_data: bytes, **options) -> bytes:
+        """
+        Processes an image in a worker process and waits for the result.
+
+        Args:
+            image_data (bytes): The raw image file.
+            **options: Keyword arguments for `transform_image`.
+
+        Returns:
+            bytes: The processed image.
+
+        Raises:
+            HTTPException: 400 for undecodable images, 413 for images over the
+            pixel limit, 503 when the queue is full and 504 on timeout.
+        """
+        return self._run(transform_image, image_data, **options)
+
+    def render(
+        self, image_data: bytes, renditions: tuple[Rendition, ...] = DEFAULT_RENDITIONS
+    ) -> dict[str, bytes]:
+        """
+        Produces every rendition of an image in one worker job.
+
+        Args:
+            image_data (bytes): The raw image file.
+            renditions (tuple[Rendition, ...]): The renditions to produce.
+
+        Returns:
+            dict[str, bytes]: The encoded renditions keyed by their file name.
+
+        Raises:
+            HTTPException: Same as `process`.
+        """
+        return self._run(render_renditions, image_data, renditions)
+
+    def _run(self, fn, *args, **kwargs):
+        future = self._submit(True, fn, *args, **kwargs)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise HTTPException(status_code=504, detail="Image processing timed out.")
+        except Exception as e:
+            raise self._error(e) from e
+
+    async def process_async(self, image_data: bytes, **options) -> bytes:
+        """
+        Like `process`, but awaits the result without blocking the event loop.
+
+        A full queue is rejected right away instead of waiting for a slot.
+        """
+        future = self._submit(False, transform_image, image_data, **options)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="Image processing timed out.")
+        except Exception as e:
+            raise self._error(e) from e
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes, if they were started, and waits for them
+        to exit. Called from the application shutdown hook.
+        """
+        self._reset(wait=True)
+
+
+image_processor = ImageProcessor()
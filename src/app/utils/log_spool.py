@@ -0,0 +1,172 @@
+import os
+import threading
+import time
+
+
+class LogSpool:
+    """
+    Append-only, on-disk spool of newline-delimited log records.
+
+    Records are appended to an open segment and made durable in batches: `seal`
+    fsyncs the segment and renames it to its sealed name, after which it is
+    ready to be uploaded. Open segments left behind by a process that died are
+    sealed again on startup so nothing written to disk is lost.
+    """
+
+    OPEN_SUFFIX = ".open"
+    SEALED_SUFFIX = ".ndjson"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = None
+        self._path: str | None = None
+        self.recover()
+
+    def append(self, line: str) -> None:
+        """
+        Appends one record to the open segment without waiting for the disk.
+
+        Args:
+            line (str): The serialized record, without the trailing newline.
+        """
+        with self._lock:
+            if self._file is None:
+                name = f"segment_{os.getpid()}_{time.time_ns()}{self.OPEN_SUFFIX}"
+                self._path = os.path.join(self.directory, name)
+                self._file = open(self._path, "ab")
+            self._file.write(line.encode("utf-8") + b"\n")
+            self._file.flush()
+
+    def seal(self) -> str | None:
+        """
+        Fsyncs the open segment and marks it as ready for upload.
+
+        Returns:
+            str | None: The path of the sealed segment, or None if nothing was open.
+        """
+        with self._lock:
+            if self._file is None:
+                return None
+            os.fsync(self._file.fileno())
+            self._file.close()
+            sealed_path = self._sealed_name(self._path)
+            os.replace(self._path, sealed_path)
+            self._fsync_directory()
+            self._file = None
+            self._path = None
+            return sealed_path
+
+    def sealed_segments(self) -> list[str]:
+        """
+        Returns the sealed segments waiting for upload, oldest first.
+        """
+        names = sorted(
+            (
+                name
+                for name in os.listdir(self.directory)
+                if name.endswith(self.SEALED_SUFFIX)
+            ),
+            key=self._segment_sort_key,
+        )
+        return [os.path.join(self.directory, name) for name in names]
+
+    def remove(self, path: str) -> None:
+        """
+        Deletes a segment once its upload has been acknowledged.
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def pending_bytes(self) -> int:
+        """
+        Returns the total size of the segments still on disk.
+        """
+        total = 0
+        for name in os.listdir(self.directory):
+            try:
+                total += os.path.getsize(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+        return total
+
+    def recover(self) -> list[str]:
+        """
+        Seals open segments whose writer process is no longer running.
+
+        A partially written trailing record is cut off so every recovered
+        segment contains only complete lines.
+
+        Returns:
+            list[str]: The paths of the recovered segments.
+        """
+        recovered = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.OPEN_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            if path == self._path or self._writer_alive(name):
+                continue
+
+            with open(path, "rb+") as segment:
+                data = segment.read()
+                complete = data[: data.rfind(b"\n") + 1]
+                if len(complete) != len(data):
+                    segment.truncate(len(complete))
+                segment.flush()
+                os.fsync(segment.fileno())
+
+            if complete:
+                sealed_path = self._sealed_name(path)
+                os.replace(path, sealed_path)
+                recovered.append(sealed_path)
+            else:
+                os.remove(path)
+
+        if recovered:
+            self._fsync_directory()
+        return recovered
+
+    def _sealed_name(self, path: str) -> str:
+        return path[: -len(self.OPEN_SUFFIX)] + self.SEALED_SUFFIX
+
+    def _fsync_directory(self) -> None:
+        # Make the rename itself durable; not supported on every platform.
+        try:
+            fd = os.open(self.directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _segment_sort_key(name: str) -> tuple[int, str]:
+        # segment_<pid>_<time_ns>.<suffix>
+        parts = name.split(".")[0].split("_")
+        try:
+            return int(parts[2]), name
+        except (IndexError, ValueError):
+            return 0, name
+
+    @staticmethod
+    def _writer_alive(name: str) -> bool:
+        try:
+            pid = int(name.split("_")[1])
+        except (IndexError, ValueError):
+            return False
+        if pid == os.getpid():
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
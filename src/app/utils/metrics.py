@@ -0,0 +1,258 @@
+import bisect
+import threading
+
+# Default latency buckets, in seconds.
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class Histogram:
+    """
+    Thread-safe histogram with fixed upper bounds, Prometheus style.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Records one observation.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Returns the upper bound of the bucket holding the q-th quantile.
+
+        Returns:
+            float | None: The bound, infinity for the overflow bucket, or None
+            if nothing was observed yet.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+        if not total:
+            return None
+
+        rank = q * total
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        """
+        Returns the cumulative bucket counts, the count and the sum.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            value_sum = self._sum
+
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return {"buckets": buckets, "count": total, "sum": value_sum}
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """
+    A labelled metric family rendered in the Prometheus text format.
+    """
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for name, labels, value in self.samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._children[key] = self._children.get(key, 0) + amount
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        with self._lock:
+            children = dict(self._children)
+        return [
+            (self.name, dict(zip(self.labelnames, key)), value)
+            for key, value in sorted(children.items())
+        ]
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class LabeledHistogram(Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        histogram = self._children.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._children.setdefault(key, Histogram(self.buckets))
+        histogram.observe(value)
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        with self._lock:
+            children = dict(self._children)
+        return [
+            sample
+            for key, histogram in sorted(children.items())
+            for sample in histogram_samples(
+                self.name, dict(zip(self.labelnames, key)), histogram
+            )
+        ]
+
+
+def histogram_samples(
+    name: str, labels: dict, histogram: Histogram
+) -> list[tuple[str, dict, float]]:
+    """
+    Returns the bucket, sum and count samples of a histogram.
+    """
+    snapshot = histogram.snapshot()
+    samples = [
+        (f"{name}_bucket", {**labels, "le": bound}, count)
+        for bound, count in snapshot["buckets"].items()
+    ]
+    samples.append((f"{name}_sum", labels, snapshot["sum"]))
+    samples.append((f"{name}_count", labels, snapshot["count"]))
+    return samples
+
+
+class MetricsRegistry:
+    """
+    Holds the metric families exposed on /metrics.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> LabeledHistogram:
+        return self.register(LabeledHistogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Returns every registered family in the Prometheus text format.
+        """
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def render_stats(prefix: str, stats: dict[tuple, dict], labelnames: tuple = ()) -> str:
+    """
+    Renders the numeric values of `stats()` dictionaries as gauge families.
+
+    Args:
+        prefix (str): Prefix of the metric names, e.g. "deck_cache".
+        stats (dict[tuple, dict]): Stats keyed by their label values.
+        labelnames (tuple): Names of the labels, e.g. ("engine",).
+
+    Returns:
+        str: One gauge family per numeric key, in the Prometheus text format.
+    """
+    families: dict[str, list[str]] = {}
+    for label_values, values in stats.items():
+        labels = _format_labels(dict(zip(labelnames, label_values)))
+        for key, value in values.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            name = f"{prefix}_{key}"
+            families.setdefault(name, [f"# TYPE {name} gauge"]).append(
+                f"{name}{labels} {_format_value(value)}"
+            )
+    return "\n".join(line for lines in families.values() for line in lines)
@@ -0,0 +1,156 @@
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.utils.metrics import Histogram
+
+# Checkout waits are mostly sub-millisecond; the tail is what matters for sizing.
+CHECKOUT_WAIT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class PoolMetrics:
+    """
+    Checkout wait times and connection counters of one connection pool.
+    """
+
+    def __init__(self, name: str, slow_checkout_ms: float):
+        self.name = name
+        self.slow_checkout = slow_checkout_ms / 1000
+        self.checkout_wait = Histogram(CHECKOUT_WAIT_BUCKETS)
+        self._counters = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "slow_checkouts": 0,
+            "connects": 0,
+            "invalidations": 0,
+        }
+        self._lock = threading.Lock()
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def record_checkout(self, pool: Pool, wait: float) -> None:
+        """
+        Records a successful checkout and warns when it waited too long.
+        """
+        self.checkout_wait.observe(wait)
+        self.increment("checkouts")
+        if wait >= self.slow_checkout:
+            self.increment("slow_checkouts")
+            print(
+                f"⚠️ Slow {self.name} pool checkout: waited {wait * 1000:.1f} ms "
+                f"({pool.status()})"
+            )
+
+    def record_timeout(self, pool: Pool, wait: float) -> None:
+        """
+        Records a checkout that gave up after the pool timeout.
+        """
+        self.checkout_wait.observe(wait)
+        self.increment("timeouts")
+        print(
+            f"❌ {self.name} pool checkout timed out after {wait:.1f} s "
+            f"({pool.status()})"
+        )
+
+    def stats(self, pool: Pool) -> dict:
+        """
+        Returns the counters, the pool gauges and the checkout wait histogram.
+
+        Args:
+            pool (Pool): The pool currently used by the engine.
+
+        Returns:
+            dict: Counters, in-use/idle/overflow gauges and wait percentiles.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+
+        gauges = {}
+        if isinstance(pool, QueuePool):
+            gauges = {
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            }
+
+        p50 = self.checkout_wait.quantile(0.5)
+        p99 = self.checkout_wait.quantile(0.99)
+        return {
+            **gauges,
+            **counters,
+            "checkout_wait_p50_ms": None if p50 is None else p50 * 1000,
+            "checkout_wait_p99_ms": None if p99 is None else p99 * 1000,
+            "checkout_wait_seconds": self.checkout_wait.snapshot(),
+        }
+
+
+class InstrumentedPoolMixin:
+    """
+    Times how long each checkout waits for a free connection.
+
+    `metrics` is attached by `instrument_pool` and carried over when the
+    engine re-creates its pool on dispose.
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout(self, time.perf_counter() - started)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_checkout(self, time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_pool(pool: Pool, metrics: PoolMetrics) -> None:
+    """
+    Attaches `metrics` to a pool and counts new and invalidated connections.
+
+    Checkout waits are only timed for the instrumented pool classes above.
+    """
+    pool.metrics = metrics
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.increment("connects")
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.increment("invalidations")
@@ -0,0 +1,183 @@
+import mimetypes
+import os
+import re
+import time
+import uuid
+
+from fastapi import HTTPException
+
+from app.config import (
+    ASSET_FOLDERS,
+    AWS_BUCKET_NAME,
+    PRESIGN_CACHE_MAX_ENTRIES,
+    PRESIGN_DOWNLOAD_EXPIRES,
+    PRESIGN_REFRESH_MARGIN,
+    PRESIGN_UPLOAD_EXPIRES,
+    UPLOAD_MAX_SIZE,
+)
+from app.utils.aws import get_s3_client
+from app.utils.ttl_cache import TTLCache
+
+# Shared with S3Service; kept here so the assets routes do not import Pillow.
+ALLOWED_FORMATS = {".jpg", ".jpeg", ".png", ".svg"}
+KEY_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._/-]*$")
+
+
+class PresignService:
+    """
+    Signs S3 URLs so clients upload and download assets directly against the
+    bucket instead of through the API workers.
+
+    Download URLs are cached per key until `refresh_margin` seconds before
+    they expire, so a cached URL is never handed out close to its expiry and
+    a hot asset is signed about once per `download_expires - refresh_margin`
+    seconds.
+    """
+
+    def __init__(
+        self,
+        download_expires: int = PRESIGN_DOWNLOAD_EXPIRES,
+        upload_expires: int = PRESIGN_UPLOAD_EXPIRES,
+        refresh_margin: int = PRESIGN_REFRESH_MARGIN,
+        max_entries: int = PRESIGN_CACHE_MAX_ENTRIES,
+    ):
+        self.bucket_name = AWS_BUCKET_NAME
+        self.download_expires = download_expires
+        self.upload_expires = upload_expires
+        self.refresh_margin = refresh_margin
+        self.cache = TTLCache(
+            max_entries=max_entries, ttl=download_expires - refresh_margin
+        )
+        self._s3_client = None
+
+    @property
+    def s3_client(self):
+        """
+        The S3 client, the process-wide shared one unless replaced (e.g. in tests).
+        """
+        if self._s3_client is None:
+            self._s3_client = get_s3_client()
+        return self._s3_client
+
+    @s3_client.setter
+    def s3_client(self, client) -> None:
+        self._s3_client = client
+
+    def validate_key(self, key: str) -> None:
+        """
+        Checks that a key is well formed and lies in one of ASSET_FOLDERS.
+
+        Raises:
+            HTTPException: 404 for anything else, so the audit logs and other
+            private objects in the bucket cannot be signed.
+        """
+        if (
+            not KEY_PATTERN.match(key)
+            or ".." in key.split("/")
+            or key.split("/", 1)[0] not in ASSET_FOLDERS
+        ):
+            raise HTTPException(status_code=404, detail="Asset not found")
+
+    def download_url(self, key: str) -> tuple[str, int]:
+        """
+        Returns a presigned GET URL for an asset, from the cache when possible.
+
+        Args:
+            key (str): The object key, e.g. "icons/rocket.svg".
+
+        Returns:
+            tuple[str, int]: The URL and the number of seconds it stays usable
+            before it would be re-signed.
+
+        Raises:
+            HTTPException: If the key is not a public asset or cannot be signed.
+        """
+        self.validate_key(key)
+
+        cached = self.cache.get(key)
+        if cached is None:
+            # Taken before signing, so the URL expires no earlier than this.
+            expires_at = time.time() + self.download_expires
+            try:
+                url = self.s3_client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": self.bucket_name, "Key": key},
+                    ExpiresIn=self.download_expires,
+                )
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500, detail=f"Error generating presigned URL: {str(e)}"
+                )
+            cached = (url, expires_at)
+            ttl = expires_at - self.refresh_margin - time.time()
+            if ttl > 0:
+                self.cache.set(key, cached, ttl=ttl)
+
+        url, expires_at = cached
+        remaining = int(expires_at - time.time()) - self.refresh_margin
+        return url, max(remaining, 0)
+
+    def upload_form(self, folder: str, filename: str, content_type: str) -> dict:
+        """
+        Returns a presigned POST form for uploading one file directly to S3.
+
+        The policy pins the key, the content type and the allowed size, so the
+        form cannot be reused for other objects or for oversized files.
+
+        Args:
+            folder (str): One of ASSET_FOLDERS.
+            filename (str): The client's file name; only its extension is kept.
+            content_type (str): The MIME type the client will send.
+
+        Returns:
+            dict: The form `url`, the `fields` to post with the file, the
+            object `key` and `expires_in` seconds.
+
+        Raises:
+            HTTPException: If the folder or file type is not allowed.
+        """
+        if folder not in ASSET_FOLDERS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown folder. Allowed folders: {', '.join(ASSET_FOLDERS)}",
+            )
+
+        ext = os.path.splitext(filename)[1].lower()
+        if ext not in ALLOWED_FORMATS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported file format. "
+                f"Allowed formats: {', '.join(sorted(ALLOWED_FORMATS))}",
+            )
+        if content_type != mimetypes.types_map.get(ext, content_type):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Content type {content_type} does not match {ext}",
+            )
+
+        key = f"{folder}/{uuid.uuid4().hex}{ext}"
+        try:
+            form = self.s3_client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=key,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, UPLOAD_MAX_SIZE],
+                ],
+                ExpiresIn=self.upload_expires,
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error generating presigned form: {str(e)}"
+            )
+
+        return {
+            "url": form["url"],
+            "fields": form["fields"],
+            "key": key,
+            "expires_in": self.upload_expires,
+        }
+
+
+presign_service = PresignService()
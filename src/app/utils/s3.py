@@ -1,35 +1,97 @@
-from datetime import datetime
-import io
+import hashlib
 import os
-import uuid
 
-import boto3
 from fastapi import HTTPException, UploadFile
-from PIL import Image
-from app.config import AWS_ACCESS_KEY, AWS_BUCKET_NAME, AWS_REGION, AWS_SECRET_KEY
+from app.config import (
+    AWS_BUCKET_NAME,
+    S3_MULTIPART_THRESHOLD,
+    S3_UPLOAD_CONCURRENCY,
+    S3_UPLOAD_PART_SIZE,
+    UPLOAD_MAX_SIZE,
+)
+from app.utils.aws import get_s3_client
+from app.utils.image_processing import DEFAULT_RENDITIONS, image_processor
+from app.utils.presign import ALLOWED_FORMATS
+
+
+class SizeLimitedReader:
+    """
+    Wraps a file object, hashing everything read through it and failing as
+    soon as more than `max_size` bytes have been read.
+    """
+
+    def __init__(self, fileobj, max_size: int):
+        self.fileobj = fileobj
+        self.max_size = max_size
+        self.bytes_read = 0
+        self.sha256 = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        # Never read more than one byte past the limit, even for read(-1).
+        remaining = self.max_size + 1 - self.bytes_read
+        if size < 0 or size > remaining:
+            size = remaining
+        chunk = self.fileobj.read(size)
+        self.bytes_read += len(chunk)
+        if self.bytes_read > self.max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. "
+                f"Maximum size is {self.max_size / 1024 / 1024}MB",
+            )
+        self.sha256.update(chunk)
+        return chunk
 
 
 class S3Service:
     MAX_SIZE = (300, 300)
-    ALLOWED_FORMATS = {".jpg", ".jpeg", ".png", ".svg"}
+    ALLOWED_FORMATS = ALLOWED_FORMATS
     JPEG_QUALITY = 90
-    MAX_FILE_SIZE = 2 * 1024 * 1024  # 2MB
+    MAX_FILE_SIZE = UPLOAD_MAX_SIZE
+    HASH_CHUNK_SIZE = 1024 * 1024
+    RENDITIONS = DEFAULT_RENDITIONS
+    IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
 
     def __init__(self):
         self.bucket_name = AWS_BUCKET_NAME
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=AWS_ACCESS_KEY,
-            aws_secret_access_key=AWS_SECRET_KEY,
-            region_name=AWS_REGION,
-        )
+        self._s3_client = None
+        self._transfer_config = None
+
+    @property
+    def s3_client(self):
+        """
+        The S3 client, the process-wide shared one unless replaced (e.g. in tests).
+        """
+        if self._s3_client is None:
+            self._s3_client = get_s3_client()
+        return self._s3_client
+
+    @s3_client.setter
+    def s3_client(self, client) -> None:
+        self._s3_client = client
+
+    @property
+    def transfer_config(self):
+        """
+        Multipart settings for `upload_fileobj`: uploads larger than the
+        threshold are sent as parts of S3_UPLOAD_PART_SIZE, several at a time.
+        """
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
+
+            self._transfer_config = TransferConfig(
+                multipart_threshold=S3_MULTIPART_THRESHOLD,
+                multipart_chunksize=S3_UPLOAD_PART_SIZE,
+                max_concurrency=S3_UPLOAD_CONCURRENCY,
+            )
+        return self._transfer_config
 
     def validate_image(self, file: UploadFile) -> None:
         """
         Validates the uploaded image file.
 
-        This method checks if the file format is allowed and if the file size
-        is within the maximum limit.
+        This method checks if the file format is allowed and, when the size is
+        already known, if it is within the maximum limit.
 
         Args:
             file (UploadFile): The uploaded image file to be validated.
@@ -46,14 +108,11 @@ class S3Service:
                 f"Allowed formats: {', '.join(self.ALLOWED_FORMATS)}",
             )
 
-        # Check file size
-        file.file.seek(0, 2)  # end of the file
-        size = file.file.tell()  # current position
-        file.file.seek(0)  # return to the beginning
-
-        if size > self.MAX_FILE_SIZE:
+        # The multipart parser records the size; otherwise the limit is
+        # enforced while the file is streamed.
+        if file.size is not None and file.size > self.MAX_FILE_SIZE:
             raise HTTPException(
-                status_code=400,
+                status_code=413,
                 detail=f"File too large. "
                 f"Maximum size is {self.MAX_FILE_SIZE / 1024 / 1024}MB",
             )
@@ -62,9 +121,10 @@ class S3Service:
         """
         Processes the uploaded image data.
 
-        This method opens the image, converts it to RGB if needed,
-        resizes it if it exceeds the maximum size, and optimizes it before
-        converting it back to bytes.
+        This method converts the image to RGB if needed, resizes it if it
+        exceeds the maximum size, and optimizes it as JPEG. The work runs in
+        the worker processes of `image_processor`, so it never blocks the
+        calling worker's CPU.
 
         Args:
             image_data (bytes): The raw image data to be processed.
@@ -73,36 +133,83 @@ class S3Service:
             bytes: The processed image data in bytes.
 
         Raises:
-            HTTPException: If there is an error processing the image.
+            HTTPException: If the image cannot be processed, is too large,
+            or the image workers are busy or time out.
         """
-        try:
-            image = Image.open(io.BytesIO(image_data))
+        return image_processor.process(
+            image_data, max_size=self.MAX_SIZE, quality=self.JPEG_QUALITY
+        )
 
-            # Convert to RGB if needed
-            if image.mode in ("RGBA", "P"):
-                image = image.convert("RGB")
+    def object_url(self, key: str) -> str:
+        return f"https://{self.bucket_name}.s3.amazonaws.com/{key}"
 
-            # Resize if needed
-            if image.size[0] > self.MAX_SIZE[0] or image.size[1] > self.MAX_SIZE[1]:
-                image.thumbnail(self.MAX_SIZE, Image.Resampling.LANCZOS)
+    def existing_keys(self, prefix: str) -> set[str]:
+        """
+        Returns the keys already stored under `prefix`, in one request.
+        """
+        response = self.s3_client.list_objects_v2(
+            Bucket=self.bucket_name, Prefix=prefix
+        )
+        return {item["Key"] for item in response.get("Contents", [])}
 
-            # Optimize and convert to bytes
-            output = io.BytesIO()
-            image.save(output, format="JPEG", quality=self.JPEG_QUALITY, optimize=True)
-            return output.getvalue()
+    def put_immutable(self, key: str, body: bytes, content_type: str) -> None:
+        """
+        Stores an object whose key is derived from its content, so it can be
+        cached forever by browsers and the CDN.
+        """
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=body,
+            ContentType=content_type,
+            CacheControl=self.IMMUTABLE_CACHE_CONTROL,
+        )
 
-        except Exception as e:
-            raise HTTPException(
-                status_code=400, detail=f"Error processing image: {str(e)}"
-            )
+    def hash_file(self, fileobj) -> str:
+        """
+        Returns the SHA-256 of a file, read in chunks and within MAX_FILE_SIZE.
+
+        The file is rewound afterwards.
+        """
+        reader = SizeLimitedReader(fileobj, self.MAX_FILE_SIZE)
+        while reader.read(self.HASH_CHUNK_SIZE):
+            pass
+        fileobj.seek(0)
+        return reader.sha256.hexdigest()
+
+    def read_file(self, fileobj) -> bytes:
+        """
+        Reads a whole file into memory, failing early past MAX_FILE_SIZE.
+        """
+        return SizeLimitedReader(fileobj, self.MAX_FILE_SIZE).read()
+
+    def stream_upload(self, fileobj, key: str, content_type: str) -> None:
+        """
+        Streams a file object to S3 without buffering it in memory.
+
+        Large files are sent as a multipart upload (see `transfer_config`); the
+        size limit is enforced while reading, and a failed multipart upload is
+        aborted.
+        """
+        self.s3_client.upload_fileobj(
+            SizeLimitedReader(fileobj, self.MAX_FILE_SIZE),
+            self.bucket_name,
+            key,
+            ExtraArgs={
+                "ContentType": content_type,
+                "CacheControl": self.IMMUTABLE_CACHE_CONTROL,
+            },
+            Config=self.transfer_config,
+        )
 
     def upload_file(self, file: UploadFile, folder: str) -> str:
         """
-        Uploads a file to an S3 bucket.
+        Uploads a file to an S3 bucket under a content-addressed key.
 
-        This method generates a unique filename, reads the file content,
-        uploads it to the specified S3 bucket,
-        and returns the URL of the uploaded file.
+        The key is the SHA-256 of the file content, so uploading the same file
+        twice stores it once: if the key already exists the upload is skipped.
+        The file is hashed and uploaded in chunks, never read into memory as a
+        whole.
 
         Args:
             file (UploadFile): The file to be uploaded.
@@ -112,29 +219,20 @@ class S3Service:
             str: The URL of the uploaded file.
 
         Raises:
-            HTTPException: If there is an error uploading the file.
+            HTTPException: If the file is too large or cannot be uploaded.
         """
         try:
-            # Generate unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            unique_id = str(uuid.uuid4())[:8]
-            extension = os.path.splitext(file.filename)[1]
-            new_filename = f"{folder}/{timestamp}_{unique_id}{extension}"
-
-            # Read file content
-            contents = file.file.read()
-
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=new_filename,
-                Body=contents,
-                ContentType=file.content_type,
-            )
+            digest = self.hash_file(file.file)
+            extension = os.path.splitext(file.filename)[1].lower()
+            key = f"{folder}/{digest}{extension}"
+
+            if key not in self.existing_keys(key):
+                self.stream_upload(file.file, key, file.content_type)
 
-            # Generate URL
-            return f"https://{self.bucket_name}.s3.amazonaws.com/{new_filename}"
+            return self.object_url(key)
 
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=500, detail=f"Error uploading file: {str(e)}"
@@ -142,6 +240,63 @@ class S3Service:
         finally:
             file.file.close()
 
+    def upload_image(self, file: UploadFile, folder: str) -> dict[str, str]:
+        """
+        Uploads every rendition of an image under content-addressed keys.
+
+        The renditions (a thumbnail, a 300px JPEG and a 300px WebP) are stored
+        as `folder/<sha256 of the upload>/<rendition file name>`. Renditions
+        that already exist are neither rendered nor uploaded again. SVG files
+        are stored as they are.
+
+        Args:
+            file (UploadFile): The validated image file.
+            folder (str): The folder in the S3 bucket where the image will be stored.
+
+        Returns:
+            dict[str, str]: The URL of every rendition keyed by its file name.
+
+        Raises:
+            HTTPException: If the image cannot be processed or uploaded.
+        """
+        if os.path.splitext(file.filename)[1].lower() == ".svg":
+            return {"original": self.upload_file(file, folder)}
+
+        try:
+            contents = self.read_file(file.file)
+        finally:
+            file.file.close()
+
+        prefix = f"{folder}/{hashlib.sha256(contents).hexdigest()}/"
+        keys = {
+            rendition.filename: prefix + rendition.filename
+            for rendition in self.RENDITIONS
+        }
+
+        try:
+            existing = self.existing_keys(prefix)
+            missing = tuple(
+                rendition
+                for rendition in self.RENDITIONS
+                if keys[rendition.filename] not in existing
+            )
+            if missing:
+                rendered = image_processor.render(contents, missing)
+                for rendition in missing:
+                    self.put_immutable(
+                        keys[rendition.filename],
+                        rendered[rendition.filename],
+                        rendition.content_type,
+                    )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error uploading image: {str(e)}"
+            )
+
+        return {filename: self.object_url(key) for filename, key in keys.items()}
+
     def delete_file(self, file_url: str) -> bool:
         """
         Deletes a file from an S3 bucket.
@@ -173,24 +328,5 @@ class S3Service:
             print(f"Error deleting file: {e}")
             return False
 
-    # WON'T USE IT NOW AS THE APP DOESNT HAVE PRIVATE ASSETS
-    # def generate_presigned_url(self, key: str) -> str:
-    #     """Generate a presigned URL for accessing an S3 object."""
-    #     try:
-    #         url = self.s3_client.generate_presigned_url(
-    #             'get_object',
-    #             Params={
-    #                 'Bucket': self.bucket_name,
-    #                 'Key': key
-    #             },
-    #             ExpiresIn=3600
-    #         )
-    #         return url
-    #     except Exception as e:
-    #         raise HTTPException(
-    #             status_code=500,
-    #             detail=f"Error generating presigned URL: {str(e)}"
-    #         )
-
 
 s3_service = S3Service()
@@ -1,21 +1,84 @@
+import json
+import os
+import queue
+import threading
+import time
+import uuid
 from datetime import datetime
 
-import boto3
 
-from app.config import AWS_ACCESS_KEY, AWS_BUCKET_NAME, AWS_REGION, AWS_SECRET_KEY
+from app.config import (
+    AWS_BUCKET_NAME,
+    S3_LOG_BATCH_SIZE,
+    S3_LOG_FLUSH_INTERVAL,
+    S3_LOG_QUEUE_SIZE,
+    S3_LOG_SPOOL_DIR,
+)
+from app.utils.aws import get_s3_client
+from app.utils.log_spool import LogSpool
+from app.utils.telemetry import span
+
+# Control messages understood by the shipper thread.
+_FLUSH = "flush"
+_STOP = "stop"
+# Queued in place of a record already appended to the spool.
+_SPOOLED = "spooled"
 
 
 class S3Logger:
-    def __init__(self):
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=AWS_ACCESS_KEY,
-            aws_secret_access_key=AWS_SECRET_KEY,
-            region_name=AWS_REGION,
-        )
+    # Queue fill ratio above which enqueueing counts as a backpressure event.
+    BACKPRESSURE_RATIO = 0.8
+    # Upper bound for the retry delay while S3 keeps failing.
+    MAX_UPLOAD_BACKOFF = 60.0
+
+    def __init__(
+        self,
+        max_queue_size: int = S3_LOG_QUEUE_SIZE,
+        batch_size: int = S3_LOG_BATCH_SIZE,
+        flush_interval: float = S3_LOG_FLUSH_INTERVAL,
+        spool_dir: str | None = S3_LOG_SPOOL_DIR,
+    ):
+        self._s3_client = None
         self.bucket_name = AWS_BUCKET_NAME
         self.log_folder = "logs"
 
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+        self.spool_dir = spool_dir
+        self.spool: LogSpool | None = None
+        self._uploader: threading.Thread | None = None
+        self._uploader_wake = threading.Event()
+        self._uploader_stop = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "dropped": 0,
+            "spooled_only": 0,
+            "backpressure_events": 0,
+            "records_shipped": 0,
+            "batches_shipped": 0,
+            "upload_errors": 0,
+            "records_lost": 0,
+            "segments_uploaded": 0,
+        }
+
+    @property
+    def s3_client(self):
+        """
+        The S3 client, the process-wide shared one unless replaced (e.g. in tests).
+        """
+        if self._s3_client is None:
+            self._s3_client = get_s3_client()
+        return self._s3_client
+
+    @s3_client.setter
+    def s3_client(self, client) -> None:
+        self._s3_client = client
+
     def upload_log(self, log_data: str):
         """
         Uploading log in S3 bucket with current datetime.
@@ -36,34 +99,262 @@ class S3Logger:
 
     def log_action(self, action: str, details: dict):
         """
-        Log application actions with details
+        Log application actions with details.
+
+        The record is handed to the background shipper and never waits on S3.
+        If the queue is full the record is dropped and counted in the stats.
+        When a spool directory is configured the record is appended to the
+        spool before this returns, so it survives a full queue and a crash of
+        the process; the shipper only seals segments for a separate uploader
+        that drains the spool to S3. A spooled record that did not fit in the
+        queue is counted as `spooled_only` instead of `enqueued`.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        log_data = {
-            "timestamp": timestamp,
-            "action": action,
-            "details": details,
-        }  # noqa: F841
+        with span("s3_log"):
+            record = {
+                "timestamp": datetime.now().isoformat(),
+                "action": action,
+                "details": details,
+            }
+
+            self._ensure_worker()
+            if self.spool is not None and self._spool_append(
+                json.dumps(record, default=str)
+            ):
+                record = _SPOOLED
+            try:
+                self._queue.put_nowait(record)
+            except queue.Full:
+                # A spooled record is sealed with the next segment anyway.
+                self._incr("spooled_only" if record == _SPOOLED else "dropped")
+                return
+
+            self._incr("enqueued")
+            if self._queue.qsize() >= self.max_queue_size * self.BACKPRESSURE_RATIO:
+                self._incr("backpressure_events")
+
+    def start(self) -> None:
+        """
+        Start the background threads and replay segments left on disk.
 
-        log_content = f"""
-Timestamp: {timestamp}
-Action: {action}
-Details: {details}
-------------------------
-"""
+        Called from the application startup hook; `log_action` also starts
+        the threads lazily on first use.
+        """
+        self._ensure_worker()
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Ship everything queued so far and wait for the upload to finish.
 
-        log_filename = f"{self.log_folder}/{action}_{timestamp}.txt"
+        Args:
+            timeout (float): Maximum number of seconds to wait.
 
+        Returns:
+            bool: True if the queue was flushed within the timeout.
+        """
+        if not self._worker_alive():
+            return self._queue.empty()
+
+        deadline = time.monotonic() + timeout
+        done = threading.Event()
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=log_filename,
-                Body=log_content.encode("utf-8"),
-                ContentType="text/plain",
-            )
-            print(f"✅ Action logged to S3: {action}")
+            self._queue.put((_FLUSH, done), timeout=timeout)
+        except queue.Full:
+            return False
+        if not done.wait(timeout):
+            return False
+        if self.spool is None:
+            return True
+
+        while self.spool.sealed_segments():
+            if time.monotonic() >= deadline or not self._uploader_alive():
+                return False
+            self._uploader_wake.set()
+            time.sleep(0.05)
+        return True
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Flush pending records and stop the background threads.
+
+        Called from the application shutdown hook. Spooled segments that
+        could not be uploaded stay on disk and are replayed on next startup.
+        """
+        if self._worker_alive():
+            try:
+                self._queue.put((_STOP, None), timeout=timeout)
+            except queue.Full:
+                return
+            self._worker.join(timeout)
+
+        if self._uploader_alive():
+            self._uploader_stop.set()
+            self._uploader_wake.set()
+            self._uploader.join(timeout)
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of the shipper counters and queue gauges.
+        """
+        with self._stats_lock:
+            snapshot = dict(self._stats)
+        snapshot["queue_depth"] = self._queue.qsize()
+        snapshot["queue_capacity"] = self.max_queue_size
+        if self.spool is not None:
+            snapshot["segments_pending"] = len(self.spool.sealed_segments())
+            snapshot["spool_bytes"] = self.spool.pending_bytes()
+        return snapshot
+
+    def _incr(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _worker_alive(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    def _uploader_alive(self) -> bool:
+        return self._uploader is not None and self._uploader.is_alive()
+
+    def _ensure_worker(self) -> None:
+        # Started lazily so importing the module never spawns threads, and
+        # restarted after a fork where the parent's threads do not survive.
+        if self._worker_alive() and (self.spool is None or self._uploader_alive()):
+            return
+        with self._worker_lock:
+            if self.spool_dir and self.spool is None:
+                self.spool = LogSpool(self.spool_dir)
+            if not self._worker_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="s3-log-shipper", daemon=True
+                )
+                self._worker.start()
+            if self.spool is not None and not self._uploader_alive():
+                self._uploader_stop.clear()
+                self._uploader = threading.Thread(
+                    target=self._upload_loop, name="s3-log-uploader", daemon=True
+                )
+                self._uploader.start()
+
+    def _run(self) -> None:
+        batch: list[str] = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, tuple):
+                command, done = item
+                self._ship(batch)
+                batch = []
+                if done is not None:
+                    done.set()
+                if command == _STOP:
+                    return
+                continue
+
+            if item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                if item == _SPOOLED:
+                    line = item
+                else:
+                    line = json.dumps(item, default=str)
+                    if self.spool is not None:
+                        self._spool_append(line)
+                batch.append(line)
+
+            if batch and (
+                len(batch) >= self.batch_size or time.monotonic() >= deadline
+            ):
+                self._ship(batch)
+                batch = []
+
+    def _spool_append(self, line: str) -> bool:
+        try:
+            self.spool.append(line)
+            return True
+        except OSError as e:
+            print(f"❌ Error writing log record to spool: {e}")
+            return False
+
+    def _ship(self, batch: list[str]) -> None:
+        if not batch:
+            return
+
+        if self.spool is not None:
+            try:
+                self.spool.seal()
+            except OSError as e:
+                print(f"❌ Error sealing log spool segment: {e}")
+            self._uploader_wake.set()
+            return
+
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        log_filename = (
+            f"{self.log_folder}/batch_{timestamp}_{uuid.uuid4().hex[:8]}.ndjson"
+        )
+        body = "".join(line + "\n" for line in batch)
+
+        try:
+            with span("s3_upload"):
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=log_filename,
+                    Body=body.encode("utf-8"),
+                    ContentType="application/x-ndjson",
+                )
+            self._incr("records_shipped", len(batch))
+            self._incr("batches_shipped")
         except Exception as e:
-            print(f"❌ Error logging action: {e}")
+            self._incr("upload_errors")
+            self._incr("records_lost", len(batch))
+            print(f"❌ Error shipping {len(batch)} log records: {e}")
+
+    def _upload_loop(self) -> None:
+        backoff = self.flush_interval
+        while True:
+            stopping = self._uploader_stop.is_set()
+            self._uploader_wake.clear()
+            if self._upload_segments():
+                backoff = self.flush_interval
+            else:
+                backoff = min(backoff * 2, self.MAX_UPLOAD_BACKOFF)
+            if stopping:
+                return
+            self._uploader_wake.wait(backoff)
+
+    def _upload_segments(self) -> bool:
+        for path in self.spool.sealed_segments():
+            try:
+                with open(path, "rb") as segment:
+                    body = segment.read()
+            except FileNotFoundError:
+                continue
+
+            # The segment name is unique and stable, so re-uploading a
+            # segment after a crash overwrites the same object.
+            log_filename = f"{self.log_folder}/{os.path.basename(path)}"
+            try:
+                with span("s3_upload"):
+                    self.s3_client.put_object(
+                        Bucket=self.bucket_name,
+                        Key=log_filename,
+                        Body=body,
+                        ContentType="application/x-ndjson",
+                    )
+            except Exception as e:
+                self._incr("upload_errors")
+                print(f"❌ Error uploading log segment {log_filename}: {e}")
+                return False
+
+            self.spool.remove(path)
+            self._incr("segments_uploaded")
+            self._incr("batches_shipped")
+            self._incr("records_shipped", body.count(b"\n"))
+        return True
 
 
 s3_logger = S3Logger()
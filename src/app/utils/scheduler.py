@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# SM-2 constants: a card starts at ease 2.5 and never drops below 1.3.
+DEFAULT_EASE_FACTOR = 2.5
+MIN_EASE_FACTOR = 1.3
+# Answers graded below this count as a lapse and restart the card.
+PASSING_QUALITY = 3
+
+
+@dataclass(frozen=True)
+class ReviewState:
+    """
+    The spaced-repetition state of one card.
+    """
+
+    ease_factor: float = DEFAULT_EASE_FACTOR
+    interval_days: int = 0
+    repetitions: int = 0
+    lapses: int = 0
+
+
+def next_review(
+    state: ReviewState, quality: int, now: datetime
+) -> tuple[ReviewState, datetime]:
+    """
+    Schedules the next review of a card with the SM-2 algorithm.
+
+    A passing answer grows the interval (1 day, 6 days, then the previous
+    interval times the ease factor); a failed one resets the card to a 1 day
+    interval and counts a lapse. The ease factor moves with the answer quality.
+
+    Args:
+        state (ReviewState): The card's state before this answer.
+        quality (int): The answer grade, from 0 (blackout) to 5 (perfect).
+        now (datetime): The time of the answer.
+
+    Returns:
+        tuple[ReviewState, datetime]: The new state and the next due time.
+    """
+    ease_factor = max(
+        MIN_EASE_FACTOR,
+        state.ease_factor + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02),
+    )
+
+    if quality < PASSING_QUALITY:
+        new_state = ReviewState(
+            ease_factor=ease_factor,
+            interval_days=1,
+            repetitions=0,
+            lapses=state.lapses + 1,
+        )
+    else:
+        repetitions = state.repetitions + 1
+        if repetitions == 1:
+            interval_days = 1
+        elif repetitions == 2:
+            interval_days = 6
+        else:
+            interval_days = max(1, round(state.interval_days * state.ease_factor))
+        new_state = ReviewState(
+            ease_factor=ease_factor,
+            interval_days=interval_days,
+            repetitions=repetitions,
+            lapses=state.lapses,
+        )
+
+    return new_state, now + timedelta(days=new_state.interval_days)
@@ -0,0 +1,207 @@
+import heapq
+import itertools
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable
+
+from app.utils.deck_cache import DeckCache
+
+# Text search configuration of the PostgreSQL search_vector column.
+SEARCH_CONFIG = "english"
+TOKEN_PATTERN = re.compile(r"\w+")
+# Same defaults as pg_trgm: terms this similar to a query term count as a match.
+SIMILARITY_THRESHOLD = 0.3
+# Shorter query terms are only matched exactly.
+MIN_FUZZY_LENGTH = 4
+# A match in front_text weighs more than one in back_text, like the A/B
+# weights of the PostgreSQL search vector.
+FRONT_WEIGHT = 2.0
+BACK_WEIGHT = 1.0
+
+
+def tokenize(text: str | None) -> list[str]:
+    """
+    Splits a text into lowercase word tokens.
+    """
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def trigrams(term: str) -> set[str]:
+    """
+    Returns the trigrams of a term, padded like pg_trgm does.
+    """
+    padded = f"  {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def contains(postings: array, card_id: int) -> bool:
+    position = bisect_left(postings, card_id)
+    return position < len(postings) and postings[position] == card_id
+
+
+class InvertedIndex:
+    """
+    In-process full-text index over front_text and back_text, used when the
+    database has no full-text search (SQLite).
+
+    Every term maps to the sorted ids of the cards containing it. Query terms
+    missing from the vocabulary are expanded to similar terms through a
+    trigram index, so small typos still match. A card matches when it matches
+    every query term; matches are ranked by the rarity of the terms and
+    whether they were found in the front or the back of the card.
+    """
+
+    def __init__(self, version: int | None = None):
+        self.version = version
+        self.ids = array("q")
+        self.categories: list[str] = []
+        self.postings: dict[str, array] = defaultdict(lambda: array("q"))
+        self.front_postings: dict[str, array] = defaultdict(lambda: array("q"))
+        self.term_trigrams: dict[str, set[str]] = defaultdict(set)
+        self.trigram_counts: dict[str, int] = {}
+
+    @classmethod
+    def build(cls, rows: Iterable, version: int | None = None) -> "InvertedIndex":
+        """
+        Builds the index from rows of `cards_query`, which are ordered by id.
+        """
+        index = cls(version)
+        for row in rows:
+            index.add(row.id, row.category, row.front_text, row.back_text)
+
+        index.postings = dict(index.postings)
+        index.front_postings = dict(index.front_postings)
+        for term in index.postings:
+            term_trigrams = trigrams(term)
+            index.trigram_counts[term] = len(term_trigrams)
+            for trigram in term_trigrams:
+                index.term_trigrams[trigram].add(term)
+        index.term_trigrams = dict(index.term_trigrams)
+        return index
+
+    def add(self, card_id: int, category, front_text: str, back_text: str) -> None:
+        # Postings stay sorted because cards are added in id order.
+        self.ids.append(card_id)
+        self.categories.append(getattr(category, "value", category))
+        front_terms = set(tokenize(front_text))
+        for term in front_terms:
+            self.front_postings[term].append(card_id)
+        for term in front_terms | set(tokenize(back_text)):
+            self.postings[term].append(card_id)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def category_of(self, card_id: int) -> str:
+        return self.categories[bisect_left(self.ids, card_id)]
+
+    def expand(self, term: str) -> dict[str, float]:
+        """
+        Returns the indexed terms matching a query term, with their similarity.
+        """
+        if term in self.postings or len(term) < MIN_FUZZY_LENGTH:
+            return {term: 1.0} if term in self.postings else {}
+
+        query_trigrams = trigrams(term)
+        shared: dict[str, int] = defaultdict(int)
+        for trigram in query_trigrams:
+            for candidate in self.term_trigrams.get(trigram, ()):
+                shared[candidate] += 1
+
+        matches = {}
+        for candidate, count in shared.items():
+            union = len(query_trigrams) + self.trigram_counts[candidate] - count
+            similarity = count / union
+            if similarity >= SIMILARITY_THRESHOLD:
+                matches[candidate] = similarity
+        return matches
+
+    def idf(self, term: str) -> float:
+        return math.log(1 + len(self.ids) / len(self.postings[term]))
+
+    def search(
+        self, query: str, category: str | None = None, limit: int = 20, offset: int = 0
+    ) -> list[tuple[int, float]]:
+        """
+        Returns one page of matching card ids with their score, best first.
+
+        Candidates come from the rarest query term; the other terms are only
+        checked against those candidates with a binary search in their
+        postings, so common words do not cost a pass over their postings.
+
+        Args:
+            query (str): The words to search for.
+            category (str | None): Only return cards of this category.
+            limit (int): The page size.
+            offset (int): The number of results to skip.
+
+        Returns:
+            list[tuple[int, float]]: Card ids and scores, ties ordered by id.
+        """
+        groups = [self.expand(term) for term in dict.fromkeys(tokenize(query))]
+        if not groups or not all(groups):
+            return []
+
+        if len(groups) == 1 and len(groups[0]) == 1:
+            return self.search_term(next(iter(groups[0])), category, limit, offset)
+
+        groups.sort(key=lambda group: sum(len(self.postings[t]) for t in group))
+        candidates = set()
+        for term in groups[0]:
+            candidates.update(self.postings[term])
+
+        scores = []
+        for card_id in candidates:
+            if category is not None and self.category_of(card_id) != category:
+                continue
+            score = 0.0
+            for group in groups:
+                best = 0.0
+                for term, similarity in group.items():
+                    if not contains(self.postings[term], card_id):
+                        continue
+                    front = term in self.front_postings and contains(
+                        self.front_postings[term], card_id
+                    )
+                    weight = FRONT_WEIGHT if front else BACK_WEIGHT
+                    best = max(best, similarity * weight * self.idf(term))
+                if best == 0.0:
+                    break
+                score += best
+            else:
+                scores.append((score, card_id))
+
+        page = heapq.nsmallest(
+            offset + limit, scores, key=lambda hit: (-hit[0], hit[1])
+        )
+        return [(card_id, score) for score, card_id in page[offset:]]
+
+    def search_term(
+        self, term: str, category: str | None, limit: int, offset: int
+    ) -> list[tuple[int, float]]:
+        """
+        Fast path of `search` for one indexed term.
+
+        Every card with the term in front has the same score, above every card
+        with it only in back, so the page is read off the postings in id order
+        without scoring every match.
+        """
+        front = self.front_postings.get(term, array("q"))
+        idf = self.idf(term)
+        matches = (
+            (card_id, FRONT_WEIGHT * idf if in_front else BACK_WEIGHT * idf)
+            for in_front, postings in ((True, front), (False, self.postings[term]))
+            for card_id in postings
+            if in_front or not contains(front, card_id)
+        )
+        if category is not None:
+            matches = (hit for hit in matches if self.category_of(hit[0]) == category)
+        return list(itertools.islice(matches, offset, offset + limit))
+
+
+# The index of every card, keyed by ALL_CARDS_KEY and tagged with the version
+# of the whole deck; rebuilt through single_flight when a card changes.
+search_index_cache = DeckCache(max_entries=1, ttl=math.inf)
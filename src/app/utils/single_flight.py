@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Call:
+    """A load in progress on the sync path, and its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent loads of the same key into one.
+
+    The first caller for a key runs the load; callers arriving while it is
+    in flight wait for it and share its result (or its exception) instead of
+    running the same query again. Nothing is kept once the load finishes:
+    caching the result is up to the load itself.
+
+    Keys are tuples whose first element names the kind of load, e.g.
+    ("deck", "OOP", 42); the counters are kept per kind.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple, asyncio.Future] = {}
+        self._stats: dict[str, dict[str, int]] = defaultdict(
+            lambda: {"loads": 0, "coalesced": 0, "errors": 0}
+        )
+
+    def do(self, key: tuple, load: Callable[[], Any]) -> Any:
+        """
+        Runs `load` unless a load of `key` is already in flight on another
+        thread, in which case its result is awaited and returned.
+
+        Args:
+            key (tuple): Identifies the load, e.g. the query and deck version.
+            load (Callable[[], Any]): Loads the value; only run by the first caller.
+
+        Returns:
+            Any: The value returned by the load.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        self._incr(key, "loads" if leader else "coalesced")
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = load()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            self._incr(key, "errors")
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: tuple, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        The `do` of the async path: concurrent callers on the same event loop
+        await one load.
+
+        A waiter that is cancelled (e.g. its client disconnected) does not
+        cancel the load. If the caller running the load is cancelled, the
+        waiters start a new one.
+        """
+        flight_key = (asyncio.get_running_loop(), key)
+        while True:
+            task = self._tasks.get(flight_key)
+            if task is None:
+                task = asyncio.ensure_future(load())
+                with self._lock:
+                    self._tasks[flight_key] = task
+                task.add_done_callback(lambda done: self._finish(flight_key, key, done))
+                self._incr(key, "loads")
+                return await task
+
+            self._incr(key, "coalesced")
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if task.cancelled() and not asyncio.current_task().cancelling():
+                    continue
+                raise
+
+    def _finish(self, flight_key: tuple, key: tuple, task: asyncio.Future) -> None:
+        with self._lock:
+            if self._tasks.get(flight_key) is task:
+                del self._tasks[flight_key]
+        if not task.cancelled() and task.exception() is not None:
+            self._incr(key, "errors")
+
+    def _incr(self, key: tuple, counter: str) -> None:
+        with self._lock:
+            self._stats[key[0]][counter] += 1
+
+    def stats(self) -> dict:
+        """
+        Returns, per kind of load, the loads run, the duplicate loads
+        suppressed, the failed loads and the loads in flight.
+        """
+        with self._lock:
+            in_flight = defaultdict(int)
+            for key in self._calls:
+                in_flight[key[0]] += 1
+            for _, key in self._tasks:
+                in_flight[key[0]] += 1
+            return {
+                kind: {**counters, "in_flight": in_flight[kind]}
+                for kind, counters in self._stats.items()
+            }
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,159 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.metrics import registry
+
+REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response.",
+    ("method", "route"),
+)
+REQUESTS = registry.counter(
+    "http_requests_total", "Finished requests.", ("method", "route", "status")
+)
+REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "Requests currently being handled.", ("method",)
+)
+REQUEST_SPAN_DURATION = registry.histogram(
+    "http_request_span_seconds",
+    "Per request, the total time spent in each internal span.",
+    ("route", "span"),
+)
+SPAN_DURATION = registry.histogram(
+    "app_span_duration_seconds", "Duration of single internal spans.", ("span",)
+)
+DB_QUERY_DURATION = registry.histogram(
+    "db_query_duration_seconds",
+    "Duration of single database statements.",
+    ("statement",),
+)
+
+# Route label for requests that did not match any route, to bound cardinality.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestTimings:
+    """
+    Time spent in each span during one request.
+    """
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.spans: dict[str, float] = defaultdict(float)
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+current_request: ContextVar[RequestTimings | None] = ContextVar(
+    "current_request", default=None
+)
+
+
+def record_span(name: str, elapsed: float) -> None:
+    """
+    Records one span and adds it to the current request's totals, if any.
+    """
+    SPAN_DURATION.observe(elapsed, span=name)
+    timings = current_request.get()
+    if timings is not None:
+        timings.spans[name] += elapsed
+
+
+@contextmanager
+def span(name: str):
+    """
+    Times the enclosed block as an internal span, e.g. "serialize" or "s3_log".
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, time.perf_counter() - started)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status codes, in-flight requests and the
+    internal spans of every HTTP request.
+
+    Streaming responses are timed until their last chunk is sent.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        timings = RequestTimings(scope)
+        token = current_request.set(timings)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc(method=method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            REQUESTS_IN_FLIGHT.dec(method=method)
+            current_request.reset(token)
+
+            route = timings.route
+            REQUEST_DURATION.observe(elapsed, method=method, route=route)
+            REQUESTS.inc(method=method, route=route, status=status)
+            for name, total in timings.spans.items():
+                REQUEST_SPAN_DURATION.observe(total, route=route, span=name)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    elapsed = time.perf_counter() - started
+    DB_QUERY_DURATION.observe(elapsed, statement=statement_kind(statement))
+    record_span("db", elapsed)
+
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def statement_kind(statement: str) -> str:
+    """
+    Returns the leading keyword of a SQL statement, e.g. SELECT or INSERT.
+    """
+    keyword = statement.lstrip().split(None, 1)[:1]
+    return keyword[0].upper() if keyword else "OTHER"
+
+
+def instrument_queries() -> None:
+    """
+    Times every statement executed by any engine, including the sync engine
+    behind an AsyncEngine.
+    """
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
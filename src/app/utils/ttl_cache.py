@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire `ttl` seconds after they are stored.
+
+    Once `max_entries` is reached, storing a new entry evicts the least recently
+    used one.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def get(self, key) -> Any | None:
+        """
+        Returns the cached value for a key, or None on a miss.
+        """
+        key = self._key(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def set(self, key, value: Any, ttl: float | None = None) -> bool:
+        """
+        Stores a value for `ttl` seconds, the cache's TTL by default.
+
+        Returns:
+            bool: True if the value was stored.
+        """
+        with self._lock:
+            self._store(self._key(key), value, self.ttl if ttl is None else ttl)
+            return True
+
+    def clear(self) -> None:
+        """
+        Drops every entry, e.g. between tests.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the hit/miss counters and the current number of entries.
+        """
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["size"] = len(self._entries)
+        lookups = snapshot["hits"] + snapshot["misses"]
+        snapshot["hit_ratio"] = snapshot["hits"] / lookups if lookups else 0.0
+        return snapshot
+
+    def _store(self, key: Hashable, value: Any, ttl: float) -> None:
+        # Called with the lock held.
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    @staticmethod
+    def _key(key) -> Hashable:
+        return key
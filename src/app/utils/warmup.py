@@ -0,0 +1,87 @@
+import time
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import sessionmaker
+
+from app.crud import get_deck_json, get_deck_versions
+
+
+def warm_pool(engine: Engine, size: int) -> int:
+    """
+    Opens `size` connections at once and returns them to the pool idle, so
+    the first requests of a worker do not pay for connecting.
+
+    Returns:
+        int: The number of connections opened.
+    """
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+async def warm_async_pool(engine: AsyncEngine, size: int) -> int:
+    """
+    The `warm_pool` of the async engine; a failure is reported, not raised.
+    """
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(await engine.connect())
+    except Exception as e:
+        print(f"⚠️ Async pool warm-up failed, continuing cold: {e}")
+    finally:
+        for connection in connections:
+            await connection.close()
+    return len(connections)
+
+
+def warm_decks(session_factory: sessionmaker) -> int:
+    """
+    Loads every category deck and the deck of all cards into the deck cache.
+
+    Returns:
+        int: The number of decks loaded.
+    """
+    with session_factory() as db:
+        versions = get_deck_versions(db)
+        for category, version in versions.items():
+            get_deck_json(db=db, category=category, version=version)
+        get_deck_json(db=db, version=sum(versions.values()))
+    return len(versions) + 1
+
+
+def warm_up(engine: Engine, session_factory: sessionmaker, pool_size: int) -> dict:
+    """
+    Prepares a worker process before it accepts requests: fills its
+    connection pool and its deck cache.
+
+    Called from the application startup hook when WARMUP_ON_STARTUP is set.
+    A failure is reported and leaves the worker to warm up lazily.
+
+    Args:
+        engine (Engine): The engine whose pool is filled.
+        session_factory (sessionmaker): Makes the session the decks are read with.
+        pool_size (int): The number of connections to open.
+
+    Returns:
+        dict: The connections opened, decks loaded and seconds spent.
+    """
+    started = time.perf_counter()
+    result = {"connections": 0, "decks": 0}
+    try:
+        result["connections"] = warm_pool(engine, pool_size)
+        result["decks"] = warm_decks(session_factory)
+    except Exception as e:
+        print(f"⚠️ Warm-up failed, continuing cold: {e}")
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    print(
+        f"🔥 Warmed up {result['connections']} connections "
+        f"and {result['decks']} decks in {result['seconds']}s"
+    )
+    return result
@@ -18,6 +18,7 @@ if [ -f frontend/flip-cards-learner/frontend.pid ]; then
 fi
 
 # Also kill any other relevant processes that might be running
+pkill -f "python -m app.server" && echo "Additional backend processes stopped" || true
 pkill -f "python -m src.app.main" && echo "Additional backend processes stopped" || true
 pkill -f "node.*serve -s dist" && echo "Additional frontend processes stopped" || true
 